@@ -3,6 +3,8 @@ from djoser.serializers import UserCreateSerializer as BaseUserCreateSerializer
 from djoser.serializers import UserSerializer as BaseUserSerializer
 from rest_framework import serializers
 
+from events.fieldsets import SparseFieldsetsMixin
+
 from .models import Organization, Profile
 
 User = get_user_model()
@@ -55,17 +57,36 @@ class UserSerializer(BaseUserSerializer):
         fields = ("id", "username", "email", "first_name", "last_name", "role")
 
 
+def active_event_count(organization):
+    """The active events of ``organization``, archived ones included."""
+    from events.archive import archive_boundary
+    from events.models import ArchivedEvent, Event
+
+    count = Event.objects.filter(organization=organization, status="Active").count()
+    if archive_boundary(organization) is not None:
+        count += ArchivedEvent.objects.filter(
+            organization=organization, status="Active"
+        ).count()
+    return count
+
+
 class ProfileSerializer(serializers.ModelSerializer):
     user_id = serializers.IntegerField(read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
     email = serializers.EmailField(source="user.email", read_only=True)
     first_name = serializers.CharField(source="user.first_name", read_only=True)
     last_name = serializers.CharField(source="user.last_name", read_only=True)
-    participating_events = serializers.PrimaryKeyRelatedField(
-        many=True,
-        read_only=True,
-        source="user.participating_events",
-    )
+    participating_events = serializers.SerializerMethodField()
+
+    def get_participating_events(self, obj):
+        """Ids of the events the user takes part in, archived ones included."""
+        from events.models import ArchivedEvent
+
+        rows = list(obj.user.participating_events.values_list("date", "id"))
+        rows += ArchivedEvent.objects.filter(
+            memberships__user=obj.user, memberships__relation="participants"
+        ).values_list("date", "id")
+        return [pk for _, pk in sorted(rows)]
 
     class Meta:
         model = Profile
@@ -93,7 +114,7 @@ class ProfileSerializer(serializers.ModelSerializer):
         ]
 
 
-class PublicOrganizationSerializer(serializers.ModelSerializer):
+class PublicOrganizationSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """Public serializer for organization profiles - safe fields only"""
 
     owner_name = serializers.SerializerMethodField()
@@ -106,9 +127,7 @@ class PublicOrganizationSerializer(serializers.ModelSerializer):
 
     def get_event_count(self, obj):
         """Count all active events for this organization."""
-        from events.models import Event
-
-        return Event.objects.filter(organization=obj, status="Active").count()
+        return active_event_count(obj)
 
     def get_is_following(self, obj):
         """Check if the current user is following this organization"""
@@ -170,7 +189,7 @@ class CollaboratorOrganizationSerializer(PublicOrganizationSerializer):
         ]
 
 
-class OrganizationSerializer(serializers.ModelSerializer):
+class OrganizationSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """Full serializer for organization owners - includes sensitive fields"""
 
     owner_id = serializers.IntegerField(read_only=True)
@@ -186,9 +205,7 @@ class OrganizationSerializer(serializers.ModelSerializer):
 
     def get_event_count(self, obj):
         """Count all active events for this organization."""
-        from events.models import Event
-
-        return Event.objects.filter(organization=obj, status="Active").count()
+        return active_event_count(obj)
 
     def get_collaborators(self, obj):
         """Return list of collaborator usernames"""
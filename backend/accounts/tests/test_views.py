@@ -279,6 +279,30 @@ class OrganizationViewSetTests(APITestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["name"], "Test Organization")
 
+    def test_list_organizations_conditional_get(self):
+        """Test that an unchanged organization list answers 304"""
+        url = reverse("organizations-list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.organization.description = "Changed"
+        self.organization.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_organizations_etag_follows_following(self):
+        """Test that following an organization changes the list ETag"""
+        self.client.force_authenticate(user=self.other_user)
+        url = reverse("organizations-list")
+        etag = self.client.get(url)["ETag"]
+
+        self.organization.followers.add(self.other_user)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data[0]["is_following"])
+
     def test_retrieve_organization_public_access(self):
         """Test that anyone can view organization details (public access)"""
         url = reverse("organizations-detail", kwargs={"pk": self.organization.id})
@@ -1,11 +1,19 @@
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework.decorators import action
 from rest_framework.mixins import CreateModelMixin, RetrieveModelMixin, UpdateModelMixin
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
-from events.models import Event
-from events.serializers import EventSerializer
+from events.archive import reaches_archive
+from events.cache import cached_list_response, get_organization_list_version
+from events.filters import parse_event_filters
+from events.models import ArchivedEvent, Event
+from events.pagination import EventKeysetPagination, merge_events
+from events.queries import with_archive_annotations, with_list_annotations
+from events.serializers import EventListSerializer, event_fields
 
 from .models import Organization, Profile
 from .permissions import IsOrganizerOrReadOnly
@@ -50,6 +58,13 @@ class ProfileViewSet(
         return Response(serializer.data)
 
 
+def organization_list_etag(request, *args, **kwargs):
+    # Per user, because the list carries is_following
+    user_id = request.user.pk if request.user.is_authenticated else 0
+    return f"{get_organization_list_version()}-{user_id}"
+
+
+@method_decorator(condition(etag_func=organization_list_etag), name="list")
 class OrganizationViewSet(ModelViewSet):
     """ViewSet for organizations with public read access and restricted write"""
 
@@ -111,7 +126,9 @@ class OrganizationViewSet(ModelViewSet):
 
     def get_queryset(self):
         """All organizations are publicly viewable"""
-        return Organization.objects.all().select_related("owner")
+        # The archive boundary tells the events page and event_count whether
+        # they have to read the archive
+        return Organization.objects.all().select_related("owner", "archive_boundary")
 
     def perform_create(self, serializer):
         """Set owner when creating organization"""
@@ -158,6 +175,15 @@ class OrganizationViewSet(ModelViewSet):
         """
         organization = self.get_object()
 
+        # Anonymous visitors get a cached copy, retired by any change to the
+        # organization or its events
+        return cached_list_response(
+            request,
+            lambda: self._organization_events(request, organization),
+            organization_id=organization.pk,
+        )
+
+    def _organization_events(self, request, organization):
         # Check if user is owner or collaborator
         is_owner_or_collaborator = False
         if request.user.is_authenticated:
@@ -178,7 +204,38 @@ class OrganizationViewSet(ModelViewSet):
                 organization=organization, status="Active"
             ).order_by("date")
 
-        serializer = EventSerializer(events, many=True, context={"request": request})
+        filters = parse_event_filters(request.query_params)
+        fields = event_fields(request, EventListSerializer)
+        events = with_list_annotations(
+            filters.apply(events), request.user, fields=fields
+        )
+        querysets = [events]
+
+        # Old events live in the archive; read it only if the range goes back
+        # that far
+        start, _ = filters.date_range(timezone.now())
+        if reaches_archive(start, organization):
+            archived = ArchivedEvent.objects.filter(organization=organization)
+            if not is_owner_or_collaborator:
+                archived = archived.filter(status="Active")
+            archived = with_archive_annotations(
+                filters.apply(archived), request.user, fields=fields
+            )
+            querysets = [events.order_by("date", "id"), archived.order_by("date", "id")]
+            events = merge_events(querysets)
+
+        # Opt-in keyset pagination, same as the other event lists
+        paginator = EventKeysetPagination()
+        page = paginator.paginate_querysets(querysets, request, view=self)
+        if page is not None:
+            serializer = EventListSerializer(
+                page, many=True, context={"request": request}
+            )
+            return paginator.get_paginated_response(serializer.data)
+
+        serializer = EventListSerializer(
+            events, many=True, context={"request": request}
+        )
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
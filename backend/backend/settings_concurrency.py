@@ -0,0 +1,11 @@
+"""
+Settings for the concurrency tests: pytest --ds=backend.settings_concurrency
+
+They need real SQLite locking, which the shared-cache in-memory test
+database does not provide, so their test database is a file.
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR, DATABASES
+
+DATABASES["default"]["TEST"] = {"NAME": BASE_DIR / "test_db.sqlite3"}
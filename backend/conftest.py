@@ -0,0 +1,20 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+
+@pytest.fixture(autouse=True, scope="session")
+def eager_outbox():
+    """Deliver outbox entries inside the request, as tests expect to see the
+    side effects of a write right away. Tests of deferred delivery override
+    this back."""
+    with override_settings(EVENTS_OUTBOX_EAGER=True):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Test transactions roll back without firing the signals that retire
+    cached responses, so start every test from an empty cache."""
+    cache.clear()
+    yield
@@ -0,0 +1,159 @@
+"""
+Archival of old events into a cold partition.
+
+archive_events() moves events dated before a horizon, with their participant
+and interest rows, into ArchivedEvent and ArchivedMembership, one batch per
+transaction. The hot rows then go through a normal delete, so their cards,
+search index entries and cached lists are handled as for any other deleted
+event. They get no delta sync tombstone, though: the event still exists, and
+clients that synced it keep it.
+
+Lists that can reach that far back ask reaches_archive() whether their
+dates start at or before archive_boundary(), the date of the newest
+archived event. Only then do they read the archive and merge it in. The
+boundary is kept per organization, in ArchiveBoundary rows written by the
+same transaction that moves the events.
+
+The past events list and the organization events page merge in the
+archive that way. The registered and interested lists, the profile's
+participating_events and the organizations' event_count add the archived
+rows of the user or organization, and the event detail endpoint falls back
+to the archive for reads. The calendar, search and delta sync see hot events
+only.
+"""
+
+from contextvars import ContextVar
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework.response import Response
+
+from .models import ArchiveBoundary, ArchivedEvent, ArchivedMembership, Event
+from .pagination import merge_events
+
+# ArchivedMembership.relation -> the through table it is copied from
+RELATIONS = {
+    "participants": Event.participants.through,
+    "interested_users": Event.interested_users.through,
+}
+
+# Set while _archive_batch deletes the events it has copied
+_archiving = ContextVar("archiving", default=False)
+
+
+def is_archiving():
+    """Whether the events being deleted are moving to the archive."""
+    return _archiving.get()
+
+
+def archive_horizon():
+    """How old an event gets before it is archived."""
+    return timedelta(days=getattr(settings, "EVENTS_ARCHIVE_AFTER_DAYS", 365))
+
+
+def archive_boundary(organization=None):
+    """
+    The date of the newest archived event, of ``organization`` or of any,
+    or None if there is none. For an organization fetched with
+    select_related("archive_boundary") this costs no query.
+    """
+    if organization is None:
+        return ArchiveBoundary.objects.aggregate(latest=Max("date"))["latest"]
+    try:
+        return organization.archive_boundary.date
+    except ArchiveBoundary.DoesNotExist:
+        return None
+
+
+def reaches_archive(start, organization=None):
+    """
+    Whether a list of events dated from ``start`` on, of ``organization`` or
+    of any, needs the archive.
+    """
+    boundary = archive_boundary(organization)
+    return boundary is not None and (start is None or start <= boundary)
+
+
+def archive_events(before=None, batch_size=500):
+    """
+    Move the events dated before ``before`` (by default, the horizon ago)
+    into the archive, ``batch_size`` per transaction, oldest first.
+    Returns the number of events moved.
+    """
+    if before is None:
+        before = timezone.now() - archive_horizon()
+    moved = 0
+    while True:
+        with transaction.atomic():
+            count = _archive_batch(before, batch_size)
+        if not count:
+            return moved
+        moved += count
+
+
+def _archive_batch(before, batch_size):
+    rows = Event.objects.filter(date__lt=before).order_by("date", "id")[:batch_size]
+    events = [
+        ArchivedEvent(**dict(zip(ArchivedEvent.COPIED_FIELDS, row)))
+        for row in rows.values_list(*ArchivedEvent.COPIED_FIELDS)
+    ]
+    if not events:
+        return 0
+    ids = [event.id for event in events]
+
+    # Raise the boundaries in the same transaction, so that readers start
+    # merging in the archive as soon as the events are gone from the hot table
+    latest = {}
+    for event in events:  # in date order, so the newest of each wins
+        latest[event.organization_id] = event.date
+    for organization_id, date in latest.items():
+        boundary, created = ArchiveBoundary.objects.get_or_create(
+            organization_id=organization_id, defaults={"date": date}
+        )
+        if not created and boundary.date < date:
+            ArchiveBoundary.objects.filter(pk=organization_id).update(date=date)
+
+    ArchivedEvent.objects.bulk_create(events)
+    for relation, through in RELATIONS.items():
+        members = through.objects.filter(event_id__in=ids).values_list(
+            "event_id", "user_id"
+        )
+        ArchivedMembership.objects.bulk_create(
+            ArchivedMembership(event_id=event_id, user_id=user_id, relation=relation)
+            for event_id, user_id in members
+        )
+    token = _archiving.set(True)
+    try:
+        Event.objects.filter(pk__in=ids).delete()
+    finally:
+        _archiving.reset(token)
+    return len(events)
+
+
+class ArchiveListMixin:
+    """
+    Add archived events to a ListAPIView when the dates it lists reach the
+    archive. The view returns them from get_archive_queryset(), ordered the
+    way its pagination class walks events, or None when none can match.
+    """
+
+    def get_archive_queryset(self):
+        return None
+
+    def list(self, request, *args, **kwargs):
+        archived = self.get_archive_queryset()
+        if archived is None:
+            return super().list(request, *args, **kwargs)
+
+        querysets = [self.filter_queryset(self.get_queryset()), archived]
+        paginator = self.paginator
+        if paginator is not None:
+            page = paginator.paginate_querysets(querysets, request, view=self)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+        events = list(merge_events(querysets, self.pagination_class.descending))
+        return Response(self.get_serializer(events, many=True).data)
@@ -0,0 +1,385 @@
+"""
+Response cache for anonymous event lists.
+
+Entries are keyed by a version number plus the normalized request, and are
+never deleted: a change to an event bumps the global version, which keys the
+event lists, and the version of the event's organization, which keys that
+organization's page. Every key built before the change simply stops being
+looked up. Versions start from the current time in
+nanoseconds, so a version that is evicted and recreated cannot collide with
+keys written before the eviction.
+
+Registrations and interest only move counters, so invalidate_events() leaves
+the global version alone. It bumps the counts version, which only the list
+responses and their ETags are keyed by, plus the versions of the events'
+organizations and of the events themselves, which key their fragments.
+Search results and facets do not depend on the counters and survive.
+
+Lists filtered against "now" also change as time passes, without any write.
+Entries therefore expire no later than the next event start and the next
+midnight, whichever comes first.
+
+The same versions double as cheap ETag validators for conditional GETs, so
+a 304 is answered without running the list query or the serializer.
+
+Search results are kept as id lists in a per-process LRU (SearchResultCache),
+keyed by the same global version, so the keystrokes of a search box and
+popular searches run their full-text query once.
+
+The public variants of the lists skip authentication altogether, so their
+responses are also marked cacheable by shared caches, up to the same
+deadline.
+
+Versions live in the default cache, which every worker process must share
+(settings.CACHES, from REDIS_URL); ``manage.py check --deploy`` warns when
+it is per process.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+LIST_TIMEOUT = 300
+FACETS_TIMEOUT = 60
+FRAGMENT_TIMEOUT = 3600
+KEY_PREFIX = "events:lists"
+STATS_KEYS = {"hits": f"{KEY_PREFIX}:hits", "misses": f"{KEY_PREFIX}:misses"}
+ORGANIZATION_LIST_VERSION_KEY = "organizations:list:version"
+COUNTS_VERSION_KEY = f"{KEY_PREFIX}:version:counts"
+
+
+def _version_key(organization_id=None):
+    if organization_id is None:
+        return f"{KEY_PREFIX}:version"
+    return f"{KEY_PREFIX}:version:org:{organization_id}"
+
+
+def _event_version_key(event_id):
+    return f"{KEY_PREFIX}:version:event:{event_id}"
+
+
+def get_version(organization_id=None):
+    return cache.get_or_set(_version_key(organization_id), time.time_ns, None)
+
+
+def get_counts_version():
+    return cache.get_or_set(COUNTS_VERSION_KEY, time.time_ns, None)
+
+
+def _bump(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+def invalidate_event_lists(organization_ids=()):
+    """
+    Retire every cached list, plus the pages of the given organizations.
+
+    The versions are bumped right away and again once the surrounding
+    transaction commits, so a list read and cached by another request
+    before the commit is not served afterwards.
+    """
+    keys = [_version_key()] + [_version_key(pk) for pk in set(organization_ids)]
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+
+def get_organization_list_version():
+    return cache.get_or_set(ORGANIZATION_LIST_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_organization_list():
+    """Retire ETags of the organization list (names, owners, event counts)."""
+    keys = [ORGANIZATION_LIST_VERSION_KEY]
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+
+def invalidate_events(event_ids, organization_ids=None):
+    """
+    Retire what shows the counters of the events ``event_ids``: the event
+    lists, the pages of their organizations (looked up unless given) and
+    their fragments. Unlike invalidate_event_lists(), search results and
+    facets are kept.
+    """
+    from .models import Event
+
+    event_ids = set(event_ids)
+    if organization_ids is None:
+        organization_ids = Event.objects.filter(pk__in=event_ids).values_list(
+            "organization_id", flat=True
+        )
+    keys = (
+        [COUNTS_VERSION_KEY]
+        + [_version_key(pk) for pk in set(organization_ids)]
+        + [_event_version_key(pk) for pk in event_ids]
+    )
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+
+def _list_key(request, organization_id=None, counts=True):
+    params = sorted(
+        (name, sorted(values)) for name, values in request.query_params.lists()
+    )
+    digest = hashlib.sha1(
+        repr((request.get_host(), request.path, params)).encode()
+    ).hexdigest()
+    version = get_version(organization_id)
+    if counts and organization_id is None:
+        # Organization versions move with their counters already
+        version = f"{version}.{get_counts_version()}"
+    return f"{KEY_PREFIX}:{version}:{digest}"
+
+
+def _next_change(now):
+    """When lists filtered against ``now`` next change without any write."""
+    from .models import EventCard
+
+    midnight = (now + timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    # Cards carry every event's date, so card-served lists stay off events_event
+    next_start = (
+        EventCard.objects.filter(date__gt=now)
+        .order_by("date")
+        .values_list("date", flat=True)
+        .first()
+    )
+    return midnight if next_start is None else min(midnight, next_start)
+
+
+def _seconds_until_next_change():
+    now = timezone.now()
+    deadline = min(now + timedelta(seconds=LIST_TIMEOUT), _next_change(now))
+    return int((deadline - now).total_seconds())
+
+
+def event_list_etag(request, *args, **kwargs):
+    """
+    ETag for the event lists, for django.views.decorators.http.condition.
+
+    Lists embed per-user flags, so the user is part of the tag; the next
+    time-driven change is too, so a tag stops matching once an event starts.
+    """
+    user_id = request.user.pk if request.user.is_authenticated else 0
+    changes_at = _next_change(timezone.now()).timestamp()
+    versions = f"{get_version()}.{get_counts_version()}"
+    return f"{versions}-{user_id}-{changes_at:.0f}"
+
+
+def event_fragments(ids, build):
+    """
+    Serialized public fields of the events ``ids``, as ``{id: data}``.
+
+    Fragments are cached per event under the global version and the event's
+    own version, so a change to an event retires them like the lists, and a
+    counter change only those of its events. ``build(missing_ids)`` returns
+    the fragments of the misses; ids it leaves out do not exist.
+    """
+    version = get_version()
+    stamps = cache.get_many([_event_version_key(pk) for pk in ids])
+    keys = {}
+    for pk in ids:
+        stamp = stamps.get(_event_version_key(pk))
+        if stamp is None:
+            stamp = cache.get_or_set(_event_version_key(pk), time.time_ns, None)
+        keys[pk] = f"{KEY_PREFIX}:fragment:{version}:{pk}:{stamp}"
+    found = cache.get_many(keys.values())
+    fragments = {pk: found[key] for pk, key in keys.items() if key in found}
+    missing = [pk for pk in ids if pk not in fragments]
+    if missing:
+        built = build(missing)
+        cache.set_many({keys[pk]: data for pk, data in built.items()}, FRAGMENT_TIMEOUT)
+        fragments.update(built)
+    return fragments
+
+
+def _record(outcome):
+    key = STATS_KEYS[outcome]
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def get_stats():
+    hits = cache.get(STATS_KEYS["hits"], 0)
+    misses = cache.get(STATS_KEYS["misses"], 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else None,
+    }
+
+
+def cached_list_response(request, build, organization_id=None):
+    """
+    Serve ``build()`` (a view returning a Response) from the cache for
+    anonymous requests. Authenticated responses carry per-user fields and
+    are never cached. Sets ``X-Cache: HIT`` or ``MISS`` on anonymous
+    responses.
+    """
+    if request.user.is_authenticated:
+        return build()
+
+    # The key embeds the versions read *before* the list is built, so a
+    # write that lands mid-request retires the entry being written.
+    key = _list_key(request, organization_id)
+    data = cache.get(key)
+    if data is not None:
+        _record("hits")
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
+
+    _record("misses")
+    response = build()
+    if response.status_code == 200:
+        timeout = _seconds_until_next_change()
+        if timeout > 0:
+            cache.set(key, response.data, timeout)
+    response["X-Cache"] = "MISS"
+    return response
+
+
+def cached_facets(request, build):
+    """
+    ``build()``, cached for up to FACETS_TIMEOUT seconds. Facet counts do not
+    depend on the user, so every request shares the entry; the list version
+    in the key retires it on any event change. Counter changes leave it be.
+    """
+    key = _list_key(request, counts=False)
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        timeout = min(FACETS_TIMEOUT, _seconds_until_next_change())
+        if timeout > 0:
+            cache.set(key, data, timeout)
+    return data
+
+
+class _Flight:
+    """A query in progress that identical misses wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.failed = False
+        self.result = None
+
+
+class SearchResultCache:
+    """
+    Per-process LRU of search result ids, keyed by the normalized filters
+    and the global version, so any event change retires every entry.
+
+    Identical misses are coalesced: the first request runs the query while
+    the others wait for its result (single-flight). Results longer than
+    ``max_ids`` are not kept and come back as None, so callers fall back to
+    querying directly.
+    """
+
+    def __init__(self, maxsize=256, max_ids=1000):
+        self.maxsize = maxsize
+        self.max_ids = max_ids
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def get(self, filters, compute):
+        """The ids ``compute(limit)`` returns for ``filters``, cached."""
+        key = (get_version(), filters)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if not flight.failed:
+                return flight.result
+            return self._fit(compute(self.max_ids + 1))
+
+        try:
+            flight.result = self._fit(compute(self.max_ids + 1))
+            if flight.result is not None:
+                self._store(key, flight.result)
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _fit(self, ids):
+        ids = list(ids)
+        return None if len(ids) > self.max_ids else ids
+
+    def _store(self, key, ids):
+        # Upcoming results change as events start, without any write
+        timeout = _seconds_until_next_change()
+        if timeout <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+search_results = SearchResultCache()
+
+
+class AnonymousListCacheMixin:
+    """Cache a ListAPIView's anonymous responses; see cached_list_response."""
+
+    def list(self, request, *args, **kwargs):
+        return cached_list_response(
+            request,
+            lambda: super(AnonymousListCacheMixin, self).list(request, *args, **kwargs),
+        )
+
+
+class PublicListMixin:
+    """
+    Serve a list view without authenticating the request, so every client
+    gets the same response, and let shared caches store it. They revalidate
+    it on every request (no-cache), which the list ETag answers cheaply, so
+    no cache serves a list older than the last write. Per-user state is
+    served separately.
+    """
+
+    authentication_classes: list[type[BaseAuthentication]] = []
+    permission_classes = [AllowAny]
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_cache_control(response, public=True, no_cache=True)
+        return response
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+PER_PROCESS_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """The event list cache versions must be shared by every worker."""
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend != PER_PROCESS_BACKEND:
+        return []
+    return [
+        Warning(
+            "The default cache is not shared between processes, so each worker "
+            "keeps its own event list versions and can serve lists that "
+            "another worker has changed.",
+            hint="Set REDIS_URL, or run a single worker process.",
+            id="events.W001",
+        )
+    ]
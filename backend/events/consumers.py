@@ -0,0 +1,61 @@
+"""Outbox consumers of the events app; see events.outbox."""
+
+from accounts.models import Organization
+
+from . import outbox
+from .cache import invalidate_event_lists
+from .models import Event, EventCard
+from .search import get_search_backend
+
+
+def _renamed(entries):
+    return {
+        e.payload["id"]
+        for e in entries
+        if e.topic == outbox.ORGANIZATION_SAVED and not e.payload["created"]
+    }
+
+
+@outbox.consumer(
+    "search-index",
+    topics=[outbox.EVENT_SAVED, outbox.EVENT_DELETED, outbox.ORGANIZATION_SAVED],
+)
+def update_search_index(entries):
+    """
+    Keep the full-text index in step with events and with organization
+    names, which are part of every event's search document.
+    """
+    removed = {e.payload["id"] for e in entries if e.topic == outbox.EVENT_DELETED}
+    changed = {e.payload["id"] for e in entries if e.topic == outbox.EVENT_SAVED}
+    renamed = _renamed(entries)
+    if renamed:
+        changed.update(
+            Event.objects.filter(organization_id__in=renamed).values_list(
+                "pk", flat=True
+            )
+        )
+    backend = get_search_backend()
+    backend.remove(removed)
+    backend.index(changed - removed)
+    # Search results cached while the index lagged behind are stale now
+    invalidate_event_lists()
+
+
+@outbox.consumer("organization-cards", topics=[outbox.ORGANIZATION_SAVED])
+def rename_organization_cards(entries):
+    """
+    Write the new name of renamed organizations onto the cards of all their
+    events, and move those events forward for delta sync. Only cards that
+    still show another name are written, so a batch can be delivered again.
+    """
+    renamed = _renamed(entries)
+    names = dict(Organization.objects.filter(pk__in=renamed).values_list("pk", "name"))
+    for organization_id, name in names.items():
+        stale = EventCard.objects.filter(organization_id=organization_id).exclude(
+            organization_name=name
+        )
+        Event.touch(list(stale.values_list("event_id", flat=True)))
+        stale.update(organization_name=name)
+    if names:
+        # Anonymous lists cached since the rename read the old cards
+        invalidate_event_lists(list(names))
@@ -0,0 +1,173 @@
+"""
+Serializer-free rendering of the read-only event lists.
+
+EventListSerializer builds a model instance and runs a dozen fields for
+every row. For the upcoming and past lists the same output is produced
+from a single ``.values_list()`` query instead, and rendered with orjson
+when it is installed. The result must stay byte-for-byte identical to the
+serializer path; events/tests/test_fastpath.py holds that contract.
+"""
+
+from operator import itemgetter
+
+from django.utils import timezone
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from .serializers import EventListSerializer, event_fields
+
+try:
+    import orjson
+
+    # Leave datetimes and dataclasses to DRF's encoder, which formats them
+    # differently from orjson
+    OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+except ImportError:  # pragma: no cover - falls back to the stock renderer
+    orjson = None  # type: ignore[assignment]
+
+# Output field -> the column it is read from
+COLUMNS = {
+    "id": "id",
+    "name": "name",
+    "date": "date",
+    "location": "location",
+    "description": "description",
+    "capacity": "capacity",
+    "category": "category",
+    "organizer": "organizer_id",
+    "organizer_name": "organizer__username",
+    "created_by": "organizer__username",
+    "organization": "organization_id",
+    "organization_id": "organization_id",
+    "organization_name": "organization__name",
+    "status": "status",
+    "participant_count": "participant_count",
+    "interest_count": "interest_count",
+    "series": "series_id",
+}
+
+# The same, read from EventCard, which also stores is_full
+CARD_COLUMNS = {
+    **COLUMNS,
+    "id": "event_id",
+    "organizer_name": "organizer_name",
+    "created_by": "organizer_name",
+    "organization_name": "organization_name",
+    "is_full": "is_full",
+}
+
+FLAGS = {
+    "is_participating": "user_is_participating",
+    "is_interested": "user_is_interested",
+}
+
+
+def _format_date(value, tz):
+    """DateTimeField.to_representation, for aware datetimes."""
+    value = value.astimezone(tz).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def event_list_rows(queryset, fields=None, columns=COLUMNS):
+    """
+    The EventListSerializer output for ``queryset`` (as returned by
+    with_list_annotations), read with ``.values_list()``. ``fields``
+    restricts the output like the serializer's sparse fieldsets. Pass an
+    EventCard queryset with ``columns=CARD_COLUMNS`` to read the cards.
+    """
+    names = [
+        name
+        for name in EventListSerializer.Meta.fields
+        if fields is None or name in fields
+    ]
+    if not names:
+        return [{} for _ in queryset.values_list("pk")]
+    annotations = queryset.query.annotations
+    selected = []
+
+    def position(column):
+        if column not in selected:
+            selected.append(column)
+        return selected.index(column)
+
+    # Every output name reads one column; computed fields then overwrite the
+    # raw value in place, which keeps the serializer's key order
+    positions = []
+    for name in names:
+        if name in FLAGS:
+            column = FLAGS[name] if FLAGS[name] in annotations else "pk"
+        else:
+            column = columns.get(name, "capacity")
+        positions.append(position(column))
+    capacity = position("capacity")
+    participant_count = position("participant_count")
+    flags = [(name, FLAGS[name] in annotations) for name in names if name in FLAGS]
+    has_date = "date" in names
+    has_is_full = "is_full" in names and "is_full" not in columns
+    # A one-item itemgetter returns the item rather than a tuple
+    pick = itemgetter(*positions, positions[0])
+    tz = timezone.get_current_timezone()
+
+    rows = []
+    for values in queryset.values_list(*selected):
+        row = dict(zip(names, pick(values)))
+        if has_date:
+            row["date"] = _format_date(row["date"], tz)
+        for name, annotated in flags:
+            row[name] = bool(row[name]) if annotated else False
+        if has_is_full:
+            limit = values[capacity]
+            row["is_full"] = bool(limit) and values[participant_count] >= limit
+        rows.append(row)
+    return rows
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer output, encoded with orjson when possible."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default, option=OPTIONS)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escaping as JSONRenderer, for embedding in <script> tags
+        return ret.replace("\u2028".encode(), b"\\u2028").replace(
+            "\u2029".encode(), b"\\u2029"
+        )
+
+
+class ValuesListMixin:
+    """
+    List a view's events through event_list_rows. Paginated requests keep the
+    serializer path, since the paginator works on model instances.
+
+    Anonymous requests read the EventCard rows from get_card_queryset()
+    instead, when the view returns one: no joins and no per-user flags.
+    """
+
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        fields = event_fields(request, self.get_serializer_class())
+        if not request.user.is_authenticated:
+            cards = self.get_card_queryset()
+            if cards is not None:
+                return Response(event_list_rows(cards, fields, CARD_COLUMNS))
+        return Response(event_list_rows(queryset, fields))
+
+    def get_card_queryset(self):
+        """The EventCard rows of this list, or None to read the events."""
+        return None
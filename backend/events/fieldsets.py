@@ -0,0 +1,54 @@
+"""
+Sparse fieldsets for read endpoints.
+
+``?fields=id,name,date`` keeps only the listed fields and ``?omit=a,b``
+drops the listed ones; both may be combined and unknown names are ignored.
+Serializers opt in with SparseFieldsetsMixin, and views hand the same
+selection to the queryset builders so omitted fields skip their joins,
+subqueries and prefetches too.
+"""
+
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = "fields"
+OMIT_PARAM = "omit"
+
+
+def _names(request, param):
+    value = request.query_params.get(param, "")
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def selected_fields(request, available, any_method=False):
+    """
+    The names in ``available`` that ``request`` asks for, or None when it
+    does not restrict the fields (so callers can keep their default path).
+    Only reads are shaped; writes always see every field, unless
+    ``any_method`` marks the request as a read sent with another method.
+    """
+    if request is None:
+        return None
+    if not any_method and request.method not in SAFE_METHODS:
+        return None
+    keep = _names(request, FIELDS_PARAM)
+    omit = _names(request, OMIT_PARAM)
+    if not keep and not omit:
+        return None
+    selected = set(available) & keep if keep else set(available)
+    return selected - omit
+
+
+class SparseFieldsetsMixin:
+    """Drop the serializer fields the request did not ask for."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or not hasattr(request, "query_params"):
+            return
+        selected = selected_fields(request, self.fields)
+        if selected is None:
+            return
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
@@ -0,0 +1,151 @@
+"""
+Query-parameter filters shared by the event lists.
+
+parse_event_filters() validates ``category``, ``date_filter``, ``date_from``
+and ``date_to`` once, raising a 400 that names each bad parameter, and
+returns an EventFilters value. Every date bound becomes a half-open
+``[start, end)`` range of aware datetimes. A ``date_to`` day includes the
+whole of that day.
+
+EventFilters.apply() emits only a category IN and a range on ``date``,
+next to the status and organization predicates of the list views. These
+are the leading columns of the (status, date, id) and
+(organization, status, date) indexes, so lists seek on them instead of
+scanning.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+DATE_FILTERS = ("today", "tomorrow", "this_week")
+
+
+def parse_moment(value, name):
+    """Parse an ISO date or datetime; naive values use the current timezone."""
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValidationError({name: ["Expected an ISO date or datetime."]})
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def _start_of_day(moment):
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def date_filter_range(date_filter, now):
+    """
+    The ``[start, end)`` a ``date_filter`` selects. None selects every event
+    from ``now`` on, and has no end.
+    """
+    today = _start_of_day(now)
+    if date_filter == "today":
+        # Today's events that have not started yet
+        return now, _start_of_day(now + timedelta(days=1))
+    if date_filter == "tomorrow":
+        tomorrow = _start_of_day(now + timedelta(days=1))
+        return tomorrow, _start_of_day(now + timedelta(days=2))
+    if date_filter == "this_week":
+        # From the start of today up to the end of Sunday
+        days_until_monday = 7 - now.weekday()
+        return today, _start_of_day(now + timedelta(days=days_until_monday))
+    return now, None
+
+
+def _intersect(first, second):
+    (start, end), (other_start, other_end) = first, second
+    if other_start is not None and (start is None or other_start > start):
+        start = other_start
+    if other_end is not None and (end is None or other_end < end):
+        end = other_end
+    return start, end
+
+
+@dataclass(frozen=True)
+class EventFilters:
+    categories: tuple = ()
+    date_filter: str | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+
+    def date_range(self, now, upcoming=False):
+        """
+        The ``[start, end)`` to list: the date_from/date_to range, narrowed
+        by the date filter. Upcoming lists default to events from ``now`` on.
+        """
+        if self.date_filter or upcoming:
+            return _intersect(
+                (self.start, self.end), date_filter_range(self.date_filter, now)
+            )
+        return self.start, self.end
+
+    def apply(self, queryset, now=None, upcoming=False):
+        """Filter an Event or EventCard queryset."""
+        start, end = self.date_range(now or timezone.now(), upcoming)
+        if start is not None:
+            queryset = queryset.filter(date__gte=start)
+        if end is not None:
+            queryset = queryset.filter(date__lt=end)
+        if self.categories:
+            queryset = queryset.filter(category__in=self.categories)
+        return queryset
+
+
+def parse_event_filters(params):
+    """Validate the filter parameters of a request into an EventFilters."""
+    from .models import Event
+
+    errors = {}
+
+    categories = tuple(sorted(set(params.getlist("category", []))))
+    valid = {value for value, _ in Event.CATEGORY_CHOICES}
+    unknown = [category for category in categories if category not in valid]
+    if unknown:
+        errors["category"] = [f"Unknown category: {', '.join(unknown)}."]
+
+    date_filter = params.get("date_filter") or None
+    if date_filter is not None and date_filter not in DATE_FILTERS:
+        errors["date_filter"] = [f"Expected one of: {', '.join(DATE_FILTERS)}."]
+
+    start = end = None
+    for name in ("date_from", "date_to"):
+        value = params.get(name)
+        if not value:
+            continue
+        try:
+            moment = parse_moment(value, name)
+        except ValidationError as error:
+            errors.update(error.detail)
+            continue
+        if name == "date_from":
+            start = moment
+        elif parse_date(value) is not None:
+            # A bare day includes all of that day. parse_datetime() accepts
+            # one too on Python 3.11+, so it cannot tell the two apart.
+            end = moment + timedelta(days=1)
+        else:
+            end = moment
+    if start is not None and end is not None and start >= end:
+        errors["date_to"] = ["Must be after date_from."]
+
+    if errors:
+        raise ValidationError(errors)
+    return EventFilters(categories, date_filter, start, end)
+
+
+class EventFilterMixin:
+    """Give a list view the EventFilters of its request, parsed once."""
+
+    @property
+    def event_filters(self):
+        if not hasattr(self, "_event_filters"):
+            self._event_filters = parse_event_filters(self.request.query_params)
+        return self._event_filters
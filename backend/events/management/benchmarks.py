@@ -0,0 +1,164 @@
+"""
+Helpers for the event performance benchmarks.
+
+They are shared by the test-suite and the ``benchmark_events`` management
+command, which runs every scenario against a throwaway test database. They
+drive the API through the DRF test client, so they live with the command
+rather than in the app modules the server imports.
+"""
+
+import threading
+import time
+from datetime import timedelta
+from statistics import median
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from accounts.models import Organization
+from events.models import Event
+
+User = get_user_model()
+
+
+def seed_organization(name="Benchmark Organization"):
+    owner = User.objects.create_user(
+        username=f"{name.lower().replace(' ', '_')}_owner",
+        email=f"{name.lower().replace(' ', '_')}@example.com",
+        password="benchmark",
+    )
+    return Organization.objects.create(name=name, owner=owner)
+
+
+def seed_users(count, prefix="bench"):
+    """Create users in bulk; profiles are not needed by the benchmarks."""
+    return User.objects.bulk_create(
+        User(username=f"{prefix}{i}", email=f"{prefix}{i}@example.com")
+        for i in range(count)
+    )
+
+
+WORDS = [
+    "music",
+    "jazz",
+    "museum",
+    "football",
+    "hiking",
+    "karaoke",
+    "language",
+    "exchange",
+    "picnic",
+    "cinema",
+    "workshop",
+    "party",
+    "trip",
+    "beach",
+    "volunteer",
+    "coffee",
+    "dinner",
+    "theatre",
+    "yoga",
+    "cycling",
+    "market",
+]
+
+
+def _words(i, count):
+    return " ".join(WORDS[(i * 7 + j * 3) % len(WORDS)] for j in range(count))
+
+
+def seed_events(count, organization, batch_size=1000, **fields):
+    """
+    Create ``count`` upcoming events in bulk, one hour apart, with varied
+    names and descriptions. bulk_create skips signals, so callers that need
+    the search index or the event cards must rebuild them afterwards.
+    """
+    start = timezone.now() + timedelta(days=1)
+    categories = [choice for choice, _ in Event.CATEGORY_CHOICES]
+    for offset in range(0, count, batch_size):
+        Event.objects.bulk_create(
+            Event(
+                name=f"{_words(i, 2).title()} {i}",
+                date=start + timedelta(hours=i),
+                description=f"{_words(i + 1, 8)} for event {i}",
+                category=categories[i % len(categories)],
+                organizer=organization.owner,
+                organization=organization,
+                **fields,
+            )
+            for i in range(offset, min(offset + batch_size, count))
+        )
+
+
+def seed_interest(events, users):
+    """Mark every user interested in every event, in bulk."""
+    Interest = Event.interested_users.through
+    Interest.objects.bulk_create(
+        Interest(event_id=event.pk, user_id=user.pk)
+        for event in events
+        for user in users
+    )
+    # Moves the counters the way the views do, cards and cached lists included
+    Event.adjust_counter([event.pk for event in events], "interest_count", len(users))
+
+
+def payload_bytes(serializer_class, queryset):
+    """Size of ``queryset`` rendered as JSON by ``serializer_class``."""
+    return len(JSONRenderer().render(serializer_class(queryset, many=True).data))
+
+
+def run_registration_stress(event, users, workers=8):
+    """
+    Register every user for ``event`` through the participate endpoint from
+    ``workers`` concurrent threads. Returns counts of each outcome and the
+    achieved registrations per second.
+    """
+    url = reverse("event-participate", kwargs={"pk": event.pk})
+    queue = list(users)
+    lock = threading.Lock()
+    outcomes = {"registered": 0, "rejected": 0, "errors": 0}
+
+    def worker():
+        client = APIClient()
+        try:
+            while True:
+                with lock:
+                    if not queue:
+                        return
+                    user = queue.pop()
+                client.force_authenticate(user=user)
+                try:
+                    status_code = client.post(url).status_code
+                except Exception:
+                    status_code = None
+                key = {201: "registered", 400: "rejected"}.get(status_code, "errors")
+                with lock:
+                    outcomes[key] += 1
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    outcomes["seconds"] = elapsed
+    outcomes["per_second"] = len(users) / elapsed if elapsed else 0.0
+    return outcomes
+
+
+def time_call(function, repeat=5):
+    """Median wall-clock seconds of ``function()`` over ``repeat`` runs."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return median(timings)
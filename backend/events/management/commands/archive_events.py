@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.archive import archive_events, archive_horizon
+
+
+class Command(BaseCommand):
+    help = (
+        "Move events older than the archive horizon, with their participant "
+        "and interest rows, into the archive tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help=(
+                "Archive events dated more than this many days ago. Defaults "
+                "to settings.EVENTS_ARCHIVE_AFTER_DAYS (365)."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of events moved per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        horizon = archive_horizon()
+        if options["days"] is not None:
+            horizon = timedelta(days=options["days"])
+        before = timezone.now() - horizon
+
+        moved = archive_events(before, batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {moved} event(s) dated before {before:%Y-%m-%d}."
+            )
+        )
@@ -0,0 +1,176 @@
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from events.fastpath import FastJSONRenderer, event_list_rows
+from events.management import benchmarks
+from events.models import Event
+from events.queries import with_list_annotations
+from events.search import BasicSearchBackend, get_search_backend
+from events.serializers import EventListSerializer, EventSerializer, event_fields
+from events.views import EventStatusView
+
+
+def _registrations(command, options):
+    organization = benchmarks.seed_organization()
+    users = benchmarks.seed_users(options["users"])
+    benchmarks.seed_events(1, organization, capacity=options["capacity"])
+    event = organization.events.get()
+
+    result = benchmarks.run_registration_stress(
+        event, users, workers=options["workers"]
+    )
+    event.refresh_from_db()
+    command.stdout.write(
+        f"{result['registered']} registered, {result['rejected']} rejected, "
+        f"{result['errors']} errors in {result['seconds']:.2f}s "
+        f"({result['per_second']:.0f} requests/s)"
+    )
+    command.stdout.write(
+        f"capacity={options['capacity']} "
+        f"participant_count={event.participant_count} "
+        f"rows={event.participants.count()}"
+    )
+
+
+def _search(command, options):
+    organization = benchmarks.seed_organization()
+    benchmarks.seed_events(options["events"], organization)
+    indexed = get_search_backend()
+    indexed.rebuild()
+
+    upcoming = Event.objects.filter(status="Active", date__gte=timezone.now())
+    command.stdout.write(
+        f"{options['events']} events, {type(indexed).__name__} vs icontains"
+    )
+    backends = (("icontains", BasicSearchBackend()), ("indexed", indexed))
+    for query in ("jazz", "karaoke picnic", "12345", "nothing matches"):
+        report = []
+        for label, backend in backends:
+            ids = backend.search(upcoming, query).values_list("pk", flat=True)
+            seconds = benchmarks.time_call(lambda: list(ids.all()))
+            report.append(f"{label} {seconds * 1000:7.1f} ms ({ids.count()} rows)")
+        command.stdout.write(f"  {query!r:18} " + " | ".join(report))
+
+
+def _payload(command, options):
+    organization = benchmarks.seed_organization()
+    benchmarks.seed_events(options["rows"], organization)
+    benchmarks.seed_interest(
+        organization.events.all(), benchmarks.seed_users(options["users"])
+    )
+
+    command.stdout.write(
+        f"{options['rows']} events, {options['users']} interested users each"
+    )
+    for serializer_class in (EventSerializer, EventListSerializer):
+        events = with_list_annotations(
+            organization.events.order_by("date", "id"),
+            fields=event_fields(None, serializer_class),
+        )
+        size = benchmarks.payload_bytes(serializer_class, events.all())
+        seconds = benchmarks.time_call(
+            lambda: benchmarks.payload_bytes(serializer_class, events.all())
+        )
+        command.stdout.write(
+            f"  {serializer_class.__name__:20} {size / 1024:9.1f} KiB "
+            f"{seconds * 1000:7.1f} ms"
+        )
+
+
+def _lists(command, options):
+    organization = benchmarks.seed_organization()
+    benchmarks.seed_events(options["rows"], organization)
+    events = with_list_annotations(
+        organization.events.order_by("date", "id"),
+        fields=event_fields(None, EventListSerializer),
+    )
+
+    def serializer():
+        data = EventListSerializer(events.all(), many=True).data
+        return JSONRenderer().render(data)
+
+    def fast():
+        return FastJSONRenderer().render(event_list_rows(events.all()))
+
+    assert serializer() == fast()
+    slow_seconds = benchmarks.time_call(serializer)
+    fast_seconds = benchmarks.time_call(fast)
+    command.stdout.write(
+        f"{options['rows']} events: serializer {slow_seconds * 1000:.1f} ms, "
+        f"values() {fast_seconds * 1000:.1f} ms "
+        f"({slow_seconds / fast_seconds:.1f}x)"
+    )
+
+
+def _status(command, options):
+    organization = benchmarks.seed_organization()
+    benchmarks.seed_events(options["rows"], organization, capacity=10)
+    events = list(organization.events.order_by("date", "id"))
+    user = benchmarks.seed_users(1)[0]
+    user.participating_events.add(*events[::2])
+    user.interested_events.add(*events[::3])
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    ids = ",".join(str(event.pk) for event in events[: EventStatusView.max_ids])
+    requests = (
+        ("upcoming list", reverse("upcoming-events"), {}),
+        ("status", reverse("event-status"), {"ids": ids}),
+    )
+    command.stdout.write(f"{options['rows']} events, badges for all of them")
+    for label, url, params in requests:
+        with CaptureQueriesContext(connection) as queries:
+            size = len(client.get(url, params).content)
+        seconds = benchmarks.time_call(lambda: client.get(url, params))
+        command.stdout.write(
+            f"  {label:14} {size / 1024:7.1f} KiB {seconds * 1000:7.1f} ms "
+            f"{len(queries)} queries"
+        )
+
+
+SCENARIOS = {
+    "lists": _lists,
+    "payload": _payload,
+    "registrations": _registrations,
+    "search": _search,
+    "status": _status,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run an event performance benchmark against a throwaway test database. "
+        "The development database is never touched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("scenario", choices=sorted(SCENARIOS))
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--capacity", type=int, default=50)
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--events", type=int, default=100_000)
+        parser.add_argument("--rows", type=int, default=100)
+
+    def handle(self, *args, **options):
+        # Rejected requests are expected; keep 4xx warnings out of the report
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+
+        if connection.vendor == "sqlite":
+            # Concurrent scenarios need real SQLite locking, which the
+            # in-memory test database does not provide
+            connection.settings_dict["TEST"]["NAME"] = (
+                settings.BASE_DIR / "benchmark_db.sqlite3"
+            )
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            SCENARIOS[options["scenario"]](self, options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from events.models import EventSeries
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the upcoming occurrences of recurring series as events, up to "
+        "settings.EVENTS_SERIES_HORIZON_DAYS (30) ahead, so the event lists "
+        "show them. Run it daily to roll the window forward."
+    )
+
+    def handle(self, *args, **options):
+        created = EventSeries.materialize_all_ahead()
+        self.stdout.write(self.style.SUCCESS(f"Materialized {created} occurrence(s)."))
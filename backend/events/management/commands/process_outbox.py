@@ -0,0 +1,64 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from events import outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver pending outbox entries to their consumers, in batches, "
+        "moving each consumer's checkpoint as it goes, then delete the "
+        "entries every consumer has passed once they are old enough."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--consumer",
+            action="append",
+            help="Only run this consumer (repeatable). Defaults to all of them.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--loop",
+            type=float,
+            metavar="SECONDS",
+            help="Keep running, polling for new entries at this interval.",
+        )
+        parser.add_argument(
+            "--prune-days",
+            type=int,
+            default=getattr(settings, "EVENTS_OUTBOX_KEEP_DAYS", 7),
+            help=(
+                "Delete processed entries older than this many days after "
+                "each pass (default: EVENTS_OUTBOX_KEEP_DAYS, or 7)."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        consumers = outbox.get_consumers()
+        names = options["consumer"] or sorted(consumers)
+        unknown = set(names) - set(consumers)
+        if unknown:
+            raise CommandError(f"Unknown consumer(s): {', '.join(sorted(unknown))}")
+
+        while True:
+            for name in names:
+                processed = 0
+                while True:
+                    read = outbox.process(name, batch_size=options["batch_size"])
+                    if not read:
+                        break
+                    processed += read
+                if processed:
+                    self.stdout.write(f"{name}: processed {processed} entries")
+            pruned = outbox.prune(timedelta(days=options["prune_days"]))
+            if pruned:
+                self.stdout.write(f"Pruned {pruned} entries.")
+            if options["loop"] is None:
+                break
+            time.sleep(options["loop"])
+
+        self.stdout.write(self.style.SUCCESS("Outbox processed."))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from events.cache import invalidate_event_lists
+from events.models import Event, EventCard
+
+
+class Command(BaseCommand):
+    help = "Rewrite every event card from the event, organization and user tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of events rewritten per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        rebuilt = 0
+        last_pk = 0
+        while True:
+            batch = list(
+                Event.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1]
+
+            with transaction.atomic():
+                rebuilt += EventCard.refresh(batch)
+
+        # Cached anonymous lists may have been built from stale cards
+        invalidate_event_lists()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} event card(s)."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from events.cache import invalidate_event_lists
+from events.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for events from scratch."
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        backend.rebuild()
+        # Cached search results may predate the rebuild
+        invalidate_event_lists()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt search index ({type(backend).__name__}).")
+        )
@@ -0,0 +1,92 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from events import trending
+from events.cache import invalidate_events
+from events.models import Event, EventCard, Interest, Participation
+from events.queries import through_count
+
+
+def _trending_scores(event_ids):
+    """The trending scores of ``event_ids`` rebuilt from their memberships"""
+    made = defaultdict(list)
+    for through in (Participation, Interest):
+        weight = trending.WEIGHTS[through.counter]
+        rows = through.objects.filter(event_id__in=event_ids).values_list(
+            "event_id", "created_at"
+        )
+        for event_id, created_at in rows:
+            made[event_id].append((weight, created_at))
+    return {pk: trending.score(made[pk]) for pk in event_ids}
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Event.participant_count and Event.interest_count from the "
+        "M2M tables and fix any drift, rebuilding the trending scores of the "
+        "events fixed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of events checked per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted events without fixing them.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        actual_participants = through_count(Event.participants.through)
+        actual_interest = through_count(Event.interested_users.through)
+
+        fixed = 0
+        last_pk = 0
+        while True:
+            batch = list(
+                Event.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1]
+
+            with transaction.atomic():
+                drifted = list(
+                    Event.objects.filter(pk__in=batch)
+                    .annotate(
+                        actual_participants=actual_participants,
+                        actual_interest=actual_interest,
+                    )
+                    .filter(
+                        ~Q(participant_count=F("actual_participants"))
+                        | ~Q(interest_count=F("actual_interest"))
+                    )
+                    .values_list("pk", flat=True)
+                )
+                if drifted and not options["dry_run"]:
+                    Event.objects.filter(pk__in=drifted).update(
+                        participant_count=actual_participants,
+                        interest_count=actual_interest,
+                        updated_at=timezone.now(),
+                    )
+                    for pk, score in _trending_scores(drifted).items():
+                        Event.objects.filter(pk=pk).update(trending_score=score)
+                    # Queryset updates bypass the signals that retire cached
+                    # lists and fragments
+                    invalidate_events(drifted)
+                    EventCard.refresh(drifted)
+            fixed += len(drifted)
+
+        verb = "Found" if options["dry_run"] else "Fixed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {fixed} drifted event(s)."))
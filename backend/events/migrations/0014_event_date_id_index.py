@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-17 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_organization_followers"),
+        ("events", "0013_merge_0012_event_category_0012_merge_0011_migrations"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["date", "id"], name="events_date_id_idx"),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-17 06:42
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(through):
+    counts = (
+        through.objects.filter(event_id=OuterRef("pk"))
+        .order_by()
+        .values("event_id")
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def backfill_counters(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    Event.objects.update(
+        participant_count=_count(Event.participants.through),
+        interest_count=_count(Event.interested_users.through),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0014_event_date_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="interest_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="participant_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
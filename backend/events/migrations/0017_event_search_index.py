@@ -0,0 +1,45 @@
+from django.db import migrations
+
+FTS_TABLE = "events_event_fts"
+
+
+def create_search_index(apps, schema_editor):
+    """Create and fill the FTS5 index. Other databases use plain filtering."""
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        if not cursor.fetchone()[0]:
+            return
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "name, description, location, category, organization_name, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} "
+            "(rowid, name, description, location, category, organization_name) "
+            "SELECT e.id, e.name, COALESCE(e.description, ''), "
+            "COALESCE(e.location, ''), e.category, o.name "
+            "FROM events_event e JOIN accounts_organization o "
+            "ON o.id = e.organization_id"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_organization_followers"),
+        ("events", "0016_waitlistentry"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
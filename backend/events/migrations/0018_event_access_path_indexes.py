@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-17 07:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_organization_followers"),
+        ("events", "0017_event_search_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["status", "date", "id"], name="events_status_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["organization", "status", "date"],
+                name="events_org_status_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["organizer", "date", "id"], name="events_organizer_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,117 @@
+# Generated by Django 5.2.7 on 2026-10-17 07:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_organization_followers"),
+        ("events", "0018_event_access_path_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventSeries",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("location", models.CharField(blank=True, max_length=300, null=True)),
+                (
+                    "description",
+                    models.CharField(blank=True, max_length=300, null=True),
+                ),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("SOCIAL", "Social"),
+                            ("ACADEMIC", "Academic"),
+                            ("TRAVEL", "Travel"),
+                            ("SPORTS", "Sports"),
+                            ("CULTURAL", "Cultural"),
+                            ("VOLUNTEERING", "Volunteering"),
+                            ("NIGHTLIFE", "Nightlife"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("capacity", models.IntegerField(blank=True, null=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("Active", "Active"), ("Cancelled", "Cancelled")],
+                        default="Active",
+                        max_length=10,
+                    ),
+                ),
+                ("start", models.DateTimeField()),
+                (
+                    "frequency",
+                    models.CharField(
+                        choices=[("DAILY", "Daily"), ("WEEKLY", "Weekly")],
+                        default="WEEKLY",
+                        max_length=10,
+                    ),
+                ),
+                ("interval", models.PositiveSmallIntegerField(default=1)),
+                ("until", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="event_series",
+                        to="accounts.organization",
+                    ),
+                ),
+                (
+                    "organizer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="organized_series",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["start", "id"],
+            },
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="series",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="materialized_events",
+                to="events.eventseries",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("series__isnull", False)),
+                fields=("series", "date"),
+                name="unique_series_occurrence",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventseries",
+            index=models.Index(
+                fields=["start", "until"], name="events_series_window_idx"
+            ),
+        ),
+    ]
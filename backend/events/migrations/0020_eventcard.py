@@ -0,0 +1,114 @@
+# Generated by Django 5.2.7 on 2026-10-17 07:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Mirrors EventCard.SOURCES; historical models have no custom methods
+SOURCES = {
+    "event_id": "id",
+    "name": "name",
+    "date": "date",
+    "location": "location",
+    "description": "description",
+    "category": "category",
+    "status": "status",
+    "capacity": "capacity",
+    "organizer_id": "organizer_id",
+    "organizer_name": "organizer__username",
+    "organization_id": "organization_id",
+    "organization_name": "organization__name",
+    "series_id": "series_id",
+    "participant_count": "participant_count",
+    "interest_count": "interest_count",
+}
+
+
+def backfill_cards(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    EventCard = apps.get_model("events", "EventCard")
+    cards = []
+    for row in Event.objects.values_list(*SOURCES.values()).iterator():
+        card = EventCard(**dict(zip(SOURCES, row)))
+        card.is_full = bool(card.capacity) and (card.participant_count >= card.capacity)
+        cards.append(card)
+    EventCard.objects.bulk_create(cards, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_organization_followers"),
+        ("events", "0019_eventseries"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventCard",
+            fields=[
+                (
+                    "event",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="card",
+                        serialize=False,
+                        to="events.event",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("date", models.DateTimeField()),
+                ("location", models.CharField(blank=True, max_length=300, null=True)),
+                (
+                    "description",
+                    models.CharField(blank=True, max_length=300, null=True),
+                ),
+                ("category", models.CharField(max_length=20)),
+                ("status", models.CharField(max_length=10)),
+                ("capacity", models.IntegerField(blank=True, null=True)),
+                ("organizer_name", models.CharField(max_length=150)),
+                ("organization_name", models.CharField(max_length=255)),
+                ("participant_count", models.PositiveIntegerField(default=0)),
+                ("interest_count", models.PositiveIntegerField(default=0)),
+                ("is_full", models.BooleanField(default=False)),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="accounts.organization",
+                    ),
+                ),
+                (
+                    "organizer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "series",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="events.eventseries",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date", "event_id"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "date", "event"],
+                        name="event_cards_status_date_idx",
+                    ),
+                    models.Index(fields=["date"], name="event_cards_date_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_cards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-17 08:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0020_eventcard"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["updated_at", "id"], name="events_updated_at_id_idx"
+            ),
+        ),
+        migrations.CreateModel(
+            name="EventTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event_id", models.PositiveIntegerField()),
+                (
+                    "deleted_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "ordering": ["deleted_at", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["deleted_at"], name="events_tombstone_deleted_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,154 @@
+# Generated by Django 5.2.7 on 2026-10-17 10:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_organization_followers"),
+        ("events", "0022_outboxentry_outboxcheckpoint"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedEvent",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100)),
+                ("date", models.DateTimeField()),
+                (
+                    "location",
+                    models.CharField(blank=True, max_length=300, null=True),
+                ),
+                (
+                    "description",
+                    models.CharField(blank=True, max_length=300, null=True),
+                ),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("SOCIAL", "Social"),
+                            ("ACADEMIC", "Academic"),
+                            ("TRAVEL", "Travel"),
+                            ("SPORTS", "Sports"),
+                            ("CULTURAL", "Cultural"),
+                            ("VOLUNTEERING", "Volunteering"),
+                            ("NIGHTLIFE", "Nightlife"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("Active", "Active"), ("Cancelled", "Cancelled")],
+                        max_length=10,
+                    ),
+                ),
+                ("capacity", models.IntegerField(blank=True, null=True)),
+                ("participant_count", models.PositiveIntegerField(default=0)),
+                ("interest_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "archived_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_events",
+                        to="accounts.organization",
+                    ),
+                ),
+                (
+                    "organizer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_events",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "series",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="events.eventseries",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["date", "id"], name="events_archive_date_id_idx"
+                    ),
+                    models.Index(
+                        fields=["status", "date", "id"],
+                        name="events_archive_status_idx",
+                    ),
+                    models.Index(
+                        fields=["organization", "status", "date"],
+                        name="events_archive_org_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedMembership",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "relation",
+                    models.CharField(
+                        choices=[
+                            ("participants", "Participant"),
+                            ("interested_users", "Interested"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="memberships",
+                        to="events.archivedevent",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("event", "user", "relation"),
+                        name="unique_archived_membership",
+                    )
+                ],
+            },
+        ),
+    ]
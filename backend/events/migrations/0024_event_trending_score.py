@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-17 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0023_archivedevent_archivedmembership"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="trending_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["status", "-trending_score", "date", "id"],
+                name="events_status_trending_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 09:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def backfill_boundaries(apps, schema_editor):
+    ArchivedEvent = apps.get_model("events", "ArchivedEvent")
+    ArchiveBoundary = apps.get_model("events", "ArchiveBoundary")
+    latest = (
+        ArchivedEvent.objects.order_by()
+        .values("organization_id")
+        .annotate(date=Max("date"))
+    )
+    ArchiveBoundary.objects.bulk_create(ArchiveBoundary(**row) for row in latest)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_organization_followers"),
+        ("events", "0024_event_trending_score"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchiveBoundary",
+            fields=[
+                (
+                    "organization",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="archive_boundary",
+                        serialize=False,
+                        to="accounts.organization",
+                    ),
+                ),
+                ("date", models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_boundaries, migrations.RunPython.noop),
+    ]
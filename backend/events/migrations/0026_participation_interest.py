@@ -0,0 +1,100 @@
+# Generated by Django 5.2.7 on 2026-10-17 16:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def _membership(name, db_table):
+    return migrations.CreateModel(
+        name=name,
+        fields=[
+            (
+                "id",
+                models.BigAutoField(
+                    auto_created=True,
+                    primary_key=True,
+                    serialize=False,
+                    verbose_name="ID",
+                ),
+            ),
+            (
+                "event",
+                models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name="+",
+                    to="events.event",
+                ),
+            ),
+            (
+                "user",
+                models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name="+",
+                    to=settings.AUTH_USER_MODEL,
+                ),
+            ),
+        ],
+        options={
+            "db_table": db_table,
+            "abstract": False,
+            "unique_together": {("event", "user")},
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0025_archiveboundary"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The tables already exist as the auto-created M2M tables, with the
+        # same columns; only the state changes
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                _membership("Participation", "events_event_participants"),
+                _membership("Interest", "events_event_interested_users"),
+                migrations.AlterField(
+                    model_name="event",
+                    name="participants",
+                    field=models.ManyToManyField(
+                        blank=True,
+                        related_name="participating_events",
+                        through="events.Participation",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="event",
+                    name="interested_users",
+                    field=models.ManyToManyField(
+                        blank=True,
+                        related_name="interested_events",
+                        through="events.Interest",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        # Existing rows count as made now
+        migrations.AddField(
+            model_name="participation",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="interest",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
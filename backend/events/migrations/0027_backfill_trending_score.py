@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-17 16:40
+
+import math
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.db import migrations
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Ln
+from django.utils import timezone
+
+# events.trending as of this migration
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+TAU = 86400 / math.log(2)
+PARTICIPANT_WEIGHT = 2.0
+INTEREST_WEIGHT = 1.0
+
+
+def backfill_trending_score(apps, schema_editor):
+    """
+    Score the existing participations and interests as if made now, the
+    created_at that 0026 gave them.
+    """
+    Event = apps.get_model("events", "Event")
+    weight = Value(PARTICIPANT_WEIGHT) * F("participant_count") + Value(
+        INTEREST_WEIGHT
+    ) * F("interest_count")
+    elapsed = (timezone.now() - EPOCH).total_seconds() / TAU
+    Event.objects.alias(weight=weight).filter(weight__gt=0).update(
+        trending_score=Ln(weight, output_field=FloatField()) + Value(elapsed)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0026_participation_interest"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_trending_score, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 11:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0028_trending_keyset_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="eventtombstone",
+            name="event_id",
+            field=models.PositiveBigIntegerField(),
+        ),
+    ]
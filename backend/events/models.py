@@ -1,6 +1,15 @@
+from datetime import timedelta
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import trending
+from .cache import invalidate_events
 
 
 # Remove after implement that only organizers can create events
@@ -49,20 +58,80 @@ class Event(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="Active")
     capacity = models.IntegerField(blank=True, null=True)
 
+    # Set when this row is a materialized occurrence of a recurring series
+    series = models.ForeignKey(
+        "EventSeries",
+        on_delete=models.SET_NULL,
+        related_name="materialized_events",
+        blank=True,
+        null=True,
+    )
+
     participants = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
         blank=True,
         related_name="participating_events",
+        through="Participation",
     )
 
     interested_users = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
         blank=True,
         related_name="interested_events",
+        through="Interest",
     )
 
+    # Denormalized sizes of the M2M relations above. Only ever written with
+    # F() expressions (see adjust_counter) and never by save().
+    participant_count = models.PositiveIntegerField(default=0)
+    interest_count = models.PositiveIntegerField(default=0)
+
+    COUNTER_FIELDS = ("participant_count", "interest_count")
+
+    # Time-decayed activity, moved along with the counters (see
+    # events.trending); 0 until someone participates or shows interest
+    trending_score = models.FloatField(default=0)
+
+    # Moved forward by every write, queryset updates included (see touch);
+    # delta sync walks events in (updated_at, id) order
+    updated_at = models.DateTimeField(auto_now=True)
+
     class Meta:
         ordering = ["date", "id"]  # Order by date, then by id for consistency
+        indexes = [
+            # Backs keyset pagination, which seeks on (date, id)
+            models.Index(fields=["date", "id"], name="events_date_id_idx"),
+            # Upcoming and past lists: status equality, then a date range
+            # walked in (date, id) order
+            models.Index(
+                fields=["status", "date", "id"], name="events_status_date_idx"
+            ),
+            # Organization pages and event_count
+            models.Index(
+                fields=["organization", "status", "date"],
+                name="events_org_status_date_idx",
+            ),
+            # "My events" for an organizer
+            models.Index(
+                fields=["organizer", "date", "id"], name="events_organizer_date_idx"
+            ),
+            # Delta sync, which seeks on (updated_at, id)
+            models.Index(fields=["updated_at", "id"], name="events_updated_at_id_idx"),
+            # Upcoming events by trending score, walked in index order and
+            # sought on (trending_score, id) for the next page
+            models.Index(
+                fields=["status", "-trending_score", "-id"],
+                name="events_status_trending_id_idx",
+            ),
+        ]
+        constraints = [
+            # An occurrence is materialized at most once
+            models.UniqueConstraint(
+                fields=["series", "date"],
+                condition=Q(series__isnull=False),
+                name="unique_series_occurrence",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -71,4 +140,773 @@ class Event(models.Model):
         # Convert 0 to None for unlimited capacity
         if self.capacity == 0:
             self.capacity = None
+
+        # Never write back counters or the trending score loaded earlier: a
+        # concurrent registration may have moved them since this instance
+        # was fetched.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in (*self.COUNTER_FIELDS, "trending_score")
+            ]
+        elif kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated_at"}
         super().save(*args, **kwargs)
+
+    @property
+    def is_full(self):
+        if not self.capacity:
+            return False
+        return self.participant_count >= self.capacity
+
+    @classmethod
+    def adjust_counter(cls, event_ids, field, delta, made_at=()):
+        """
+        Atomically add delta to a counter column on the given events. A
+        decrement takes back the trending contributions made at ``made_at``,
+        the created_at of the removed memberships (see trending.bump).
+        """
+        if not event_ids or not delta:
+            return 0
+        updated = cls.objects.filter(pk__in=event_ids).update(
+            **{field: F(field) + delta},
+            trending_score=trending.bump(field, delta, made_at=made_at),
+            updated_at=timezone.now(),
+        )
+        if updated:
+            # Queryset updates bypass the model signals that retire cached lists
+            # and refresh the cards
+            invalidate_events(event_ids)
+            EventCard.refresh(event_ids)
+        return updated
+
+    @classmethod
+    def claim_seat(cls, event_id):
+        """
+        Take one seat on an event if it has room, returning whether it did.
+
+        This is a single conditional UPDATE, so it also takes the event's row
+        lock (the write lock on SQLite): call it inside transaction.atomic()
+        before deciding anything else about the registration.
+        """
+        claimed = (
+            cls.objects.filter(pk=event_id)
+            .filter(
+                Q(capacity__isnull=True)
+                | Q(capacity=0)
+                | Q(participant_count__lt=F("capacity"))
+            )
+            .update(
+                participant_count=F("participant_count") + 1,
+                trending_score=trending.bump("participant_count", 1),
+                updated_at=timezone.now(),
+            )
+        )
+        if claimed:
+            invalidate_events([event_id])
+            EventCard.refresh([event_id])
+        return bool(claimed)
+
+    @classmethod
+    def touch(cls, event_ids):
+        """
+        Move updated_at forward on events whose serialized form changed
+        without a save, e.g. through a rename of their organization.
+        """
+        if not event_ids:
+            return 0
+        return cls.objects.filter(pk__in=event_ids).update(updated_at=timezone.now())
+
+    def promote_waitlist(self):
+        """
+        Register users from the head of the waitlist while seats are free.
+
+        Must run inside the transaction that freed the seats. Each promotion
+        is an index seek on the queue head plus one seat claim, so the cost
+        does not depend on the length of the queue. Returns promoted users.
+        """
+        from notifications.models import Notification
+
+        from . import outbox
+
+        Participant = Event.participants.through
+        promoted = []
+        while True:
+            entry = (
+                WaitlistEntry.objects.filter(event_id=self.pk)
+                .select_related("user")
+                .order_by("id")
+                .first()
+            )
+            if entry is None or not Event.claim_seat(self.pk):
+                break
+
+            entry.delete()
+            _, created = Participant.objects.get_or_create(
+                event_id=self.pk, user_id=entry.user_id
+            )
+            if not created:
+                # Registered some other way while queued; hand the seat back
+                Event.adjust_counter([self.pk], "participant_count", -1)
+                continue
+
+            outbox.record_members(
+                outbox.MEMBERS_ADDED, "participants", [[self.pk, entry.user_id]]
+            )
+            Notification.objects.create(
+                user=entry.user,
+                title=f"You're in: {self.name}",
+                message=(
+                    f'A spot opened up for "{self.name}" and you have been '
+                    "registered from the waitlist."
+                ),
+            )
+            promoted.append(entry.user)
+
+        self.refresh_from_db(fields=["participant_count"])
+        return promoted
+
+
+class Membership(models.Model):
+    """
+    A user's row in one of an event's member relations. The table names are
+    those of the former auto-created M2M tables.
+    """
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="+")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    # When the membership's trending contribution was made, so that removing
+    # it takes back exactly that much
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    # The Event relation the rows make up, and the counter kept in step
+    relation: str
+    counter: str
+
+    class Meta:
+        abstract = True
+        unique_together = [("event", "user")]
+
+    def __str__(self):
+        return f"{self.user} in {self.event}"
+
+    @classmethod
+    def remove(cls, event_id, user_id):
+        """
+        Delete the membership of ``user_id`` in ``event_id`` and move the
+        event's counter to match. Returns the number of rows removed.
+        """
+        rows = cls.objects.filter(event_id=event_id, user_id=user_id)
+        made_at = list(rows.values_list("created_at", flat=True))
+        removed, _ = rows.delete()
+        Event.adjust_counter([event_id], cls.counter, -removed, made_at=made_at)
+        return removed
+
+
+class Participation(Membership):
+    """The through model of Event.participants."""
+
+    relation = "participants"
+    counter = "participant_count"
+
+    class Meta(Membership.Meta):
+        db_table = "events_event_participants"
+
+
+class Interest(Membership):
+    """The through model of Event.interested_users."""
+
+    relation = "interested_users"
+    counter = "interest_count"
+
+    class Meta(Membership.Meta):
+        db_table = "events_event_interested_users"
+
+
+class EventSeries(models.Model):
+    """
+    A recurring event such as a weekly language exchange.
+
+    The occurrences of the next EVENTS_SERIES_HORIZON_DAYS (default 30) are
+    stored as Event rows ahead of time (materialize_ahead), so every event
+    list, which reads rows only, shows them. The ``materialize_series``
+    command rolls the window forward. Later occurrences are computed on
+    demand by the calendar, and stored once someone registers for one
+    (materialize).
+    """
+
+    FREQUENCY_CHOICES = [
+        ("DAILY", "Daily"),
+        ("WEEKLY", "Weekly"),
+    ]
+
+    STEPS = {"DAILY": timedelta(days=1), "WEEKLY": timedelta(weeks=1)}
+
+    # Copied onto every materialized occurrence
+    TEMPLATE_FIELDS = (
+        "name",
+        "location",
+        "description",
+        "category",
+        "capacity",
+        "status",
+        "organizer",
+        "organization",
+    )
+
+    name = models.CharField(max_length=100)
+    location = models.CharField(max_length=300, blank=True, null=True)
+    description = models.CharField(max_length=300, blank=True, null=True)
+    category = models.CharField(max_length=20, choices=Event.CATEGORY_CHOICES)
+    capacity = models.IntegerField(blank=True, null=True)
+    status = models.CharField(
+        max_length=10, choices=Event.STATUS_CHOICES, default="Active"
+    )
+    organizer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="organized_series",
+    )
+    organization = models.ForeignKey(
+        "accounts.Organization",
+        on_delete=models.CASCADE,
+        related_name="event_series",
+    )
+
+    # Recurrence rule: every `interval` days or weeks from `start`, up to and
+    # including `until` when it is set
+    start = models.DateTimeField()
+    frequency = models.CharField(
+        max_length=10, choices=FREQUENCY_CHOICES, default="WEEKLY"
+    )
+    interval = models.PositiveSmallIntegerField(default=1)
+    until = models.DateTimeField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["start", "id"]
+        indexes = [
+            # Finds the series that overlap a calendar window
+            models.Index(fields=["start", "until"], name="events_series_window_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def step(self):
+        return self.STEPS[self.frequency] * self.interval
+
+    def occurrences(self, start, end):
+        """
+        Yield the occurrence datetimes in [start, end).
+
+        Jumps straight to the first occurrence in the window, so the cost
+        depends only on the window, not on how long the series has run.
+        """
+        step = self.step
+        current = self.start
+        if start > current:
+            # Ceiling division: the first whole step at or after `start`
+            current += -((current - start) // step) * step
+        while current < end and (self.until is None or current <= self.until):
+            yield current
+            current += step
+
+    def is_occurrence(self, date):
+        return (
+            date >= self.start
+            and (self.until is None or date <= self.until)
+            and (date - self.start) % self.step == timedelta(0)
+        )
+
+    def build_occurrence(self, date):
+        """An unsaved Event for the occurrence at ``date``."""
+        return Event(
+            series=self,
+            date=date,
+            **{field: getattr(self, field) for field in self.TEMPLATE_FIELDS},
+        )
+
+    @staticmethod
+    def horizon():
+        """How far ahead occurrences are stored as Event rows."""
+        return timedelta(days=getattr(settings, "EVENTS_SERIES_HORIZON_DAYS", 30))
+
+    @classmethod
+    def materialize_all_ahead(cls, now=None):
+        """
+        Store the occurrences of every active series up to the horizon.
+        Returns the number of Event rows created.
+        """
+        now = now or timezone.now()
+        series = cls.objects.filter(
+            status="Active", start__lt=now + cls.horizon()
+        ).filter(Q(until__isnull=True) | Q(until__gte=now))
+        return sum(item.materialize_ahead(now) for item in series)
+
+    def materialize_ahead(self, now=None):
+        """
+        Store the occurrences from ``now`` up to the horizon as Event rows,
+        skipping those already stored. Returns the number of rows created.
+        """
+        now = now or timezone.now()
+        created = 0
+        for date in self.occurrences(now, now + self.horizon()):
+            _, made = Event.objects.get_or_create(
+                series=self,
+                date=date,
+                defaults={
+                    field: getattr(self, field) for field in self.TEMPLATE_FIELDS
+                },
+            )
+            created += made
+        return created
+
+    def materialize(self, date):
+        """
+        Return the Event row for the occurrence at ``date``, creating it on
+        first use. Concurrent callers end up with the same row.
+        """
+        if not self.is_occurrence(date):
+            raise ValueError(f"{date} is not an occurrence of this series.")
+        event, _ = Event.objects.get_or_create(
+            series=self,
+            date=date,
+            defaults={field: getattr(self, field) for field in self.TEMPLATE_FIELDS},
+        )
+        return event
+
+
+class WaitlistEntry(models.Model):
+    """A user queued for a full event. The queue is FIFO by id."""
+
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, related_name="waitlist_entries"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="waitlist_entries",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "user"], name="unique_waitlist_entry"
+            ),
+        ]
+        indexes = [
+            # Queue head lookup and position counting per event
+            models.Index(fields=["event", "id"], name="events_waitlist_head_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} waiting for {self.event}"
+
+    @property
+    def position(self):
+        """1-based position in the event's queue."""
+        return WaitlistEntry.objects.filter(
+            event_id=self.event_id, id__lte=self.id
+        ).count()
+
+
+class EventCard(models.Model):
+    """
+    Denormalized, read-only copy of what an event list shows for one event:
+    the event's columns plus the organizer and organization names, the
+    counters and is_full. Public lists read it without any join.
+
+    Rows are derived data. refresh() rewrites them from the source tables
+    and is called after every write that changes a card; the
+    rebuild_event_cards command recreates them all.
+    """
+
+    event = models.OneToOneField(
+        Event, on_delete=models.CASCADE, primary_key=True, related_name="card"
+    )
+    name = models.CharField(max_length=100)
+    date = models.DateTimeField()
+    location = models.CharField(max_length=300, blank=True, null=True)
+    description = models.CharField(max_length=300, blank=True, null=True)
+    category = models.CharField(max_length=20)
+    status = models.CharField(max_length=10)
+    capacity = models.IntegerField(blank=True, null=True)
+    organizer = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    organizer_name = models.CharField(max_length=150)
+    organization = models.ForeignKey(
+        "accounts.Organization", on_delete=models.CASCADE, related_name="+"
+    )
+    organization_name = models.CharField(max_length=255)
+    series = models.ForeignKey(
+        EventSeries,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+    participant_count = models.PositiveIntegerField(default=0)
+    interest_count = models.PositiveIntegerField(default=0)
+    is_full = models.BooleanField(default=False)
+
+    # Card column -> the Event expression it is copied from
+    SOURCES = {
+        "event_id": "id",
+        "name": "name",
+        "date": "date",
+        "location": "location",
+        "description": "description",
+        "category": "category",
+        "status": "status",
+        "capacity": "capacity",
+        "organizer_id": "organizer_id",
+        "organizer_name": "organizer__username",
+        "organization_id": "organization_id",
+        "organization_name": "organization__name",
+        "series_id": "series_id",
+        "participant_count": "participant_count",
+        "interest_count": "interest_count",
+    }
+
+    class Meta:
+        ordering = ["date", "event_id"]
+        indexes = [
+            # Upcoming and past lists, same access path as on Event
+            models.Index(
+                fields=["status", "date", "event"], name="event_cards_status_date_idx"
+            ),
+            # The next event to start, when cached lists next change
+            models.Index(fields=["date"], name="event_cards_date_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def refresh(cls, event_ids):
+        """
+        Rewrite the cards of the given events from the source tables, in one
+        read and one upsert. Cards of deleted events go with the event.
+        """
+        rows = Event.objects.filter(pk__in=list(event_ids)).values_list(
+            *cls.SOURCES.values()
+        )
+        cards = []
+        for row in rows:
+            card = cls(**dict(zip(cls.SOURCES, row)))
+            card.is_full = bool(card.capacity) and (
+                card.participant_count >= card.capacity
+            )
+            cards.append(card)
+        cls.objects.bulk_create(
+            cards,
+            update_conflicts=True,
+            unique_fields=["event"],
+            update_fields=[
+                field.name
+                for field in cls._meta.concrete_fields
+                if not field.primary_key
+            ],
+        )
+        return len(cards)
+
+
+class EventTombstone(models.Model):
+    """
+    Marker left by a deleted event, so delta sync can report the deletion.
+    It keeps the id only: the event row, and any foreign key to it, is gone.
+    """
+
+    # Wide enough for any Event id (a BigAutoField)
+    event_id = models.PositiveBigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["deleted_at", "id"]
+        indexes = [
+            models.Index(fields=["deleted_at"], name="events_tombstone_deleted_idx"),
+        ]
+
+    def __str__(self):
+        return f"Event {self.event_id} deleted at {self.deleted_at}"
+
+
+class OutboxEntry(models.Model):
+    """
+    One change to an event, an organization or an event's members, written
+    in the transaction that made it. See events.outbox.
+    """
+
+    topic = models.CharField(max_length=50)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name_plural = "outbox entries"
+
+    def __str__(self):
+        return f"{self.topic} {self.payload}"
+
+
+class OutboxCheckpoint(models.Model):
+    """The last outbox entry a consumer has processed."""
+
+    consumer = models.CharField(max_length=100, unique=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.consumer} at {self.position}"
+
+
+class ArchivedEvent(models.Model):
+    """
+    An event moved out of events_event by the archive_events job, keeping its
+    id and columns. The past events list and organization pages add these
+    rows only when the dates they ask for reach back past the ArchiveBoundary.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=100)
+    date = models.DateTimeField()
+    location = models.CharField(max_length=300, blank=True, null=True)
+    description = models.CharField(max_length=300, blank=True, null=True)
+    category = models.CharField(max_length=20, choices=Event.CATEGORY_CHOICES)
+    organizer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_events",
+    )
+    organization = models.ForeignKey(
+        "accounts.Organization",
+        on_delete=models.CASCADE,
+        related_name="archived_events",
+    )
+    status = models.CharField(max_length=10, choices=Event.STATUS_CHOICES)
+    capacity = models.IntegerField(blank=True, null=True)
+    series = models.ForeignKey(
+        EventSeries,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+    participant_count = models.PositiveIntegerField(default=0)
+    interest_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    # Columns copied from Event as they are
+    COPIED_FIELDS = (
+        "id",
+        "name",
+        "date",
+        "location",
+        "description",
+        "category",
+        "organizer_id",
+        "organization_id",
+        "status",
+        "capacity",
+        "series_id",
+        "participant_count",
+        "interest_count",
+        "updated_at",
+    )
+
+    class Meta:
+        ordering = ["date", "id"]
+        indexes = [
+            # The archive boundary, MAX(date)
+            models.Index(fields=["date", "id"], name="events_archive_date_id_idx"),
+            # Same access paths as the past list and organization pages
+            models.Index(
+                fields=["status", "date", "id"], name="events_archive_status_idx"
+            ),
+            models.Index(
+                fields=["organization", "status", "date"],
+                name="events_archive_org_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def is_full(self):
+        if not self.capacity:
+            return False
+        return self.participant_count >= self.capacity
+
+    # The members, read the way Event's many-to-many managers are
+
+    @property
+    def participants(self):
+        return self._members("participants")
+
+    @property
+    def interested_users(self):
+        return self._members("interested_users")
+
+    def _members(self, relation):
+        members = self.memberships.filter(relation=relation)
+        return get_user_model().objects.filter(pk__in=members.values("user_id"))
+
+
+class ArchivedMembership(models.Model):
+    """A participant or interest row of an archived event."""
+
+    RELATION_CHOICES = [
+        ("participants", "Participant"),
+        ("interested_users", "Interested"),
+    ]
+
+    event = models.ForeignKey(
+        ArchivedEvent, on_delete=models.CASCADE, related_name="memberships"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    relation = models.CharField(max_length=20, choices=RELATION_CHOICES)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "user", "relation"],
+                name="unique_archived_membership",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.relation} of {self.event}"
+
+
+class ArchiveBoundary(models.Model):
+    """
+    The date of the newest archived event of an organization. It lives in the
+    database, so every process sees it move in the transaction that moves the
+    events, and the organization page reads it with the organization row.
+    """
+
+    organization = models.OneToOneField(
+        "accounts.Organization",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="archive_boundary",
+    )
+    # Indexed for the overall boundary, MAX(date)
+    date = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.organization} archived up to {self.date}"
+
+
+def _sync_counter(through, field, instance, action, reverse, pk_set):
+    """
+    Keep an Event counter in step with changes made through the M2M managers,
+    e.g. ``event.participants.add(user)`` or ``user.interested_events.clear()``.
+
+    Django reports only the rows actually inserted on post_add, but reports
+    the requested rows on remove, so removals are measured beforehand, along
+    with when the removed rows were made for the trending score.
+    """
+    pending = instance.__dict__.setdefault("_pending_counter_changes", {})
+
+    if action == "post_add" and pk_set:
+        if reverse:
+            Event.adjust_counter(pk_set, field, 1)
+        else:
+            Event.adjust_counter([instance.pk], field, len(pk_set))
+    elif action in ("pre_remove", "pre_clear"):
+        if reverse:
+            rows = through.objects.filter(user_id=instance.pk)
+            if action == "pre_remove":
+                rows = rows.filter(event_id__in=pk_set or ())
+            pending[field] = list(rows.values_list("event_id", "created_at"))
+        else:
+            rows = through.objects.filter(event_id=instance.pk)
+            if action == "pre_remove":
+                rows = rows.filter(user_id__in=pk_set or ())
+            pending[field] = list(rows.values_list("created_at", flat=True))
+        return
+    elif action in ("post_remove", "post_clear"):
+        if reverse:
+            for event_id, created_at in pending.pop(field, []):
+                Event.adjust_counter([event_id], field, -1, made_at=[created_at])
+        elif action == "post_clear":
+            made_at = pending.pop(field, [])
+            changes = {field: 0, "updated_at": timezone.now()}
+            if made_at:
+                changes["trending_score"] = trending.bump(
+                    field, -len(made_at), made_at=made_at
+                )
+            Event.objects.filter(pk=instance.pk).update(**changes)
+            EventCard.refresh([instance.pk])
+        else:
+            made_at = pending.pop(field, [])
+            Event.adjust_counter([instance.pk], field, -len(made_at), made_at)
+    else:
+        return
+
+    if not reverse:
+        instance.refresh_from_db(fields=[field])
+
+
+@receiver(m2m_changed, sender=Event.participants.through)
+def sync_participant_count(sender, instance, action, reverse, pk_set, **kwargs):
+    _sync_counter(sender, "participant_count", instance, action, reverse, pk_set)
+
+
+@receiver(m2m_changed, sender=Event.interested_users.through)
+def sync_interest_count(sender, instance, action, reverse, pk_set, **kwargs):
+    _sync_counter(sender, "interest_count", instance, action, reverse, pk_set)
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def remember_memberships(sender, instance, **kwargs):
+    """Note the memberships a deleted user takes along, for release_memberships()"""
+    instance._deleted_memberships = {
+        through: list(
+            through.objects.filter(user_id=instance.pk).values_list(
+                "event_id", "created_at"
+            )
+        )
+        for through in (Participation, Interest)
+    }
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def release_memberships(sender, instance, **kwargs):
+    """
+    Move the counters of the events a deleted user belonged to, and hand
+    their seats to the waitlists. Their memberships go in the cascade, which
+    sends no m2m_changed.
+    """
+    from . import outbox
+
+    memberships = instance.__dict__.pop("_deleted_memberships", {})
+    for through, rows in memberships.items():
+        for event_id, created_at in rows:
+            Event.adjust_counter([event_id], through.counter, -1, made_at=[created_at])
+        if rows:
+            outbox.record_members(
+                outbox.MEMBERS_REMOVED,
+                through.relation,
+                [[event_id, instance.pk] for event_id, _ in rows],
+            )
+
+    freed = [event_id for event_id, _ in memberships.get(Participation, [])]
+    # Events the user organized may be gone in the same cascade
+    for event in Event.objects.filter(pk__in=freed):
+        event.promote_waitlist()
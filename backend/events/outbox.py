@@ -0,0 +1,144 @@
+"""
+Transactional outbox for changes to events, organizations and event members.
+
+Receivers in events.signals append an OutboxEntry for every change, inside
+the transaction that makes it, so an entry is committed exactly when its
+change is. Views that write membership rows directly, which sends no signal,
+call record_members() in their own transaction. Consumers subscribe to
+topics with @consumer and get the entries in id order, in batches. Each
+keeps a checkpoint; a failed batch is delivered again, so handlers must be
+idempotent.
+
+``settings.EVENTS_OUTBOX_EAGER`` picks how entries are delivered:
+- by default ``python manage.py process_outbox`` delivers them in the
+  background, and a request only pays for the INSERT;
+- eager mode hands each entry to its consumers as it is written, inside the
+  request, and needs no worker. The test-suite runs this way.
+
+The card and the cached lists of the event a request changes are refreshed
+and invalidated inline, by the receivers in events.signals and by
+Event.adjust_counter(), so that a list never serves a change its own writer
+cannot see yet. The outbox feeds the side effects that may lag behind: the
+search index, and the cards of every event of a renamed organization.
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboxCheckpoint, OutboxEntry
+
+EVENT_SAVED = "event.saved"
+EVENT_DELETED = "event.deleted"
+ORGANIZATION_SAVED = "organization.saved"
+ORGANIZATION_DELETED = "organization.deleted"
+MEMBERS_ADDED = "event.members.added"
+MEMBERS_REMOVED = "event.members.removed"
+
+# Entries younger than this are left for the next batch: ids are assigned
+# before commit, so a slow transaction can commit an id below one that a
+# consumer has already passed.
+SETTLE = timedelta(seconds=5)
+
+
+@dataclass(frozen=True)
+class Consumer:
+    name: str
+    topics: frozenset
+    handle: Callable
+
+
+_consumers: dict[str, Consumer] = {}
+
+
+def consumer(name, topics):
+    """Register ``handle(entries)`` to receive the entries of ``topics``."""
+
+    def register(handle):
+        _consumers[name] = Consumer(name, frozenset(topics), handle)
+        return handle
+
+    return register
+
+
+def get_consumers():
+    return dict(_consumers)
+
+
+def is_eager():
+    return getattr(settings, "EVENTS_OUTBOX_EAGER", False)
+
+
+def record(topic, payload):
+    """Append one entry; in eager mode, deliver it right away."""
+    return record_many(topic, [payload])[0]
+
+
+def record_members(topic, relation, pairs):
+    """
+    Record MEMBERS_ADDED or MEMBERS_REMOVED for ``[event_id, user_id]``
+    ``pairs`` of ``relation`` ("participants" or "interested_users").
+    """
+    return record(topic, {"relation": relation, "pairs": sorted(pairs)})
+
+
+def record_many(topic, payloads):
+    entries = OutboxEntry.objects.bulk_create(
+        OutboxEntry(topic=topic, payload=payload) for payload in payloads
+    )
+    if is_eager():
+        for item in _consumers.values():
+            if topic in item.topics:
+                item.handle(entries)
+    return entries
+
+
+def process(name, batch_size=500, settle=SETTLE):
+    """
+    Deliver the next batch of entries to consumer ``name`` and move its
+    checkpoint past them, in one transaction. Returns the number of entries
+    read, so callers can loop until it is zero.
+    """
+    item = _consumers[name]
+    with transaction.atomic():
+        checkpoint, _ = OutboxCheckpoint.objects.select_for_update().get_or_create(
+            consumer=name
+        )
+        entries = list(
+            OutboxEntry.objects.filter(
+                pk__gt=checkpoint.position,
+                created_at__lte=timezone.now() - settle,
+            ).order_by("pk")[:batch_size]
+        )
+        if not entries:
+            return 0
+        wanted = [entry for entry in entries if entry.topic in item.topics]
+        if wanted:
+            item.handle(wanted)
+        checkpoint.position = entries[-1].pk
+        checkpoint.save(update_fields=["position", "updated_at"])
+    return len(entries)
+
+
+def prune(older_than):
+    """
+    Delete entries older than ``older_than`` (a timedelta). Outside eager
+    mode, entries some consumer has not passed yet are kept.
+    """
+    entries = OutboxEntry.objects.filter(created_at__lt=timezone.now() - older_than)
+    if not is_eager():
+        positions = dict(
+            OutboxCheckpoint.objects.filter(consumer__in=_consumers).values_list(
+                "consumer", "position"
+            )
+        )
+        if set(positions) != set(_consumers):
+            return 0
+        if positions:
+            entries = entries.filter(pk__lte=min(positions.values()))
+    deleted, _ = entries.delete()
+    return deleted
@@ -0,0 +1,225 @@
+import heapq
+from base64 import b64decode, b64encode
+from itertools import islice
+from urllib import parse
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _position(event):
+    return event.date, event.pk
+
+
+def merge_events(querysets, descending=False):
+    """
+    Merge querysets that are each ordered by (date, id), or by (-date, -id)
+    with ``descending``, into one iterator in the same order.
+    """
+    return heapq.merge(*querysets, key=_position, reverse=descending)
+
+
+class EventKeysetPagination(BasePagination):
+    """
+    Opt-in keyset pagination over (date, id), matching Event.Meta.ordering.
+
+    Requests that send neither ``cursor`` nor ``page_size`` are not paginated,
+    so existing clients keep receiving a plain array. Paginated requests get
+    ``{"next", "previous", "results"}``; every page is a single range query
+    seeking from the cursor position, with no OFFSET and no COUNT(*).
+    """
+
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+    descending = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_querysets([queryset], request, view)
+
+    def paginate_querysets(self, querysets, request, view=None):
+        """
+        Paginate several querysets of events as one list, e.g. the hot
+        events and the archived ones. Each is read one page ahead and the
+        pages are merged by (date, id).
+        """
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor[2]
+
+        # Walking backwards scans the opposite direction, then flips the page
+        descending = self.descending != reverse
+        pages = []
+        for queryset in querysets:
+            queryset = queryset.order_by(*self._ordering(descending))
+            if cursor is not None:
+                queryset = queryset.filter(self._seek(cursor[0], cursor[1], descending))
+            pages.append(queryset[: self.page_size + 1])
+
+        if len(pages) == 1:
+            results = list(pages[0])
+        else:
+            merged = merge_events(pages, descending)
+            results = list(islice(merged, self.page_size + 1))
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.page = results
+        self.has_next = (cursor is not None) if reverse else has_more
+        self.has_previous = has_more if reverse else (cursor is not None)
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        last = self.page[-1]
+        return self.encode_cursor(self._key(last), last.pk, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        first = self.page[0]
+        return self.encode_cursor(self._key(first), first.pk, reverse=True)
+
+    def encode_cursor(self, key, pk, reverse):
+        tokens = {"d": self._format_key(key), "i": str(pk)}
+        if reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        """Return (key, pk, reverse) from the request, or None on the first page"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            key = self._parse_key(tokens["d"][0])
+            pk = int(tokens["i"][0])
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if key is None:
+            raise NotFound(self.invalid_cursor_message)
+        return key, pk, reverse
+
+    # The leading sort key, as read from an event and carried in the cursor
+
+    def _key(self, event):
+        return event.date
+
+    def _format_key(self, key):
+        return key.isoformat()
+
+    def _parse_key(self, text):
+        return parse_datetime(text)
+
+    def _ordering(self, descending):
+        if descending:
+            return ("-date", "-id")
+        return ("date", "id")
+
+    def _seek(self, date, pk, descending):
+        # The leading range on date keeps the predicate sargable on (date, id)
+        if descending:
+            return Q(date__lte=date) & (Q(date__lt=date) | Q(pk__lt=pk))
+        return Q(date__gte=date) & (Q(date__gt=date) | Q(pk__gt=pk))
+
+
+class ReverseEventKeysetPagination(EventKeysetPagination):
+    """Keyset pagination for lists ordered newest first, such as past events."""
+
+    descending = True
+
+
+class TrendingKeysetPagination(EventKeysetPagination):
+    """
+    Keyset pagination over (trending_score, id), highest score first.
+
+    Scores only change when someone joins or leaves an event, so a walk
+    sees each event once unless its score moves past the cursor meanwhile.
+    """
+
+    descending = True
+
+    def _key(self, event):
+        return event.trending_score
+
+    def _format_key(self, key):
+        return repr(key)
+
+    def _parse_key(self, text):
+        return float(text)
+
+    def _ordering(self, descending):
+        if descending:
+            return ("-trending_score", "-id")
+        return ("trending_score", "id")
+
+    def _seek(self, score, pk, descending):
+        if descending:
+            return Q(trending_score__lte=score) & (
+                Q(trending_score__lt=score) | Q(pk__lt=pk)
+            )
+        return Q(trending_score__gte=score) & (
+            Q(trending_score__gt=score) | Q(pk__gt=pk)
+        )
+
+
+def encode_sync_token(moment, pk):
+    """Opaque delta sync token for the position (updated_at, id)."""
+    querystring = parse.urlencode({"t": moment.isoformat(), "i": str(pk)})
+    return b64encode(querystring.encode("ascii")).decode("ascii")
+
+
+def decode_sync_token(token):
+    """Return (updated_at, id) from a delta sync token, or raise ValueError."""
+    try:
+        querystring = b64decode(token.encode("ascii")).decode("ascii")
+        tokens = parse.parse_qs(querystring, keep_blank_values=True)
+        moment = parse_datetime(tokens["t"][0])
+        pk = int(tokens["i"][0])
+    except (TypeError, ValueError, KeyError, UnicodeError):
+        raise ValueError("Invalid sync token")
+    if moment is None:
+        raise ValueError("Invalid sync token")
+    return moment, pk
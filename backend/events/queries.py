@@ -0,0 +1,97 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Exists, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import ArchivedMembership, Event
+
+User = get_user_model()
+
+
+def through_count(through):
+    """Correlated COUNT(*) over an Event M2M through table."""
+    counts = (
+        through.objects.filter(event_id=OuterRef("pk"))
+        .order_by()
+        .values("event_id")
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _through_membership(through, user):
+    """EXISTS over an Event M2M through table for a single user."""
+    return Exists(through.objects.filter(event_id=OuterRef("pk"), user_id=user.pk))
+
+
+def with_list_annotations(queryset, user=None, fields=None):
+    """
+    Attach everything EventSerializer reads to an Event queryset, so that
+    serializing the list costs a constant number of queries:
+    - organization and organizer are joined
+    - per-user membership flags are EXISTS subqueries
+    - interested user IDs are prefetched in a single extra query
+    Participant and interest counts are plain columns on Event.
+
+    ``fields`` is the set of serializer fields the response will contain
+    (see events.fieldsets); work for fields outside it is skipped. None
+    means every field.
+    """
+
+    def wanted(*names):
+        return fields is None or not fields.isdisjoint(names)
+
+    related = []
+    if wanted("organization_name", "organization_id"):
+        related.append("organization")
+    if wanted("organizer_name", "created_by"):
+        related.append("organizer")
+    if related:
+        queryset = queryset.select_related(*related)
+
+    if user is not None and user.is_authenticated:
+        if wanted("is_participating"):
+            queryset = queryset.annotate(
+                user_is_participating=_through_membership(
+                    Event.participants.through, user
+                )
+            )
+        if wanted("is_interested"):
+            queryset = queryset.annotate(
+                user_is_interested=_through_membership(
+                    Event.interested_users.through, user
+                )
+            )
+
+    if wanted("interested_users"):
+        queryset = queryset.prefetch_related(
+            Prefetch("interested_users", queryset=User.objects.only("id"))
+        )
+    return queryset
+
+
+def with_archive_annotations(queryset, user=None, fields=None):
+    """with_list_annotations, for an ArchivedEvent queryset."""
+
+    def wanted(*names):
+        return fields is None or not fields.isdisjoint(names)
+
+    related = []
+    if wanted("organization_name", "organization_id"):
+        related.append("organization")
+    if wanted("organizer_name", "created_by"):
+        related.append("organizer")
+    if related:
+        queryset = queryset.select_related(*related)
+
+    if user is not None and user.is_authenticated:
+        for field, relation in (
+            ("is_participating", "participants"),
+            ("is_interested", "interested_users"),
+        ):
+            if wanted(field):
+                members = ArchivedMembership.objects.filter(
+                    event_id=OuterRef("pk"), user_id=user.pk, relation=relation
+                )
+                queryset = queryset.annotate(**{f"user_{field}": Exists(members)})
+    return queryset
@@ -0,0 +1,160 @@
+"""
+Full-text search over events.
+
+The active backend is picked from ``settings.EVENT_SEARCH_BACKEND`` (a dotted
+path) or, by default, from the database vendor: SQLite gets an FTS5 index,
+anything else falls back to the original ``icontains`` filtering. Backends
+are kept in sync by the ``search-index`` outbox consumer in
+``events.consumers``.
+"""
+
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+from .models import Event
+
+FTS_TABLE = "events_event_fts"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class BasicSearchBackend:
+    """Unindexed substring search; works on every database."""
+
+    ranked = False
+
+    def normalize(self, query):
+        """A cache key for ``query``: queries that normalize alike match alike."""
+        return query.lower()
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(name__icontains=query)
+            | Q(description__icontains=query)
+            | Q(category__icontains=query)
+            | Q(location__icontains=query)
+            | Q(organization__name__icontains=query)
+        )
+
+    def index(self, event_ids):
+        pass
+
+    def remove(self, event_ids):
+        pass
+
+    def rebuild(self):
+        pass
+
+
+class SQLiteFTS5SearchBackend(BasicSearchBackend):
+    """
+    FTS5 index over event name, description, location, category and
+    organization name. Every term of the query is matched as a prefix, so
+    results narrow as the user types, and rows are ranked by bm25.
+    """
+
+    ranked = True
+    columns = ("name", "description", "location", "category", "organization_name")
+
+    def normalize(self, query):
+        # FTS5 folds case and only sees the terms
+        return self.match_expression(query).lower()
+
+    def match_expression(self, query):
+        """Turn free text into a safe FTS5 query of quoted prefix terms."""
+        terms = _TOKEN_RE.findall(query)
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def search(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return queryset.none()
+
+        # Join the FTS table so a single index scan yields both the matches
+        # and their bm25 rank; a correlated rank subquery would re-run the
+        # full-text query once per matching row.
+        table = Event._meta.db_table
+        return queryset.extra(
+            tables=[FTS_TABLE],
+            where=[f'{FTS_TABLE}.rowid = "{table}"."id"', f"{FTS_TABLE} MATCH %s"],
+            params=[match],
+            select={"search_rank": f"{FTS_TABLE}.rank"},
+            order_by=["search_rank", "date", "id"],
+        )
+
+    def index(self, event_ids):
+        event_ids = list(event_ids)
+        if not event_ids:
+            return
+        rows = Event.objects.filter(pk__in=event_ids).values_list(
+            "pk", "name", "description", "location", "category", "organization__name"
+        )
+        with connection.cursor() as cursor:
+            self._delete(cursor, event_ids)
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(self.columns)}) "
+                "VALUES (%s, %s, %s, %s, %s, %s)",
+                [
+                    tuple("" if value is None else value for value in row)
+                    for row in rows
+                ],
+            )
+
+    def remove(self, event_ids):
+        event_ids = list(event_ids)
+        if event_ids:
+            with connection.cursor() as cursor:
+                self._delete(cursor, event_ids)
+
+    def rebuild(self, batch_size=2000):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        ids = Event.objects.order_by("pk").values_list("pk", flat=True)
+        batch = []
+        for event_id in ids.iterator(chunk_size=batch_size):
+            batch.append(event_id)
+            if len(batch) == batch_size:
+                self.index(batch)
+                batch = []
+        self.index(batch)
+
+    def _delete(self, cursor, event_ids):
+        placeholders = ", ".join(["%s"] * len(event_ids))
+        cursor.execute(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})", event_ids
+        )
+
+
+def fts5_available():
+    return connection.vendor == "sqlite" and _has_fts_table(
+        str(connection.settings_dict["NAME"])
+    )
+
+
+@lru_cache(maxsize=None)
+def _has_fts_table(database_name):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [FTS_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+@lru_cache(maxsize=None)
+def _load_backend(path):
+    return import_string(path)()
+
+
+def get_search_backend():
+    path = getattr(settings, "EVENT_SEARCH_BACKEND", None)
+    if path:
+        return _load_backend(path)
+    if fts5_available():
+        return _load_backend("events.search.SQLiteFTS5SearchBackend")
+    return _load_backend("events.search.BasicSearchBackend")
@@ -2,21 +2,20 @@ from django.contrib.auth import get_user_model
 from djoser.serializers import UserSerializer as BaseUserSerializer
 from rest_framework import serializers
 
-from .models import Event
+from .fieldsets import SparseFieldsetsMixin, selected_fields
+from .models import Event, EventSeries
 
 User = get_user_model()
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     organizer_name = serializers.CharField(source="organizer.username", read_only=True)
     created_by = serializers.CharField(source="organizer.username", read_only=True)
     organization_name = serializers.SerializerMethodField()
     organization_id = serializers.SerializerMethodField()
-    participant_count = serializers.SerializerMethodField()
-    interest_count = serializers.SerializerMethodField()
     is_participating = serializers.SerializerMethodField()
     is_interested = serializers.SerializerMethodField()
-    is_full = serializers.SerializerMethodField()
+    is_full = serializers.BooleanField(read_only=True)
 
     def get_organization_name(self, obj):
         if obj.organization:
@@ -28,29 +27,24 @@ class EventSerializer(serializers.ModelSerializer):
             return obj.organization.id
         return None
 
-    def get_participant_count(self, obj):
-        return obj.participants.count()
-
-    def get_interest_count(self, obj):
-        return obj.interested_users.count()
-
     def get_is_participating(self, obj):
         request = self.context.get("request")
         if request and hasattr(request, "user") and request.user.is_authenticated:
+            annotated = getattr(obj, "user_is_participating", None)
+            if annotated is not None:
+                return annotated
             return obj.participants.filter(pk=request.user.pk).exists()
         return False
 
     def get_is_interested(self, obj):
         request = self.context.get("request")
         if request and hasattr(request, "user") and request.user.is_authenticated:
+            annotated = getattr(obj, "user_is_interested", None)
+            if annotated is not None:
+                return annotated
             return obj.interested_users.filter(pk=request.user.pk).exists()
         return False
 
-    def get_is_full(self, obj):
-        if obj.capacity is None or obj.capacity == 0:
-            return False
-        return obj.participants.count() >= obj.capacity
-
     def validate_capacity(self, value):
         """Convert 0 or empty string to None for unlimited capacity"""
         if value == 0 or value == "" or value is None:
@@ -88,8 +82,10 @@ class EventSerializer(serializers.ModelSerializer):
             "is_participating",
             "is_interested",
             "is_full",
+            "series",
         ]
         read_only_fields = [
+            "series",
             "organizer",
             "organizer_name",
             "created_by",
@@ -106,6 +102,147 @@ class EventSerializer(serializers.ModelSerializer):
         }
 
 
+class EventListSerializer(EventSerializer):
+    """
+    Read-only shape for event lists. It leaves out ``interested_users``,
+    whose ids grow with every interested user of every event listed;
+    ``interest_count`` carries the number. The detail endpoint keeps the
+    full EventSerializer.
+    """
+
+    class Meta(EventSerializer.Meta):
+        fields = [
+            name for name in EventSerializer.Meta.fields if name != "interested_users"
+        ]
+        read_only_fields = fields
+        extra_kwargs = {}
+
+
+class PublicEventListSerializer(EventListSerializer):
+    """
+    EventListSerializer without the per-user flags, so a list is the same
+    for every client. Clients merge in EventUserStateView's id sets.
+    """
+
+    class Meta(EventListSerializer.Meta):
+        fields = [
+            name
+            for name in EventListSerializer.Meta.fields
+            if name not in ("is_participating", "is_interested")
+        ]
+        read_only_fields = fields
+
+
+def event_fields(request, serializer_class=EventSerializer, any_method=False):
+    """The fields of ``serializer_class`` that a read asks for."""
+    fields = serializer_class.Meta.fields
+    selected = selected_fields(request, fields, any_method)
+    return set(fields) if selected is None else selected
+
+
+class EventBulkRowSerializer(serializers.ModelSerializer):
+    """
+    One row of a bulk upload. The organization is a plain id here: the view
+    resolves and permission-checks every organization of the batch at once.
+    """
+
+    organization = serializers.IntegerField(required=False)
+
+    validate_capacity = EventSerializer.validate_capacity
+
+    class Meta:
+        model = Event
+        fields = [
+            "name",
+            "date",
+            "location",
+            "description",
+            "capacity",
+            "category",
+            "organization",
+        ]
+
+
+class EventSeriesSerializer(serializers.ModelSerializer):
+    organizer_name = serializers.CharField(source="organizer.username", read_only=True)
+    organization_name = serializers.CharField(
+        source="organization.name", read_only=True
+    )
+
+    validate_capacity = EventSerializer.validate_capacity
+
+    def validate_interval(self, value):
+        if value < 1:
+            raise serializers.ValidationError("Interval must be at least 1.")
+        return value
+
+    def validate(self, attrs):
+        start = attrs.get("start", getattr(self.instance, "start", None))
+        until = attrs.get("until", getattr(self.instance, "until", None))
+        if until is not None and start is not None and until < start:
+            raise serializers.ValidationError(
+                {"until": ["The series cannot end before it starts."]}
+            )
+        return attrs
+
+    class Meta:
+        model = EventSeries
+        fields = [
+            "id",
+            "name",
+            "location",
+            "description",
+            "category",
+            "capacity",
+            "status",
+            "organizer",
+            "organizer_name",
+            "organization",
+            "organization_name",
+            "start",
+            "frequency",
+            "interval",
+            "until",
+            "created_at",
+        ]
+        read_only_fields = ["organizer", "status", "created_at"]
+
+
+class EventOccurrenceSerializer(serializers.ModelSerializer):
+    """
+    An occurrence of a series that is not stored as an Event yet, being past
+    the materialization horizon. It has no id until someone registers for it.
+    """
+
+    organizer_name = serializers.CharField(source="organizer.username", read_only=True)
+    organization_name = serializers.CharField(
+        source="organization.name", read_only=True
+    )
+    is_full = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Event
+        fields = [
+            "id",
+            "series",
+            "name",
+            "date",
+            "location",
+            "description",
+            "capacity",
+            "category",
+            "organizer",
+            "organizer_name",
+            "organization",
+            "organization_name",
+            "status",
+            "participant_count",
+            "interest_count",
+            "is_full",
+        ]
+        read_only_fields = fields
+
+
 class UserSerializer(BaseUserSerializer):
     role = serializers.CharField(source="profile.role", read_only=True)
 
@@ -0,0 +1,170 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import Organization
+
+from . import outbox
+from .archive import is_archiving
+from .cache import (
+    invalidate_event_lists,
+    invalidate_events,
+    invalidate_organization_list,
+)
+from .models import Event, EventCard, EventTombstone
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Event)
+def record_event_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    outbox.record(outbox.EVENT_SAVED, {"id": instance.pk, "created": created})
+
+
+@receiver(post_delete, sender=Event)
+def record_event_deleted(sender, instance, **kwargs):
+    outbox.record(
+        outbox.EVENT_DELETED,
+        {"id": instance.pk, "organization_id": instance.organization_id},
+    )
+
+
+@receiver(post_delete, sender=Event)
+def record_event_deletion(sender, instance, **kwargs):
+    # Archived events are still there for delta sync clients
+    if is_archiving():
+        return
+    EventTombstone.objects.create(event_id=instance.pk)
+
+
+@receiver(post_save, sender=Organization)
+def record_organization_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    outbox.record(outbox.ORGANIZATION_SAVED, {"id": instance.pk, "created": created})
+
+
+@receiver(post_delete, sender=Organization)
+def record_organization_deleted(sender, instance, **kwargs):
+    outbox.record(outbox.ORGANIZATION_DELETED, {"id": instance.pk})
+
+
+def _relation(through):
+    if through is Event.participants.through:
+        return "participants"
+    return "interested_users"
+
+
+@receiver(m2m_changed, sender=Event.participants.through)
+@receiver(m2m_changed, sender=Event.interested_users.through)
+def record_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # Only the related managers send these. The views write the through rows
+    # directly, which sends no signal at all, and record their changes
+    # themselves.
+    column = "user_id" if reverse else "event_id"
+    if action == "pre_clear":
+        # clear() reports no pks, so note them while the rows still exist
+        other = "event_id" if reverse else "user_id"
+        instance._outbox_cleared = set(
+            sender.objects.filter(**{column: instance.pk}).values_list(other, flat=True)
+        )
+        return
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_outbox_cleared", None)
+        topic = outbox.MEMBERS_REMOVED
+    elif action == "post_add":
+        topic = outbox.MEMBERS_ADDED
+    elif action == "post_remove":
+        topic = outbox.MEMBERS_REMOVED
+    else:
+        return
+    if not pk_set:
+        return
+    pairs = [[pk, instance.pk] if reverse else [instance.pk, pk] for pk in pk_set]
+    outbox.record_members(topic, _relation(sender), pairs)
+
+
+@receiver(post_save, sender=Event)
+def refresh_event_card(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    EventCard.refresh([instance.pk])
+
+
+# The cards of a renamed organization's events are rewritten by the
+# organization-cards outbox consumer, see events.consumers
+
+
+@receiver(post_save, sender=User)
+def refresh_cards_for_organizer(
+    sender, instance, created, update_fields, raw=False, **kwargs
+):
+    if raw or created or (update_fields and "username" not in update_fields):
+        return
+    stale = EventCard.objects.filter(organizer=instance).exclude(
+        organizer_name=instance.username
+    )
+    Event.touch(list(stale.values_list("event_id", flat=True)))
+    stale.update(organizer_name=instance.username)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_lists_for_event(sender, instance, **kwargs):
+    invalidate_event_lists([instance.organization_id])
+    # The organization list embeds event counts
+    invalidate_organization_list()
+
+
+@receiver(m2m_changed, sender=Event.participants.through)
+@receiver(m2m_changed, sender=Event.interested_users.through)
+def invalidate_lists_for_members(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate_events([instance.pk], [instance.organization_id])
+    elif pk_set:
+        invalidate_events(pk_set)
+    else:
+        invalidate_event_lists()
+
+
+@receiver(post_save, sender=Organization)
+def invalidate_lists_for_organization(sender, instance, created, **kwargs):
+    # Lists embed the organization name
+    if not created:
+        invalidate_event_lists([instance.pk])
+
+
+@receiver(post_save, sender=User)
+def invalidate_lists_for_organizer(sender, instance, created, update_fields, **kwargs):
+    # Lists embed the organizer's username; logins only touch last_login
+    if created or (update_fields and "username" not in update_fields):
+        return
+    if instance.organized_events.exists():
+        invalidate_event_lists(
+            instance.organized_events.values_list("organization_id", flat=True)
+        )
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(m2m_changed, sender=Organization.followers.through)
+def invalidate_organization_list_for_change(sender, **kwargs):
+    if kwargs.get("action", "post_").startswith("post_"):
+        invalidate_organization_list()
+
+
+@receiver(post_save, sender=User)
+def invalidate_organization_list_for_owner(
+    sender, instance, created, update_fields, **kwargs
+):
+    # The organization list embeds the owner's full name
+    if created or (
+        update_fields and not {"first_name", "last_name"} & set(update_fields)
+    ):
+        return
+    if instance.owned_organizations.exists():
+        invalidate_organization_list()
@@ -0,0 +1,197 @@
+"""Tests for archiving old events and reading them back"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.archive import archive_boundary, archive_events
+from events.models import (
+    ArchiveBoundary,
+    ArchivedEvent,
+    ArchivedMembership,
+    Event,
+    EventCard,
+    EventTombstone,
+)
+
+User = get_user_model()
+
+
+class ArchiveEventsTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        now = timezone.now()
+        self.events = {}
+        for name, days in (
+            ("Oldest", 500),
+            ("Old", 400),
+            ("Recent", 30),
+            ("Yesterday", 1),
+        ):
+            self.events[name] = Event.objects.create(
+                name=name,
+                date=now - timedelta(days=days),
+                organizer=self.user,
+                organization=self.organization,
+            )
+        self.events["Old"].participants.add(self.user)
+        self.events["Oldest"].interested_users.add(self.user)
+
+    def _names(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data
+        if isinstance(data, dict):
+            data = data["results"]
+        return [item["name"] for item in data]
+
+    def test_moves_old_events_with_their_members(self):
+        self.assertEqual(archive_events(batch_size=1), 2)
+
+        old = self.events["Old"]
+        self.assertFalse(Event.objects.filter(pk=old.pk).exists())
+        self.assertFalse(EventCard.objects.filter(event_id=old.pk).exists())
+        # Still there for delta sync clients, only moved
+        self.assertFalse(EventTombstone.objects.filter(event_id=old.pk).exists())
+
+        archived = ArchivedEvent.objects.get(pk=old.pk)
+        self.assertEqual(archived.name, "Old")
+        self.assertEqual(archived.participant_count, 1)
+        self.assertEqual(
+            set(ArchivedMembership.objects.values_list("event_id", "relation")),
+            {
+                (old.pk, "participants"),
+                (self.events["Oldest"].pk, "interested_users"),
+            },
+        )
+        self.assertEqual(archive_boundary(), archived.date)
+        self.assertEqual(
+            ArchiveBoundary.objects.get(organization=self.organization).date,
+            archived.date,
+        )
+        # Nothing left to move
+        self.assertEqual(archive_events(), 0)
+
+    def test_past_list_merges_the_archive(self):
+        archive_events()
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("past-events"))
+        self.assertEqual(
+            self._names(response), ["Yesterday", "Recent", "Old", "Oldest"]
+        )
+        flags = {item["name"]: item["is_participating"] for item in response.data}
+        self.assertTrue(flags["Old"])
+        self.assertFalse(flags["Recent"])
+
+    def test_past_list_pages_across_the_archive(self):
+        archive_events()
+        names = []
+        response = self.client.get(reverse("past-events"), {"page_size": 3})
+        while True:
+            names += self._names(response)
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+        self.assertEqual(names, ["Yesterday", "Recent", "Old", "Oldest"])
+
+    def test_recent_ranges_skip_the_archive(self):
+        archive_events()
+        archive_boundary()
+        since = (timezone.now() - timedelta(days=60)).date().isoformat()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("past-events"), {"date_from": since})
+        self.assertEqual(self._names(response), ["Yesterday", "Recent"])
+        self.assertFalse([q for q in queries if '"events_archivedevent"' in q["sql"]])
+
+    def test_organization_events_include_the_archive(self):
+        archive_events()
+        url = reverse("organizations-events", args=[self.organization.pk])
+        self.assertEqual(
+            self._names(self.client.get(url)),
+            ["Oldest", "Old", "Recent", "Yesterday"],
+        )
+
+    def test_organization_without_archive_skips_it(self):
+        url = reverse("organizations-events", args=[self.organization.pk])
+        with CaptureQueriesContext(connection) as queries:
+            self._names(self.client.get(url))
+        self.assertFalse([q for q in queries if '"events_archivedevent"' in q["sql"]])
+
+    def test_member_lists_include_the_archive(self):
+        self.events["Recent"].participants.add(self.user)
+        archive_events()
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(
+            self._names(self.client.get(reverse("user-registered-events"))),
+            ["Old", "Recent"],
+        )
+        self.assertEqual(
+            self._names(self.client.get(reverse("user-interested-events"))),
+            ["Oldest"],
+        )
+
+        names = []
+        url = reverse("user-registered-events")
+        response = self.client.get(url, {"page_size": 1})
+        while True:
+            names += self._names(response)
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+        self.assertEqual(names, ["Old", "Recent"])
+
+    def test_detail_reads_the_archive(self):
+        archive_events()
+        old = self.events["Old"]
+        self.client.force_authenticate(user=self.user)
+        url = reverse("event-detail", args=[old.pk])
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Old")
+        self.assertEqual(response.data["organization_name"], "Test Organization")
+        self.assertTrue(response.data["is_participating"])
+        self.assertEqual(response.data["participant_count"], 1)
+        self.assertEqual(response.data["interested_users"], [])
+
+        response = self.client.patch(url, {"name": "Renamed"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(ArchivedEvent.objects.get(pk=old.pk).name, "Old")
+
+    def test_profile_lists_archived_participation(self):
+        self.events["Recent"].participants.add(self.user)
+        archive_events()
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("profile-me"))
+        self.assertEqual(
+            response.data["participating_events"],
+            [self.events["Old"].pk, self.events["Recent"].pk],
+        )
+
+    def test_event_count_includes_the_archive(self):
+        url = reverse("organizations-detail", args=[self.organization.pk])
+        self.assertEqual(self.client.get(url).data["event_count"], 4)
+        archive_events()
+        self.assertEqual(self.client.get(url).data["event_count"], 4)
+
+    def test_command(self):
+        out = StringIO()
+        call_command("archive_events", "--days", "20", stdout=out)
+        self.assertIn("Archived 3 event(s)", out.getvalue())
+        self.assertEqual(
+            list(Event.objects.values_list("name", flat=True)), ["Yesterday"]
+        )
@@ -0,0 +1,139 @@
+"""Tests for bulk event creation"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization, Profile
+from events.models import Event
+
+User = get_user_model()
+
+
+class BulkCreateEventTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username="owner", email="owner@example.com", password="pass123"
+        )
+        self.owner.profile.role = Profile.Role.ORGANIZER
+        self.owner.profile.save()
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.owner
+        )
+        self.other = Organization.objects.create(
+            name="Other Organization",
+            owner=User.objects.create_user(
+                username="other", email="other@example.com", password="pass123"
+            ),
+        )
+        self.url = reverse("event-bulk-create")
+        self.client.force_authenticate(user=self.owner)
+
+    def _rows(self, count, **fields):
+        start = timezone.now() + timedelta(days=1)
+        return [
+            {
+                "name": f"Event {i}",
+                "date": (start + timedelta(days=i)).isoformat(),
+                "category": "SOCIAL",
+                **fields,
+            }
+            for i in range(count)
+        ]
+
+    def test_json_array(self):
+        rows = self._rows(3, organization=self.organization.pk)
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 3)
+        events = Event.objects.filter(pk__in=response.data["ids"])
+        self.assertEqual(events.count(), 3)
+        self.assertTrue(all(event.organizer == self.owner for event in events))
+
+    def test_batch_level_organization(self):
+        body = {"organization": self.organization.pk, "events": self._rows(2)}
+        response = self.client.post(self.url, body, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.organization.events.count(), 2)
+
+    def test_csv_upload(self):
+        csv = (
+            "name,date,category,capacity,location\n"
+            "Picnic,2030-05-01T12:00:00Z,SOCIAL,,Park\n"
+            "Hike,2030-05-02T09:00:00Z,SPORTS,20,\n"
+        )
+        upload = SimpleUploadedFile("events.csv", csv.encode(), "text/csv")
+        response = self.client.post(
+            self.url,
+            {"organization": self.organization.pk, "file": upload},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        picnic, hike = Event.objects.order_by("date")
+        self.assertIsNone(picnic.capacity)
+        self.assertEqual(picnic.location, "Park")
+        self.assertEqual(hike.capacity, 20)
+
+    def test_invalid_rows_reject_the_batch(self):
+        rows = self._rows(3, organization=self.organization.pk)
+        rows[1]["category"] = "UNKNOWN"
+        rows[2]["organization"] = self.other.pk
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["row"] for error in response.data["errors"]], [2, 3])
+        self.assertIn("category", response.data["errors"][0]["errors"])
+        self.assertIn("organization", response.data["errors"][1]["errors"])
+        self.assertFalse(Event.objects.exists())
+
+    def test_collaborator_can_bulk_create(self):
+        collaborator = User.objects.create_user(
+            username="collaborator", email="collab@example.com", password="pass"
+        )
+        self.other.collaborators.add(collaborator)
+        self.client.force_authenticate(user=collaborator)
+        rows = self._rows(2, organization=self.other.pk)
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        def count(rows):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.url, rows, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(context.captured_queries)
+
+        organization = self.organization.pk
+        self.assertEqual(
+            count(self._rows(2, organization=organization)),
+            count(self._rows(50, organization=organization)),
+        )
+
+    def test_created_events_are_searchable(self):
+        rows = self._rows(1, organization=self.organization.pk, name="Karaoke")
+        self.client.post(self.url, rows, format="json")
+        response = self.client.get(reverse("upcoming-events"), {"search": "karaoke"})
+        self.assertEqual(len(response.data), 1)
+
+    def test_empty_and_oversized_batches(self):
+        response = self.client.post(self.url, [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        rows = self._rows(501, organization=self.organization.pk)
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.post(self.url, self._rows(1), format="json")
+        self.assertIn(
+            response.status_code,
+            [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN],
+        )
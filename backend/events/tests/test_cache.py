@@ -0,0 +1,184 @@
+"""Tests for the anonymous event list cache"""
+
+import json
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization, Profile
+from events import cache as list_cache
+from events.checks import check_shared_cache
+from events.models import Event
+
+User = get_user_model()
+
+
+class AnonymousListCacheTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organizer.profile.role = Profile.Role.ORGANIZER
+        self.organizer.profile.save()
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        self.event = self._event("Music Night")
+        self.url = reverse("upcoming-events")
+
+    def _event(self, name, organization=None, **fields):
+        fields.setdefault("date", timezone.now() + timedelta(days=1))
+        return Event.objects.create(
+            name=name,
+            organizer=self.organizer,
+            organization=organization or self.organization,
+            **fields,
+        )
+
+    def _get(self, url=None, params=None):
+        response = self.client.get(url or self.url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_second_request_is_a_hit(self):
+        first = self._get()
+        second = self._get()
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(json.loads(second.content), json.loads(first.content))
+        self.assertEqual(
+            list_cache.get_stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5}
+        )
+
+    def test_query_parameters_are_normalized(self):
+        self._get(params={"category": ["SOCIAL", "SPORTS"], "search": "music"})
+        response = self._get(
+            params={"search": "music", "category": ["SPORTS", "SOCIAL"]}
+        )
+        self.assertEqual(response["X-Cache"], "HIT")
+        response = self._get(params={"search": "night"})
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    def test_authenticated_requests_bypass_cache(self):
+        self.client.force_authenticate(user=self.organizer)
+        self._get()
+        response = self._get()
+        self.assertNotIn("X-Cache", response)
+        self.assertEqual(list_cache.get_stats()["hits"], 0)
+
+    def test_event_save_retires_lists(self):
+        self._get()
+        self.event.name = "Jazz Night"
+        self.event.save()
+        response = self._get()
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data[0]["name"], "Jazz Night")
+
+        self._event("Picnic")
+        self.assertEqual(len(self._get().data), 2)
+
+        self.event.delete()
+        self.assertEqual(len(self._get().data), 1)
+
+    def test_registration_retires_lists(self):
+        self._get()
+        attendee = User.objects.create_user(username="attendee", password="pass")
+        self.client.force_authenticate(user=attendee)
+        url = reverse("event-participate", kwargs={"pk": self.event.pk})
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_201_CREATED)
+
+        self.client.force_authenticate(user=None)
+        response = self._get()
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data[0]["participant_count"], 1)
+
+    def test_m2m_changes_retire_lists(self):
+        attendee = User.objects.create_user(username="attendee", password="pass")
+        self._get()
+        attendee.interested_events.add(self.event)
+        self.assertEqual(self._get().data[0]["interest_count"], 1)
+
+    def test_organization_rename_retires_lists(self):
+        self._get()
+        self.organization.name = "Renamed"
+        self.organization.save()
+        self.assertEqual(self._get().data[0]["organization_name"], "Renamed")
+
+    def test_organization_pages_are_versioned_separately(self):
+        page = reverse("organizations-events", kwargs={"pk": self.organization.pk})
+        other = Organization.objects.create(name="Other", owner=self.organizer)
+        self._get(page)
+        self._get()
+
+        self._event("Elsewhere", organization=other)
+        self.assertEqual(self._get(page)["X-Cache"], "HIT")
+        self.assertEqual(self._get()["X-Cache"], "MISS")
+
+        self._event("Here")
+        response = self._get(page)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.data), 2)
+
+    def test_commit_bumps_version_again(self):
+        version = list_cache.get_version()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            list_cache.invalidate_event_lists()
+            self.assertEqual(list_cache.get_version(), version + 1)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(list_cache.get_version(), version + 2)
+
+    def test_counter_changes_keep_other_entries(self):
+        other = self._event("Picnic")
+        version = list_cache.get_version()
+
+        def build(ids):
+            built.extend(ids)
+            return {pk: {"id": pk} for pk in ids}
+
+        built = []
+        list_cache.event_fragments([self.event.pk, other.pk], build)
+        Event.adjust_counter([self.event.pk], "interest_count", 1)
+        # Search results and facets stay; only this event's fragment goes
+        self.assertEqual(list_cache.get_version(), version)
+        built = []
+        list_cache.event_fragments([self.event.pk, other.pk], build)
+        self.assertEqual(built, [self.event.pk])
+
+    def test_entries_expire_when_next_event_starts(self):
+        self._event("Soon", date=timezone.now() + timedelta(seconds=30))
+        self.assertLessEqual(list_cache._seconds_until_next_change(), 30)
+
+    def test_stats_endpoint_is_staff_only(self):
+        url = reverse("event-list-cache-stats")
+        self.client.force_authenticate(user=self.organizer)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        staff = User.objects.create_user(username="staff", password="pass")
+        staff.is_staff = True
+        staff.save()
+        self.client.force_authenticate(user=staff)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"hits", "misses", "hit_rate"})
+
+
+class SharedCacheCheckTest(SimpleTestCase):
+    def test_warns_about_a_per_process_cache(self):
+        self.assertEqual([w.id for w in check_shared_cache(None)], ["events.W001"])
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379/0",
+            }
+        }
+    )
+    def test_shared_cache(self):
+        self.assertEqual(check_shared_cache(None), [])
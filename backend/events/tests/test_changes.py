@@ -0,0 +1,111 @@
+"""Tests for the delta sync endpoint"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+from events.views import EventChangesView
+
+User = get_user_model()
+
+
+@mock.patch.object(EventChangesView, "settle", timedelta(0))
+class EventChangesViewTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.events = [
+            Event.objects.create(
+                name=f"Event {i}",
+                date=timezone.now() + timedelta(days=i + 1),
+                organizer=self.user,
+                organization=self.organization,
+            )
+            for i in range(3)
+        ]
+        self.url = reverse("event-changes")
+
+    def _sync(self, since=None):
+        response = self.client.get(self.url, {"since": since} if since else {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_initial_sync_returns_everything(self):
+        data = self._sync()
+        self.assertEqual(
+            [event["id"] for event in data["changed"]],
+            [event.pk for event in self.events],
+        )
+        self.assertEqual(data["deleted"], [])
+        self.assertFalse(data["has_more"])
+
+    def test_only_changes_since_token(self):
+        token = self._sync()["next"]
+        self.assertEqual(self._sync(token)["changed"], [])
+
+        first, second, third = self.events
+        first.status = "Cancelled"
+        first.save()
+        second.participants.add(self.user)
+        deleted_pk = third.pk
+        third.delete()
+
+        data = self._sync(token)
+        changed = {event["id"]: event for event in data["changed"]}
+        self.assertEqual(set(changed), {first.pk, second.pk})
+        self.assertEqual(changed[first.pk]["status"], "Cancelled")
+        self.assertEqual(changed[second.pk]["participant_count"], 1)
+        self.assertEqual(data["deleted"], [deleted_pk])
+
+    def test_deleted_event_with_a_big_id(self):
+        token = self._sync()["next"]
+        # Event ids are 64-bit, and so are the tombstones that keep them
+        pk = 2**40
+        Event.objects.create(
+            pk=pk,
+            name="Big",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.user,
+            organization=self.organization,
+        ).delete()
+        self.assertEqual(self._sync(token)["deleted"], [pk])
+
+    def test_organization_rename_is_a_change(self):
+        token = self._sync()["next"]
+        self.organization.name = "Renamed"
+        self.organization.save()
+        changed = self._sync(token)["changed"]
+        self.assertEqual(len(changed), 3)
+        self.assertEqual({e["organization_name"] for e in changed}, {"Renamed"})
+
+    def test_pages(self):
+        with mock.patch.object(EventChangesView, "page_size", 2):
+            first = self._sync()
+            self.assertTrue(first["has_more"])
+            self.assertEqual(len(first["changed"]), 2)
+            second = self._sync(first["next"])
+        self.assertFalse(second["has_more"])
+        self.assertEqual(
+            [event["id"] for event in first["changed"] + second["changed"]],
+            [event.pk for event in self.events],
+        )
+
+    def test_recent_changes_are_held_back(self):
+        with mock.patch.object(EventChangesView, "settle", timedelta(minutes=1)):
+            self.assertEqual(self._sync()["changed"], [])
+
+    def test_invalid_token(self):
+        response = self.client.get(self.url, {"since": "not-a-token"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,47 @@
+"""Concurrency tests for event registration"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from accounts.models import Organization
+from events.management.benchmarks import run_registration_stress, seed_users
+from events.models import Event
+
+User = get_user_model()
+
+
+class ParticipateConcurrencyTest(TransactionTestCase):
+    """
+    Concurrent registrations must never oversell an event. Runs with
+    pytest --ds=backend.settings_concurrency, which puts the test database
+    in a file.
+    """
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("needs a file-backed test database for real locking")
+        owner = User.objects.create_user(username="owner", password="pass123")
+        organization = Organization.objects.create(name="Erasmus Trips", owner=owner)
+        self.event = Event.objects.create(
+            name="Popular Trip",
+            date=timezone.now() + timedelta(days=7),
+            organizer=owner,
+            organization=organization,
+            capacity=10,
+        )
+        self.users = seed_users(60)
+
+    def test_no_oversell_under_concurrent_registrations(self):
+        result = run_registration_stress(self.event, self.users, workers=8)
+
+        self.event.refresh_from_db()
+        self.assertEqual(result["errors"], 0)
+        self.assertGreater(result["per_second"], 0)
+        self.assertEqual(result["registered"], 10)
+        self.assertEqual(result["rejected"], 50)
+        self.assertEqual(self.event.participant_count, 10)
+        self.assertEqual(self.event.participants.count(), 10)
@@ -0,0 +1,93 @@
+"""Tests for conditional GETs on the event lists"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+
+User = get_user_model()
+
+
+class EventListConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.event = Event.objects.create(
+            name="Music Night",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.user,
+            organization=self.organization,
+        )
+
+    def _revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_list_is_not_modified(self):
+        for name in ("all-events", "upcoming-events", "past-events"):
+            url = reverse(name)
+            etag = self.client.get(url)["ETag"]
+            with CaptureQueriesContext(connection) as context:
+                response = self._revalidate(url, etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response.content, b"")
+            # Only the next-start lookup; no list query, no serializer
+            self.assertEqual(len(context.captured_queries), 1)
+
+    def test_change_invalidates_etag(self):
+        url = reverse("upcoming-events")
+        etag = self.client.get(url)["ETag"]
+        self.event.name = "Jazz Night"
+        self.event.save()
+        response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data[0]["name"], "Jazz Night")
+
+    def test_etag_is_per_user(self):
+        url = reverse("upcoming-events")
+        anonymous = self.client.get(url)["ETag"]
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(
+            self._revalidate(url, anonymous).status_code, status.HTTP_200_OK
+        )
+
+    def test_registration_invalidates_etag(self):
+        self.client.force_authenticate(user=self.user)
+        url = reverse("upcoming-events")
+        etag = self.client.get(url)["ETag"]
+        participate = reverse("event-participate", kwargs={"pk": self.event.pk})
+        self.client.post(participate)
+
+        response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data[0]["is_participating"])
+
+    def test_event_start_invalidates_etag(self):
+        # Authenticated, so the anonymous response cache stays out of the way
+        self.client.force_authenticate(user=self.user)
+        url = reverse("upcoming-events")
+        self.event.date = timezone.now() + timedelta(seconds=30)
+        self.event.save()
+        etag = self.client.get(url)["ETag"]
+
+        # The clock passes the start: nothing is written, but the start time
+        # the tag was built on is now behind us
+        later = timezone.now() + timedelta(minutes=1)
+        with mock.patch("django.utils.timezone.now", lambda: later):
+            response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
@@ -0,0 +1,180 @@
+"""Tests for the denormalized participant and interest counters"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events import trending
+from events.cache import get_counts_version
+from events.models import Event, WaitlistEntry
+
+User = get_user_model()
+
+
+class CounterSignalTest(TestCase):
+    """Counters follow changes made through the M2M managers"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        self.event = Event.objects.create(
+            name="Test Event",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.organizer,
+            organization=self.organization,
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"user{i}", email=f"user{i}@example.com", password="pass"
+            )
+            for i in range(3)
+        ]
+
+    def _stored(self, field):
+        return Event.objects.values_list(field, flat=True).get(pk=self.event.pk)
+
+    def test_add_and_remove(self):
+        self.event.participants.add(*self.users)
+        self.assertEqual(self.event.participant_count, 3)
+        self.assertEqual(self._stored("participant_count"), 3)
+
+        # Re-adding an existing participant is not double counted
+        self.event.participants.add(self.users[0])
+        self.assertEqual(self._stored("participant_count"), 3)
+
+        # Removing a non-participant is not counted either
+        self.event.participants.remove(self.users[0], self.organizer)
+        self.assertEqual(self._stored("participant_count"), 2)
+
+    def test_clear(self):
+        self.event.interested_users.add(*self.users)
+        self.event.interested_users.clear()
+        self.assertEqual(self._stored("interest_count"), 0)
+
+    def test_reverse_side(self):
+        other = Event.objects.create(
+            name="Other Event",
+            date=timezone.now() + timedelta(days=2),
+            organizer=self.organizer,
+            organization=self.organization,
+        )
+        user = self.users[0]
+        user.participating_events.add(self.event, other)
+        self.assertEqual(self._stored("participant_count"), 1)
+
+        user.participating_events.remove(self.event)
+        self.assertEqual(self._stored("participant_count"), 0)
+
+        user.participating_events.clear()
+        other.refresh_from_db()
+        self.assertEqual(other.participant_count, 0)
+
+    def test_deleting_a_user(self):
+        self.event.capacity = 1
+        self.event.save()
+        leaving, queued = self.users[:2]
+        self.event.participants.add(leaving)
+        self.event.interested_users.add(leaving)
+        WaitlistEntry.objects.create(event=self.event, user=queued)
+
+        # The memberships go in a cascade, without m2m_changed
+        leaving.delete()
+        self.assertEqual(self._stored("interest_count"), 0)
+        # The freed seat went to the head of the waitlist, whose participation
+        # is all the trending score has left
+        self.assertAlmostEqual(
+            trending.decayed(self._stored("trending_score")),
+            trending.PARTICIPANT_WEIGHT,
+            places=3,
+        )
+        self.assertEqual(list(self.event.participants.all()), [queued])
+        self.assertEqual(self._stored("participant_count"), 1)
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+    def test_save_does_not_overwrite_counters(self):
+        stale = Event.objects.get(pk=self.event.pk)
+        self.event.participants.add(self.users[0])
+
+        stale.name = "Renamed"
+        stale.save()
+        self.assertEqual(self._stored("participant_count"), 1)
+
+    def test_reconcile_command_fixes_drift(self):
+        self.event.participants.add(*self.users)
+        Event.objects.filter(pk=self.event.pk).update(
+            participant_count=10, interest_count=4, trending_score=99
+        )
+
+        out = StringIO()
+        call_command("reconcile_event_counters", stdout=out)
+        self.assertIn("Fixed 1 drifted event(s).", out.getvalue())
+        self.assertEqual(self._stored("participant_count"), 3)
+        self.assertEqual(self._stored("interest_count"), 0)
+        self.assertAlmostEqual(
+            trending.decayed(self._stored("trending_score")),
+            3 * trending.PARTICIPANT_WEIGHT,
+            places=3,
+        )
+
+    def test_reconcile_retires_cached_counts(self):
+        version = get_counts_version()
+        Event.objects.filter(pk=self.event.pk).update(participant_count=2)
+        call_command("reconcile_event_counters", stdout=StringIO())
+        self.assertNotEqual(get_counts_version(), version)
+
+    def test_reconcile_dry_run(self):
+        Event.objects.filter(pk=self.event.pk).update(participant_count=5)
+
+        out = StringIO()
+        call_command("reconcile_event_counters", "--dry-run", stdout=out)
+        self.assertIn("Found 1 drifted event(s).", out.getvalue())
+        self.assertEqual(self._stored("participant_count"), 5)
+
+
+class CounterEndpointTest(APITestCase):
+    """Participate/interest endpoints keep the counters exact"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="testuser", password="pass123")
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.event = Event.objects.create(
+            name="Test Event",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.user,
+            organization=self.organization,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_participate_round_trip(self):
+        url = reverse("event-participate", kwargs={"pk": self.event.pk})
+        self.assertEqual(self.client.post(url).data["participant_count"], 1)
+        self.assertEqual(self.client.post(url).data["participant_count"], 1)
+        self.assertEqual(self.client.delete(url).data["participant_count"], 0)
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.participant_count, 0)
+
+    def test_interest_round_trip(self):
+        url = reverse("event-interested", kwargs={"pk": self.event.pk})
+        self.assertEqual(self.client.post(url).data["interest_count"], 1)
+        self.assertEqual(self.client.post(url).data["interest_count"], 1)
+        self.assertEqual(self.client.delete(url).data["interest_count"], 0)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.interest_count, 0)
@@ -0,0 +1,145 @@
+"""Tests for the denormalized EventCard read model"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import Organization
+from events.models import Event, EventCard
+
+User = get_user_model()
+
+
+class EventCardSyncTest(TestCase):
+    """Cards follow writes to events, counters, organizations and organizers"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        self.event = Event.objects.create(
+            name="Test Event",
+            date=timezone.now() + timedelta(days=1),
+            capacity=2,
+            organizer=self.organizer,
+            organization=self.organization,
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"user{i}", email=f"user{i}@example.com", password="pass"
+            )
+            for i in range(2)
+        ]
+
+    def _card(self):
+        return EventCard.objects.get(event=self.event)
+
+    def test_created_with_event(self):
+        card = self._card()
+        self.assertEqual(card.name, "Test Event")
+        self.assertEqual(card.organizer_name, "organizer")
+        self.assertEqual(card.organization_name, "Test Organization")
+        self.assertFalse(card.is_full)
+
+    def test_event_update(self):
+        self.event.name = "Renamed"
+        self.event.status = "Cancelled"
+        self.event.save()
+        card = self._card()
+        self.assertEqual(card.name, "Renamed")
+        self.assertEqual(card.status, "Cancelled")
+
+    def test_counters_and_is_full(self):
+        self.event.participants.add(*self.users)
+        self.event.interested_users.add(self.users[0])
+        card = self._card()
+        self.assertEqual(card.participant_count, 2)
+        self.assertEqual(card.interest_count, 1)
+        self.assertTrue(card.is_full)
+
+        self.users[0].participating_events.remove(self.event)
+        self.assertFalse(self._card().is_full)
+
+        self.event.interested_users.clear()
+        self.assertEqual(self._card().interest_count, 0)
+
+    def test_organization_and_organizer_renames(self):
+        self.organization.name = "New Name"
+        self.organization.save()
+        self.organizer.username = "new_organizer"
+        self.organizer.save()
+        card = self._card()
+        self.assertEqual(card.organization_name, "New Name")
+        self.assertEqual(card.organizer_name, "new_organizer")
+
+    def test_deleted_with_event(self):
+        self.event.delete()
+        self.assertFalse(EventCard.objects.exists())
+
+    def test_rebuild_command(self):
+        EventCard.objects.update(name="stale", participant_count=9)
+        EventCard.objects.filter(event=self.event).delete()
+        other = Event.objects.create(
+            name="Other Event",
+            date=timezone.now() + timedelta(days=2),
+            organizer=self.organizer,
+            organization=self.organization,
+        )
+        EventCard.objects.filter(event=other).update(name="stale")
+
+        out = StringIO()
+        call_command("rebuild_event_cards", "--batch-size", "1", stdout=out)
+        self.assertIn("Rebuilt 2 event card(s).", out.getvalue())
+        self.assertEqual(
+            sorted(EventCard.objects.values_list("name", flat=True)),
+            ["Other Event", "Test Event"],
+        )
+        self.assertEqual(self._card().participant_count, 0)
+
+
+class EventCardListTest(APITestCase):
+    """Anonymous public lists read the cards"""
+
+    def setUp(self):
+        owner = User.objects.create_user(
+            username="owner", email="owner@example.com", password="pass123"
+        )
+        organization = Organization.objects.create(name="Org", owner=owner)
+        now = timezone.now()
+        for days in (1, 2, -1):
+            Event.objects.create(
+                name=f"Event {days}",
+                date=now + timedelta(days=days),
+                organizer=owner,
+                organization=organization,
+            )
+
+    def test_single_query_without_joins(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("upcoming-events"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([e["name"] for e in response.json()], ["Event 1", "Event 2"])
+        # The other card reads look up the next start, for the ETag and TTL
+        card_queries = [
+            q["sql"] for q in queries if '"events_eventcard"."name"' in q["sql"]
+        ]
+        self.assertEqual(len(card_queries), 1)
+        self.assertNotIn("JOIN", card_queries[0])
+        self.assertFalse(any('events_event"' in q["sql"] for q in queries))
+
+    def test_reflects_card_contents(self):
+        # The list is served from the cards, not from the events
+        EventCard.objects.filter(name="Event -1").update(name="From card")
+        response = self.client.get(reverse("past-events"))
+        self.assertEqual([e["name"] for e in response.json()], ["From card"])
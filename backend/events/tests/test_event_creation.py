@@ -180,6 +180,7 @@ class EventSerializerTest(TestCase):
             "is_interested",
             "is_full",
             "created_by",
+            "series",
         ]
         self.assertEqual(set(data.keys()), set(expected_fields))
 
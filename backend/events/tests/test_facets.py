@@ -0,0 +1,97 @@
+"""Tests for the upcoming events facet counts"""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+
+User = get_user_model()
+
+# A Wednesday at noon
+NOW = datetime(2030, 6, 5, 12, 0, tzinfo=dt_timezone.utc)
+
+
+@mock.patch("django.utils.timezone.now", lambda: NOW)
+class UpcomingEventFacetsTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        for name, delta, category in (
+            ("Lunch", timedelta(hours=3), "SOCIAL"),
+            ("Match", timedelta(days=1), "SPORTS"),
+            ("Party", timedelta(days=3), "SOCIAL"),
+            ("Museum", timedelta(days=30), "CULTURAL"),
+            ("Breakfast", -timedelta(hours=3), "SOCIAL"),
+        ):
+            Event.objects.create(
+                name=name,
+                date=NOW + delta,
+                category=category,
+                organizer=self.user,
+                organization=self.organization,
+            )
+        self.url = reverse("upcoming-event-facets")
+
+    def _facets(self, params=None):
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_counts(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self._facets()
+        self.assertEqual(
+            len([q for q in queries if "GROUP BY" in q["sql"]]),
+            1,
+        )
+        self.assertEqual(data["categories"]["SOCIAL"], 2)
+        self.assertEqual(data["categories"]["SPORTS"], 1)
+        self.assertEqual(data["categories"]["CULTURAL"], 1)
+        self.assertEqual(data["categories"]["TRAVEL"], 0)
+        self.assertEqual(
+            data["date_filters"],
+            {"all": 4, "today": 1, "tomorrow": 1, "this_week": 4},
+        )
+
+    def test_facets_exclude_their_own_filter(self):
+        data = self._facets({"category": "SOCIAL", "date_filter": "tomorrow"})
+        # Categories under the date filter, date filters under the category
+        self.assertEqual(data["categories"]["SPORTS"], 1)
+        self.assertEqual(data["categories"]["SOCIAL"], 0)
+        self.assertEqual(
+            data["date_filters"],
+            {"all": 2, "today": 1, "tomorrow": 0, "this_week": 3},
+        )
+
+    def test_counts_match_the_list(self):
+        list_url = reverse("upcoming-events")
+        data = self._facets()
+        for name, count in data["date_filters"].items():
+            params = {} if name == "all" else {"date_filter": name}
+            self.assertEqual(len(self.client.get(list_url, params).json()), count)
+        for category, count in data["categories"].items():
+            response = self.client.get(list_url, {"category": category})
+            self.assertEqual(len(response.json()), count)
+
+    def test_cached_until_an_event_changes(self):
+        self._facets()
+        with CaptureQueriesContext(connection) as queries:
+            self._facets()
+        self.assertFalse([q for q in queries if "GROUP BY" in q["sql"]])
+
+        Event.objects.get(name="Museum").delete()
+        self.assertEqual(self._facets()["categories"]["CULTURAL"], 0)
@@ -0,0 +1,115 @@
+"""Contract tests for the values()-based event list path"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework import generics
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from accounts.models import Organization
+from events.fastpath import FastJSONRenderer
+from events.models import Event, EventSeries
+from events.views import PastEventsListView, UpcomingEventsListView
+
+User = get_user_model()
+
+
+def serializer_path(view_class):
+    """``view_class`` listing through EventListSerializer and JSONRenderer."""
+
+    class View(view_class):
+        renderer_classes = [JSONRenderer]
+
+        def list(self, request, *args, **kwargs):
+            return generics.ListAPIView.list(self, request, *args, **kwargs)
+
+    return View.as_view()
+
+
+class EventListContractTest(APITestCase):
+    """The fast path must render exactly what the serializer path renders"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.owner = User.objects.create_user(
+            username="órganizer", email="organizer@example.com", password="pass"
+        )
+        self.attendee = User.objects.create_user(
+            username="attendee", email="attendee@example.com", password="pass"
+        )
+        self.organization = Organization.objects.create(
+            name='Club "Ünïcode" \u2028 / \\', owner=self.owner
+        )
+        series = EventSeries.objects.create(
+            name="Weekly",
+            category="SOCIAL",
+            organizer=self.owner,
+            organization=self.organization,
+            start=timezone.now(),
+        )
+        now = timezone.now().replace(microsecond=123456)
+        samples = [
+            {"name": "Plain", "capacity": None},
+            {"name": "Full", "capacity": 1, "location": "Porto"},
+            {"name": "Zero", "capacity": 0, "description": "tab\there\nnew\x01"},
+            {"name": "Emoji 🎉 \u2029", "capacity": 5, "series": series},
+            {"name": "Quote \"'<>&", "category": "SPORTS", "location": ""},
+        ]
+        for i, fields in enumerate(samples):
+            for sign in (1, -1):
+                event = Event.objects.create(
+                    date=now + sign * timedelta(days=i + 1, seconds=i),
+                    organizer=self.owner,
+                    organization=self.organization,
+                    **{"category": "SOCIAL", **fields},
+                )
+                if fields["name"] == "Full":
+                    event.participants.add(self.attendee)
+                    event.interested_users.add(self.attendee)
+
+    def _render(self, view, params=None, user=None):
+        request = self.factory.get("/", params or {})
+        if user is not None:
+            force_authenticate(request, user=user)
+        response = view(request)
+        self.assertEqual(response.status_code, 200)
+        return response.render().content
+
+    def _assert_identical(self, view_class, **kwargs):
+        fast = self._render(view_class.as_view(), **kwargs)
+        reference = self._render(serializer_path(view_class), **kwargs)
+        self.assertEqual(fast, reference)
+        self.assertGreater(len(fast), 2)
+
+    def test_upcoming_anonymous(self):
+        self._assert_identical(UpcomingEventsListView)
+
+    def test_upcoming_authenticated(self):
+        self._assert_identical(UpcomingEventsListView, user=self.attendee)
+
+    def test_past(self):
+        self._assert_identical(PastEventsListView)
+        self._assert_identical(PastEventsListView, user=self.attendee)
+
+    def test_filters_and_search(self):
+        self._assert_identical(
+            UpcomingEventsListView, params={"category": "SPORTS", "search": "quote"}
+        )
+
+    def test_sparse_fieldsets(self):
+        self._assert_identical(
+            UpcomingEventsListView, params={"fields": "id,date,is_full,series"}
+        )
+        self._assert_identical(
+            PastEventsListView, params={"omit": "description,is_interested"}
+        )
+
+    def test_renderer_matches_json_renderer(self):
+        data = [{"text": '\x00\x1f\u2028\u2029é/\\"', "n": 10**12, "v": None}]
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(
+            FastJSONRenderer().render(data, "application/json; indent=4"),
+            JSONRenderer().render(data, "application/json; indent=4"),
+        )
@@ -0,0 +1,94 @@
+"""Tests for sparse fieldsets (?fields= / ?omit=)"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization, Profile
+from events.models import Event
+
+User = get_user_model()
+
+
+class SparseFieldsetsTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organizer.profile.role = Profile.Role.ORGANIZER
+        self.organizer.profile.save()
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        for i in range(3):
+            Event.objects.create(
+                name=f"Event {i}",
+                date=timezone.now() + timedelta(days=i + 1),
+                organizer=self.organizer,
+                organization=self.organization,
+            )
+        self.client.force_authenticate(user=self.organizer)
+        self.url = reverse("upcoming-events")
+
+    def _get(self, url, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, [query["sql"] for query in context.captured_queries]
+
+    def test_fields_keeps_only_listed_keys(self):
+        response, _ = self._get(self.url, {"fields": "id,name,date,unknown"})
+        self.assertEqual(
+            [set(item) for item in response.data], [{"id", "name", "date"}] * 3
+        )
+
+    def test_omit_drops_keys_and_their_queries(self):
+        response, sparse = self._get(
+            self.url, {"omit": "is_participating,is_interested"}
+        )
+        for key in ("is_participating", "is_interested"):
+            self.assertNotIn(key, response.data[0])
+        self.assertIn("name", response.data[0])
+        self.assertFalse(any("EXISTS" in sql for sql in sparse))
+
+    def test_omit_skips_prefetch_on_detail(self):
+        url = reverse("event-detail", kwargs={"pk": Event.objects.first().pk})
+        _, full = self._get(url, {})
+        response, sparse = self._get(url, {"omit": "interested_users"})
+        self.assertNotIn("interested_users", response.data)
+        self.assertEqual(len(sparse), len(full) - 1)
+
+    def test_fields_skip_joins(self):
+        _, sparse = self._get(self.url, {"fields": "id,name"})
+        self.assertFalse(any("accounts_organization" in sql for sql in sparse))
+
+    def test_organization_list_skips_method_fields(self):
+        url = reverse("organizations-list")
+        _, full = self._get(url, {})
+        response, sparse = self._get(url, {"fields": "id,name"})
+        self.assertEqual(set(response.data[0]), {"id", "name"})
+        self.assertLess(len(sparse), len(full))
+        self.assertFalse(any("events_event" in sql for sql in sparse))
+
+    def test_writes_ignore_fieldsets(self):
+        url = reverse("create_event") + "?fields=id"
+        response = self.client.post(
+            url,
+            {
+                "name": "Picnic",
+                "date": (timezone.now() + timedelta(days=5)).isoformat(),
+                "category": "SOCIAL",
+                "organization": self.organization.pk,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn("name", response.data)
+        self.assertEqual(Event.objects.get(pk=response.data["id"]).name, "Picnic")
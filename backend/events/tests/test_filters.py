@@ -0,0 +1,137 @@
+"""Tests for the shared event list filters"""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import QueryDict
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.filters import date_filter_range, parse_event_filters
+from events.models import Event
+
+User = get_user_model()
+
+# A Wednesday at noon
+NOW = datetime(2030, 6, 5, 12, 0, tzinfo=dt_timezone.utc)
+
+
+def _at(day, hour=0, minute=0, second=0):
+    return datetime(2030, 6, day, hour, minute, second, tzinfo=dt_timezone.utc)
+
+
+class ParseEventFiltersTest(SimpleTestCase):
+    def _parse(self, query):
+        return parse_event_filters(QueryDict(query))
+
+    def test_errors_name_every_bad_parameter(self):
+        with self.assertRaises(ValidationError) as raised:
+            self._parse("category=NOPE&date_filter=someday&date_from=June")
+        self.assertEqual(
+            set(raised.exception.detail), {"category", "date_filter", "date_from"}
+        )
+
+    def test_date_to_day_is_exclusive_next_midnight(self):
+        filters = self._parse("date_from=2030-06-05&date_to=2030-06-07")
+        self.assertEqual((filters.start, filters.end), (_at(5), _at(8)))
+
+    def test_single_day_range(self):
+        filters = self._parse("date_from=2030-06-07&date_to=2030-06-07")
+        self.assertEqual((filters.start, filters.end), (_at(7), _at(8)))
+
+    def test_date_to_datetime_is_kept(self):
+        filters = self._parse("date_to=2030-06-07T18:30:00Z")
+        self.assertEqual(filters.end, _at(7, 18, 30))
+
+    def test_empty_range(self):
+        with self.assertRaises(ValidationError) as raised:
+            self._parse("date_from=2030-06-07&date_to=2030-06-06")
+        self.assertIn("date_to", raised.exception.detail)
+
+    def test_categories_are_normalized(self):
+        filters = self._parse("category=SPORTS&category=SOCIAL&category=SPORTS")
+        self.assertEqual(filters.categories, ("SOCIAL", "SPORTS"))
+        self.assertEqual(filters, self._parse("category=SOCIAL&category=SPORTS"))
+
+    def test_date_filter_ranges_are_half_open(self):
+        self.assertEqual(date_filter_range("today", NOW), (NOW, _at(6)))
+        self.assertEqual(date_filter_range("tomorrow", NOW), (_at(6), _at(7)))
+        # Wednesday through Sunday
+        self.assertEqual(date_filter_range("this_week", NOW), (_at(5), _at(10)))
+        self.assertEqual(date_filter_range(None, NOW), (NOW, None))
+
+
+@mock.patch("django.utils.timezone.now", lambda: NOW)
+class EventListFiltersTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        for name, date in (
+            ("Late Thursday", _at(6, 23, 59, 59)),
+            ("Friday", _at(7, 0)),
+            ("Last Week", _at(1, 10)),
+        ):
+            Event.objects.create(
+                name=name,
+                date=date,
+                organizer=self.user,
+                organization=self.organization,
+            )
+
+    def _names(self, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [event["name"] for event in response.data]
+
+    def test_last_second_of_date_to_day(self):
+        names = self._names(reverse("upcoming-events"), {"date_to": "2030-06-06"})
+        self.assertEqual(names, ["Late Thursday"])
+
+    def test_tomorrow_ends_at_midnight(self):
+        names = self._names(reverse("upcoming-events"), {"date_filter": "tomorrow"})
+        self.assertEqual(names, ["Late Thursday"])
+
+    def test_every_list_validates(self):
+        self.client.force_authenticate(user=self.user)
+        urls = [
+            reverse("upcoming-events"),
+            reverse("past-events"),
+            reverse("my-organized-events"),
+            reverse("organizations-events", args=[self.organization.pk]),
+        ]
+        for url in urls:
+            response = self.client.get(url, {"date_from": "not a date"})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, url)
+            self.assertIn("date_from", response.data)
+
+    def test_past_and_organization_lists_filter(self):
+        names = self._names(reverse("past-events"), {"date_from": "2030-06-01"})
+        self.assertEqual(names, ["Last Week"])
+        names = self._names(
+            reverse("organizations-events", args=[self.organization.pk]),
+            {"date_from": "2030-06-07"},
+        )
+        self.assertEqual(names, ["Friday"])
+
+    def test_predicates_are_plain_ranges(self):
+        with CaptureQueriesContext(connection) as queries:
+            self._names(
+                reverse("upcoming-events"),
+                {"category": "SOCIAL", "date_to": "2030-06-06"},
+            )
+        sql = " ".join(q["sql"] for q in queries)
+        self.assertIn('"date" < ', sql)
+        self.assertIn('"category" IN', sql)
@@ -0,0 +1,52 @@
+"""Tests for the compact event list payload"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from events.management import benchmarks
+from events.models import Event
+from events.serializers import EventListSerializer, EventSerializer
+
+User = get_user_model()
+
+
+class EventListPayloadTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.organization = benchmarks.seed_organization()
+        self.event = Event.objects.create(
+            name="Music Night",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.organization.owner,
+            organization=self.organization,
+        )
+
+    def test_lists_leave_out_interested_users(self):
+        benchmarks.seed_interest([self.event], benchmarks.seed_users(3))
+        for url in (
+            reverse("all-events"),
+            reverse("upcoming-events"),
+            reverse("organizations-events", kwargs={"pk": self.organization.pk}),
+        ):
+            item = self.client.get(url).data[0]
+            self.assertNotIn("interested_users", item)
+            self.assertEqual(item["interest_count"], 3)
+
+    def test_detail_keeps_full_serializer(self):
+        self.client.force_authenticate(user=self.organization.owner)
+        url = reverse("event-detail", kwargs={"pk": self.event.pk})
+        self.assertIn("interested_users", self.client.get(url).data)
+
+    def test_list_payload_does_not_grow_with_interest(self):
+        events = Event.objects.all()
+        empty = benchmarks.payload_bytes(EventListSerializer, events.all())
+        benchmarks.seed_interest(events, benchmarks.seed_users(50))
+        compact = benchmarks.payload_bytes(EventListSerializer, events.all())
+        full = benchmarks.payload_bytes(EventSerializer, events.all())
+        # Only interest_count grows, from "0" to "50"
+        self.assertEqual(compact - empty, 1)
+        self.assertGreater(full - compact, 50 * 2)
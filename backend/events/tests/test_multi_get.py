@@ -0,0 +1,105 @@
+"""Tests for fetching events by id list"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+
+User = get_user_model()
+
+
+class EventMultiGetTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.events = [
+            Event.objects.create(
+                name=f"Event {i}",
+                date=timezone.now() + timedelta(days=i + 1),
+                organizer=self.user,
+                organization=self.organization,
+            )
+            for i in range(4)
+        ]
+        self.events[2].participants.add(self.user)
+        self.url = reverse("all-events")
+
+    def _ids(self, *events):
+        return {"ids": ",".join(str(event.pk) for event in events)}
+
+    def test_keeps_requested_order(self):
+        first, _, third, fourth = self.events
+        response = self.client.get(self.url, self._ids(fourth, first, third))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [event["id"] for event in response.json()],
+            [fourth.pk, first.pk, third.pk],
+        )
+
+    def test_matches_list_output(self):
+        self.client.force_authenticate(user=self.user)
+        listed = {event["id"]: event for event in self.client.get(self.url).json()}
+        fetched = self.client.get(self.url, self._ids(*self.events)).json()
+        for event in fetched:
+            self.assertEqual(list(event), list(listed[event["id"]]))
+            self.assertEqual(event, listed[event["id"]])
+        self.assertTrue(fetched[2]["is_participating"])
+
+    def _event_reads(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [q["sql"] for q in queries if '"events_event"."id" IN' in q["sql"]]
+
+    def test_fragments_are_cached(self):
+        self.assertEqual(len(self._event_reads(self._ids(*self.events[:2]))), 1)
+        self.assertEqual(self._event_reads(self._ids(*self.events[:2])), [])
+        # Only the misses are read
+        reads = self._event_reads(self._ids(*self.events))
+        self.assertEqual(len(reads), 1)
+        self.assertIn(f"IN ({self.events[2].pk}, {self.events[3].pk})", reads[0])
+
+    def test_change_retires_fragments(self):
+        self.client.get(self.url, self._ids(self.events[0]))
+        self.events[0].name = "Renamed"
+        self.events[0].save()
+        response = self.client.get(self.url, self._ids(self.events[0]))
+        self.assertEqual(response.json()[0]["name"], "Renamed")
+
+    def test_post_and_sparse_fields(self):
+        response = self.client.post(
+            f"{self.url}?fields=id,name",
+            {"ids": [self.events[1].pk, 999999, self.events[0].pk]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {"id": self.events[1].pk, "name": "Event 1"},
+                {"id": self.events[0].pk, "name": "Event 0"},
+            ],
+        )
+
+    def test_invalid_ids(self):
+        response = self.client.get(self.url, {"ids": "1,x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(self.url, {"ids": "1,2"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(
+            self.url, {"ids": list(range(1, 502))}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
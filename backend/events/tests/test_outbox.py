@@ -0,0 +1,191 @@
+"""Tests for the transactional outbox and its consumers"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import Organization
+from events import outbox
+from events.models import Event, OutboxCheckpoint, OutboxEntry
+
+User = get_user_model()
+
+
+class OutboxRecordTest(TestCase):
+    """Changes append entries in the transaction that makes them"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.event = Event.objects.create(
+            name="Test Event",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.user,
+            organization=self.organization,
+        )
+
+    def _entries(self, topic):
+        return list(
+            OutboxEntry.objects.filter(topic=topic).values_list("payload", flat=True)
+        )
+
+    def test_event_and_organization_changes(self):
+        self.event.save()
+        self.organization.save()
+        event_pk = self.event.pk
+        self.event.delete()
+
+        self.assertEqual(
+            self._entries(outbox.EVENT_SAVED),
+            [{"id": event_pk, "created": True}, {"id": event_pk, "created": False}],
+        )
+        self.assertEqual(
+            self._entries(outbox.EVENT_DELETED),
+            [{"id": event_pk, "organization_id": self.organization.pk}],
+        )
+        self.assertEqual(
+            self._entries(outbox.ORGANIZATION_SAVED),
+            [
+                {"id": self.organization.pk, "created": True},
+                {"id": self.organization.pk, "created": False},
+            ],
+        )
+
+    def test_member_changes(self):
+        self.event.participants.add(self.user)
+        self.event.interested_users.add(self.user)
+        self.user.participating_events.remove(self.event)
+        self.event.interested_users.clear()
+
+        pair = [self.event.pk, self.user.pk]
+        self.assertEqual(
+            self._entries(outbox.MEMBERS_ADDED),
+            [
+                {"relation": "participants", "pairs": [pair]},
+                {"relation": "interested_users", "pairs": [pair]},
+            ],
+        )
+        self.assertEqual(
+            self._entries(outbox.MEMBERS_REMOVED),
+            [
+                {"relation": "participants", "pairs": [pair]},
+                {"relation": "interested_users", "pairs": [pair]},
+            ],
+        )
+
+    def test_member_changes_through_the_api(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        for name in ("event-participate", "event-interested"):
+            url = reverse(name, args=[self.event.pk])
+            client.post(url)
+            client.delete(url)
+
+        pair = [self.event.pk, self.user.pk]
+        expected = [
+            {"relation": "participants", "pairs": [pair]},
+            {"relation": "interested_users", "pairs": [pair]},
+        ]
+        self.assertEqual(self._entries(outbox.MEMBERS_ADDED), expected)
+        self.assertEqual(self._entries(outbox.MEMBERS_REMOVED), expected)
+
+    def test_cancel_is_atomic(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse("event-cancel", args=[self.event.pk])
+        with mock.patch.object(outbox, "record", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                client.post(url)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.status, "Active")
+
+
+@override_settings(EVENTS_OUTBOX_EAGER=False)
+class OutboxProcessTest(TestCase):
+    """Deferred delivery in batches, with checkpoints"""
+
+    def setUp(self):
+        self.received = []
+        self.consumers = {}
+        patcher = mock.patch.object(outbox, "_consumers", self.consumers)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        outbox.consumer("test", topics=[outbox.EVENT_SAVED])(self.received.extend)
+
+    def _record(self, count, topic=outbox.EVENT_SAVED):
+        outbox.record_many(topic, [{"id": i} for i in range(count)])
+        OutboxEntry.objects.update(created_at=timezone.now() - timedelta(minutes=1))
+
+    def test_deferred_by_default(self):
+        with self.settings():
+            del settings.EVENTS_OUTBOX_EAGER
+            self.assertFalse(outbox.is_eager())
+
+    def test_not_delivered_inline(self):
+        self._record(1)
+        self.assertEqual(self.received, [])
+
+    def test_batches_and_checkpoint(self):
+        self._record(3)
+        self._record(1, topic=outbox.EVENT_DELETED)
+        self.assertEqual(outbox.process("test", batch_size=2), 2)
+        self.assertEqual(outbox.process("test", batch_size=2), 2)
+        self.assertEqual(outbox.process("test", batch_size=2), 0)
+        self.assertEqual([entry.payload["id"] for entry in self.received], [0, 1, 2])
+        self.assertEqual(
+            OutboxCheckpoint.objects.get(consumer="test").position,
+            OutboxEntry.objects.latest("pk").pk,
+        )
+
+    def test_failed_batch_is_delivered_again(self):
+        self._record(2)
+
+        def fail(entries):
+            raise RuntimeError("consumer down")
+
+        outbox.consumer("test", topics=[outbox.EVENT_SAVED])(fail)
+        with self.assertRaises(RuntimeError):
+            outbox.process("test")
+        outbox.consumer("test", topics=[outbox.EVENT_SAVED])(self.received.extend)
+        self.assertEqual(outbox.process("test"), 2)
+        self.assertEqual(len(self.received), 2)
+
+    def test_recent_entries_wait(self):
+        outbox.record(outbox.EVENT_SAVED, {"id": 1})
+        self.assertEqual(outbox.process("test"), 0)
+
+    def test_command_and_prune(self):
+        self._record(2)
+        out = StringIO()
+        call_command("process_outbox", "--prune-days", "0", stdout=out)
+        self.assertIn("test: processed 2 entries", out.getvalue())
+        self.assertIn("Pruned 2 entries.", out.getvalue())
+        self.assertFalse(OutboxEntry.objects.exists())
+
+    def test_command_prunes_old_entries(self):
+        self._record(3)
+        old = OutboxEntry.objects.order_by("pk").values_list("pk", flat=True)[:2]
+        OutboxEntry.objects.filter(pk__in=list(old)).update(
+            created_at=timezone.now() - timedelta(days=8)
+        )
+        out = StringIO()
+        call_command("process_outbox", stdout=out)
+        self.assertIn("Pruned 2 entries.", out.getvalue())
+        self.assertEqual(OutboxEntry.objects.count(), 1)
+
+    def test_prune_keeps_unprocessed_entries(self):
+        self._record(2)
+        self.assertEqual(outbox.prune(timedelta(0)), 0)
+        self.assertEqual(OutboxEntry.objects.count(), 2)
@@ -0,0 +1,108 @@
+"""Tests for opt-in keyset pagination on event lists"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+
+User = get_user_model()
+
+
+class EventKeysetPaginationTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="testuser", password="pass123")
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        base = timezone.now() + timedelta(days=1)
+        self.events = []
+        for i in range(7):
+            # Pairs of events share a date to exercise the id tie-breaker
+            self.events.append(
+                Event.objects.create(
+                    name=f"Event {i}",
+                    date=base + timedelta(hours=i // 2),
+                    organizer=self.user,
+                    organization=self.organization,
+                )
+            )
+        self.url = reverse("upcoming-events")
+
+    def _walk(self, url, params):
+        ids = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item["id"] for item in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_no_cursor_returns_plain_list(self):
+        """Clients that do not opt in keep getting a plain array"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 7)
+
+    def test_page_size_opts_in(self):
+        response = self.client.get(self.url, {"page_size": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [event.id for event in self.events[:3]],
+        )
+        self.assertIsNotNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
+
+    def test_walk_all_pages_in_order(self):
+        ids = self._walk(self.url, {"page_size": 2})
+        self.assertEqual(ids, [event.id for event in self.events])
+
+    def test_previous_link_returns_previous_page(self):
+        first = self.client.get(self.url, {"page_size": 3})
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [item["id"] for item in back.data["results"]],
+            [item["id"] for item in first.data["results"]],
+        )
+
+    def test_past_events_descending(self):
+        Event.objects.all().update(date=timezone.now() - timedelta(days=1))
+        ids = self._walk(reverse("past-events"), {"page_size": 3})
+        self.assertEqual(ids, sorted((event.id for event in self.events), reverse=True))
+
+    def test_page_size_is_capped(self):
+        response = self.client.get(self.url, {"page_size": 10000})
+        self.assertEqual(len(response.data["results"]), 7)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deep_page_has_no_offset_or_count(self):
+        with CaptureQueriesContext(connection) as first_page:
+            first = self.client.get(self.url, {"page_size": 2})
+        second = self.client.get(first.data["next"])
+        with CaptureQueriesContext(connection) as deep_page:
+            self.client.get(second.data["next"])
+
+        self.assertEqual(len(first_page), len(deep_page))
+        sql = " ".join(query["sql"] for query in deep_page.captured_queries)
+        self.assertNotIn("OFFSET", sql.upper())
+        self.assertNotIn('"__count"', sql)
+
+    def test_organization_events_paginated(self):
+        url = reverse("organizations-events", kwargs={"pk": self.organization.pk})
+        ids = self._walk(url, {"page_size": 4})
+        self.assertEqual(ids, [event.id for event in self.events])
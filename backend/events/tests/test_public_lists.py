@@ -0,0 +1,93 @@
+"""Tests for the shared-cacheable public event lists and the user state"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+
+User = get_user_model()
+
+
+class PublicEventListTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        now = timezone.now()
+        self.upcoming = Event.objects.create(
+            name="Upcoming",
+            date=now + timedelta(days=1),
+            organizer=self.user,
+            organization=self.organization,
+        )
+        self.past = Event.objects.create(
+            name="Past",
+            date=now - timedelta(days=1),
+            organizer=self.user,
+            organization=self.organization,
+        )
+        self.upcoming.participants.add(self.user)
+        self.past.interested_users.add(self.user)
+
+    def test_same_public_response_for_every_client(self):
+        for name in ("public-upcoming-events", "public-past-events"):
+            url = reverse(name)
+            anonymous = self.client.get(url)
+            self.client.login(username="testuser", password="pass123")
+            authenticated = self.client.get(url)
+            self.client.logout()
+
+            self.assertEqual(anonymous.status_code, status.HTTP_200_OK)
+            self.assertEqual(anonymous.content, authenticated.content)
+            self.assertEqual(len(anonymous.json()), 1)
+            for event in anonymous.json():
+                self.assertNotIn("is_participating", event)
+                self.assertNotIn("is_interested", event)
+
+    def test_cache_control_is_public(self):
+        response = self.client.get(reverse("public-upcoming-events"))
+        self.assertIn("public", response["Cache-Control"])
+        # Stored, but revalidated against the ETag before every use
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertNotIn("max-age", response["Cache-Control"])
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+
+        not_modified = self.client.get(
+            reverse("public-upcoming-events"), HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertIn("public", not_modified["Cache-Control"])
+
+    def test_filters_and_paging_still_apply(self):
+        response = self.client.get(
+            reverse("public-upcoming-events"), {"category": "SPORTS"}
+        )
+        self.assertEqual(response.json(), [])
+
+        response = self.client.get(reverse("public-upcoming-events"), {"page_size": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_user_state(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("event-user-state"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {"participating": [self.upcoming.pk], "interested": [self.past.pk]},
+        )
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_user_state_requires_authentication(self):
+        response = self.client.get(reverse("event-user-state"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
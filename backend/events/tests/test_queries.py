@@ -0,0 +1,127 @@
+"""Tests for the annotated event list queryset"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization, Profile
+from events.models import Event
+from events.queries import with_list_annotations
+from events.serializers import EventSerializer
+
+User = get_user_model()
+
+
+class EventListQueryCountTest(APITestCase):
+    """List endpoints must cost a constant number of queries"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organizer.profile.role = Profile.Role.ORGANIZER
+        self.organizer.profile.save()
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        self.attendees = [
+            User.objects.create_user(
+                username=f"attendee{i}",
+                email=f"attendee{i}@example.com",
+                password="pass123",
+            )
+            for i in range(3)
+        ]
+
+    def _create_events(self, count):
+        for i in range(count):
+            event = Event.objects.create(
+                name=f"Event {i}",
+                date=timezone.now() + timedelta(days=i + 1),
+                organizer=self.organizer,
+                organization=self.organization,
+                capacity=2,
+            )
+            event.participants.add(*self.attendees[:2])
+            event.interested_users.add(self.attendees[2])
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def _assert_constant(self, url):
+        self._create_events(2)
+        few = self._count_queries(url)
+        self._create_events(10)
+        many = self._count_queries(url)
+        self.assertEqual(few, many)
+
+    def test_all_events_anonymous(self):
+        self._assert_constant(reverse("all-events"))
+
+    def test_all_events_authenticated(self):
+        self.client.force_authenticate(user=self.attendees[0])
+        self._assert_constant(reverse("all-events"))
+
+    def test_upcoming_events_authenticated(self):
+        self.client.force_authenticate(user=self.attendees[0])
+        self._assert_constant(reverse("upcoming-events"))
+
+    def test_participating_events(self):
+        self.client.force_authenticate(user=self.attendees[0])
+        self._assert_constant(reverse("user-registered-events"))
+
+    def test_organization_events(self):
+        self._assert_constant(
+            reverse("organizations-events", kwargs={"pk": self.organization.pk})
+        )
+
+
+class AnnotatedSerializerTest(APITestCase):
+    """Annotated and plain instances must serialize identically"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.attendee = User.objects.create_user(
+            username="attendee", email="attendee@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        self.event = Event.objects.create(
+            name="Test Event",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.organizer,
+            organization=self.organization,
+            capacity=1,
+        )
+        self.event.participants.add(self.attendee)
+        self.event.interested_users.add(self.attendee, self.organizer)
+
+    def test_annotated_matches_plain(self):
+        request = APIClient().get("/").wsgi_request
+        request.user = self.attendee
+        context = {"request": request}
+
+        plain = EventSerializer(self.event, context=context).data
+        annotated_event = with_list_annotations(
+            Event.objects.filter(pk=self.event.pk), self.attendee
+        ).get()
+        annotated = EventSerializer(annotated_event, context=context).data
+
+        self.assertEqual(plain, annotated)
+        self.assertEqual(annotated["participant_count"], 1)
+        self.assertEqual(annotated["interest_count"], 2)
+        self.assertTrue(annotated["is_participating"])
+        self.assertTrue(annotated["is_interested"])
+        self.assertTrue(annotated["is_full"])
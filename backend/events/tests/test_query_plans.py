@@ -0,0 +1,121 @@
+"""Query-plan regression tests for the event list endpoints"""
+
+import re
+import unittest
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization, Profile
+from accounts.serializers import OrganizationSerializer
+from events.models import Event
+
+User = get_user_model()
+
+# "SCAN events_event" (optionally "USING INDEX ...") is a full pass over the
+# table; "SEARCH events_event USING INDEX ..." is an index seek.
+FULL_SCAN_RE = re.compile(r"\bSCAN events_event\b(?!_)")
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite")
+class EventListQueryPlanTest(APITestCase):
+    """Every filtered event list must reach events_event through an index"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organizer.profile.role = Profile.Role.ORGANIZER
+        self.organizer.profile.save()
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        for i in range(-3, 3):
+            event = Event.objects.create(
+                name=f"Event {i}",
+                date=timezone.now() + timedelta(days=i),
+                organizer=self.organizer,
+                organization=self.organization,
+            )
+            event.participants.add(self.organizer)
+            event.interested_users.add(self.organizer)
+        self.client.force_authenticate(user=self.organizer)
+
+    def _plan(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return [row[-1] for row in cursor.fetchall()]
+
+    def _assert_no_full_scan(self, captured):
+        """Check every events_event read and return the combined plan"""
+        steps = []
+        for query in captured:
+            sql = query["sql"]
+            if not sql.startswith("SELECT") or '"events_event"' not in sql:
+                continue
+            # Captured SQL already has its parameters inlined and quoted
+            plan = self._plan(sql)
+            steps.extend(plan)
+            scans = [step for step in plan if FULL_SCAN_RE.search(step)]
+            self.assertEqual(scans, [], f"{sql}\n" + "\n".join(plan))
+        self.assertTrue(steps, "no query read events_event")
+        return "\n".join(steps)
+
+    def _assert_indexed(self, url, params=None, index=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        plan = self._assert_no_full_scan(context.captured_queries)
+        if index:
+            self.assertIn(f"INDEX {index} ", plan)
+
+    def test_upcoming(self):
+        self._assert_indexed(reverse("upcoming-events"), index="events_status_date_idx")
+
+    def test_upcoming_with_filters(self):
+        self._assert_indexed(
+            reverse("upcoming-events"),
+            {"date_filter": "this_week", "page_size": 2},
+            index="events_status_date_idx",
+        )
+
+    def test_upcoming_trending(self):
+        self._assert_indexed(
+            reverse("upcoming-events"),
+            {"ordering": "trending"},
+            index="events_status_trending_id_idx",
+        )
+
+    def test_past(self):
+        self._assert_indexed(reverse("past-events"), index="events_status_date_idx")
+
+    def test_organization_events(self):
+        url = reverse("organizations-events", kwargs={"pk": self.organization.pk})
+        self._assert_indexed(url)
+        # The public page only lists active events
+        self.client.logout()
+        self._assert_indexed(url, index="events_org_status_date_idx")
+
+    def test_user_organized(self):
+        self._assert_indexed(
+            reverse("user-organized-events"), index="events_organizer_date_idx"
+        )
+
+    def test_user_registered(self):
+        self._assert_indexed(reverse("user-registered-events"))
+
+    def test_user_interested(self):
+        self._assert_indexed(reverse("user-interested-events"))
+
+    def test_organization_event_count(self):
+        with CaptureQueriesContext(connection) as context:
+            data = OrganizationSerializer(self.organization).data
+        self.assertEqual(data["event_count"], 6)
+        plan = self._assert_no_full_scan(context.captured_queries)
+        self.assertIn("INDEX events_org_status_date_idx ", plan)
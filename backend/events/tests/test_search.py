@@ -0,0 +1,106 @@
+"""Tests for full-text event search"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+from events.search import (
+    FTS_TABLE,
+    BasicSearchBackend,
+    SQLiteFTS5SearchBackend,
+    get_search_backend,
+)
+
+User = get_user_model()
+
+
+class EventSearchTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="testuser", password="pass123")
+        self.organization = Organization.objects.create(
+            name="Erasmus Student Network", owner=self.user
+        )
+        self.url = reverse("upcoming-events")
+
+    def _event(self, name, days=1, **fields):
+        return Event.objects.create(
+            name=name,
+            date=timezone.now() + timedelta(days=days),
+            organizer=self.user,
+            organization=self.organization,
+            **fields,
+        )
+
+    def _search(self, query):
+        response = self.client.get(self.url, {"search": query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["name"] for item in response.data]
+
+    def test_sqlite_uses_fts5(self):
+        self.assertIsInstance(get_search_backend(), SQLiteFTS5SearchBackend)
+
+    def test_prefix_match(self):
+        self._event("Music Night")
+        self._event("Museum Visit")
+        self._event("Football")
+        self.assertEqual(self._search("mus"), ["Music Night", "Museum Visit"])
+        self.assertEqual(self._search("musi"), ["Music Night"])
+
+    def test_results_ranked_by_relevance(self):
+        self._event("Walking tour", days=1, description="Jazz bar at the end")
+        self._event("Jazz Jazz Jazz", days=2, description="Jazz night")
+        self.assertEqual(self._search("jazz"), ["Jazz Jazz Jazz", "Walking tour"])
+
+    def test_location_and_organization_name(self):
+        self._event("Picnic", location="Parque da Cidade")
+        self.assertEqual(self._search("cidade"), ["Picnic"])
+        self.assertEqual(self._search("erasmus network"), ["Picnic"])
+
+    def test_accents_and_punctuation(self):
+        self._event("Café Crawl")
+        self.assertEqual(self._search("cafe"), ["Café Crawl"])
+        self.assertEqual(self._search('"cafe" OR *'), [])
+
+    def test_index_follows_updates_and_deletes(self):
+        event = self._event("Board Games")
+        event.name = "Card Games"
+        event.save()
+        self.assertEqual(self._search("board"), [])
+        self.assertEqual(self._search("card"), ["Card Games"])
+
+        event.delete()
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {FTS_TABLE}")
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_organization_rename_reindexes(self):
+        self._event("Hike")
+        self.organization.name = "Mountain Club"
+        self.organization.save()
+        self.assertEqual(self._search("mountain"), ["Hike"])
+
+    def test_rebuild_command(self):
+        self._event("Karaoke")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        self.assertEqual(self._search("karaoke"), [])
+
+        call_command("rebuild_event_search_index", stdout=StringIO())
+        self.assertEqual(self._search("karaoke"), ["Karaoke"])
+
+    @override_settings(EVENT_SEARCH_BACKEND="events.search.BasicSearchBackend")
+    def test_pluggable_backend(self):
+        self.assertIsInstance(get_search_backend(), BasicSearchBackend)
+        self._event("Music Night")
+        self.assertEqual(self._search("music"), ["Music Night"])
@@ -0,0 +1,134 @@
+"""Tests for the search result cache of the upcoming events list"""
+
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.cache import SearchResultCache
+from events.models import Event
+from events.search import FTS_TABLE
+
+User = get_user_model()
+
+
+class UpcomingSearchCacheTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="testuser", password="pass123")
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.url = reverse("upcoming-events")
+        for name in ("Music Night", "Museum Visit", "Football"):
+            self._event(name)
+
+    def _event(self, name):
+        return Event.objects.create(
+            name=name,
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.user,
+            organization=self.organization,
+        )
+
+    def _search(self, query, **params):
+        # Authenticated requests skip the anonymous response cache
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"search": query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        searches = [q for q in queries if f"{FTS_TABLE} MATCH" in q["sql"]]
+        return [item["name"] for item in response.data], len(searches)
+
+    def test_normalized_queries_share_results(self):
+        self.assertEqual(self._search("mus"), (["Music Night", "Museum Visit"], 1))
+        self.assertEqual(self._search("MUS"), (["Music Night", "Museum Visit"], 0))
+        self.assertEqual(self._search("  mus "), (["Music Night", "Museum Visit"], 0))
+        # Other filters are part of the key
+        self.assertEqual(self._search("mus", category="SPORTS"), ([], 1))
+
+    def test_write_invalidates(self):
+        self._search("mus")
+        self._event("Musical")
+        names, searches = self._search("mus")
+        self.assertEqual(searches, 1)
+        self.assertIn("Musical", names)
+
+
+@mock.patch("events.cache._seconds_until_next_change", lambda: 60)
+@mock.patch("events.cache.get_version", lambda organization_id=None: 1)
+class SearchResultCacheTest(SimpleTestCase):
+    def test_single_flight(self):
+        results = SearchResultCache()
+        calls = []
+        release = threading.Event()
+
+        def compute(limit):
+            calls.append(limit)
+            release.wait(5)
+            return [3, 1, 2]
+
+        answers = []
+        threads = [
+            threading.Thread(
+                target=lambda: answers.append(results.get(("same",), compute))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(answers, [[3, 1, 2]] * 5)
+
+    def test_lru_eviction(self):
+        results = SearchResultCache(maxsize=2)
+        calls = []
+
+        def compute(limit):
+            calls.append(limit)
+            return [len(calls)]
+
+        results.get(("a",), compute)
+        results.get(("b",), compute)
+        results.get(("a",), compute)
+        results.get(("c",), compute)  # evicts "b", the least recently used
+        results.get(("a",), compute)
+        results.get(("b",), compute)
+        self.assertEqual(len(calls), 4)
+
+    def test_large_results_are_not_kept(self):
+        results = SearchResultCache(max_ids=2)
+        calls = []
+
+        def compute(limit):
+            calls.append(limit)
+            return range(limit)
+
+        self.assertIsNone(results.get(("big",), compute))
+        self.assertIsNone(results.get(("big",), compute))
+        self.assertEqual(calls, [3, 3])
+
+    def test_failure_is_not_shared(self):
+        results = SearchResultCache()
+
+        def fail(limit):
+            raise RuntimeError("database down")
+
+        with self.assertRaises(RuntimeError):
+            results.get(("key",), fail)
+        self.assertEqual(results.get(("key",), lambda limit: [1]), [1])
@@ -0,0 +1,251 @@
+"""Tests for recurring event series"""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization, Profile
+from events.models import Event, EventSeries
+
+User = get_user_model()
+
+START = datetime(2030, 1, 7, 18, 0, tzinfo=dt_timezone.utc)
+
+
+def _setup(test):
+    test.organizer = User.objects.create_user(
+        username="organizer", email="organizer@example.com", password="pass123"
+    )
+    test.organizer.profile.role = Profile.Role.ORGANIZER
+    test.organizer.profile.save()
+    test.organization = Organization.objects.create(
+        name="Test Organization", owner=test.organizer
+    )
+    test.series = EventSeries.objects.create(
+        name="Language Exchange",
+        category="SOCIAL",
+        organizer=test.organizer,
+        organization=test.organization,
+        start=START,
+        capacity=10,
+    )
+
+
+class EventSeriesModelTest(TestCase):
+    def setUp(self):
+        _setup(self)
+
+    def test_occurrences_in_window(self):
+        window = list(
+            self.series.occurrences(
+                START + timedelta(days=1), START + timedelta(weeks=3)
+            )
+        )
+        self.assertEqual(
+            window, [START + timedelta(weeks=1), START + timedelta(weeks=2)]
+        )
+
+    def test_occurrences_jump_to_window(self):
+        # A window ten years out yields one row, without walking the series
+        later = START + timedelta(weeks=520)
+        window = list(self.series.occurrences(later, later + timedelta(days=7)))
+        self.assertEqual(window, [later])
+
+    def test_interval_and_until(self):
+        self.series.interval = 2
+        self.series.until = START + timedelta(weeks=4)
+        window = list(self.series.occurrences(START, START + timedelta(weeks=10)))
+        self.assertEqual(
+            window, [START, START + timedelta(weeks=2), START + timedelta(weeks=4)]
+        )
+
+    def test_is_occurrence(self):
+        self.assertTrue(self.series.is_occurrence(START + timedelta(weeks=3)))
+        self.assertFalse(self.series.is_occurrence(START + timedelta(days=3)))
+        self.assertFalse(self.series.is_occurrence(START - timedelta(weeks=1)))
+
+    def test_materialize_once(self):
+        date = START + timedelta(weeks=1)
+        event = self.series.materialize(date)
+        self.assertEqual(self.series.materialize(date), event)
+        self.assertEqual(event.name, "Language Exchange")
+        self.assertEqual(event.capacity, 10)
+        self.assertEqual(Event.objects.count(), 1)
+
+        with self.assertRaises(ValueError):
+            self.series.materialize(START + timedelta(days=1))
+
+    def test_materialize_ahead(self):
+        # Weekly from START: five occurrences in the 30 days from then
+        self.assertEqual(self.series.materialize_ahead(START), 5)
+        self.assertEqual(
+            list(Event.objects.values_list("date", flat=True)),
+            [START + timedelta(weeks=week) for week in range(5)],
+        )
+        # A day later the window has not reached a new occurrence
+        self.assertEqual(self.series.materialize_ahead(START + timedelta(days=1)), 0)
+
+    def test_materialize_series_command(self):
+        self.series.start = timezone.now() - timedelta(days=10)
+        self.series.frequency = "DAILY"
+        self.series.save()
+        out = StringIO()
+        call_command("materialize_series", stdout=out)
+        self.assertIn("Materialized 30 occurrence(s).", out.getvalue())
+        call_command("materialize_series", stdout=out)
+        self.assertIn("Materialized 0 occurrence(s).", out.getvalue())
+
+
+class EventSeriesAPITest(APITestCase):
+    def setUp(self):
+        _setup(self)
+        self.client = APIClient()
+        self.calendar = reverse("event-calendar")
+
+    def _calendar(self, start, end):
+        response = self.client.get(
+            self.calendar, {"start": start.isoformat(), "end": end.isoformat()}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_create_series_past_the_horizon_writes_no_events(self):
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.post(
+            reverse("event-series"),
+            {
+                "name": "Football",
+                "category": "SPORTS",
+                "organization": self.organization.pk,
+                "start": START.isoformat(),
+                "frequency": "WEEKLY",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["organizer"], self.organizer.pk)
+        self.assertFalse(Event.objects.exists())
+
+    def test_series_starting_soon_is_listed(self):
+        self.client.force_authenticate(user=self.organizer)
+        self.client.post(
+            reverse("event-series"),
+            {
+                "name": "Football",
+                "category": "SPORTS",
+                "organization": self.organization.pk,
+                "start": (timezone.now() + timedelta(hours=2)).isoformat(),
+                "frequency": "WEEKLY",
+            },
+            format="json",
+        )
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse("upcoming-events"))
+        self.assertEqual([event["name"] for event in response.data][:1], ["Football"])
+        self.assertEqual(Event.objects.filter(name="Football").count(), 5)
+
+    def test_create_series_requires_membership(self):
+        stranger = User.objects.create_user(
+            username="stranger", email="stranger@example.com", password="pass"
+        )
+        self.client.force_authenticate(user=stranger)
+        response = self.client.post(
+            reverse("event-series"),
+            {
+                "name": "Football",
+                "category": "SPORTS",
+                "organization": self.organization.pk,
+                "start": START.isoformat(),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_calendar_merges_events_and_occurrences(self):
+        Event.objects.create(
+            name="One-off",
+            date=START + timedelta(days=2),
+            organizer=self.organizer,
+            organization=self.organization,
+        )
+        data = self._calendar(START, START + timedelta(weeks=2))
+        self.assertEqual(
+            [(item["name"], item["id"]) for item in data],
+            [("Language Exchange", None), ("One-off", data[1]["id"])]
+            + [("Language Exchange", None)],
+        )
+        self.assertEqual(data[0]["series"], self.series.pk)
+
+    def test_calendar_skips_materialized_occurrences(self):
+        event = self.series.materialize(START)
+        data = self._calendar(START, START + timedelta(days=1))
+        self.assertEqual([item["id"] for item in data], [event.pk])
+
+        event.status = "Cancelled"
+        event.save()
+        self.assertEqual(self._calendar(START, START + timedelta(days=1)), [])
+
+    def test_calendar_query_count_is_bounded(self):
+        for i in range(5):
+            EventSeries.objects.create(
+                name=f"Series {i}",
+                category="SPORTS",
+                organizer=self.organizer,
+                organization=self.organization,
+                start=START,
+                frequency="DAILY",
+            )
+        with CaptureQueriesContext(connection) as context:
+            data = self._calendar(START, START + timedelta(days=30))
+        self.assertEqual(len(data), 5 * 30 + 5)
+        self.assertLessEqual(len(context.captured_queries), 4)
+
+    def test_calendar_window_is_capped(self):
+        response = self.client.get(
+            self.calendar, {"start": "2030-01-01", "end": "2032-01-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.calendar, {"start": "2030-01-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_register_materializes_occurrence(self):
+        attendee = User.objects.create_user(
+            username="attendee", email="attendee@example.com", password="pass"
+        )
+        self.client.force_authenticate(user=attendee)
+        url = reverse("event-series-participate", kwargs={"pk": self.series.pk})
+        date = (START + timedelta(weeks=1)).isoformat()
+
+        response = self.client.post(url, {"date": date}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        event = Event.objects.get(pk=response.data["event_id"])
+        self.assertEqual(event.series, self.series)
+        self.assertTrue(event.participants.filter(pk=attendee.pk).exists())
+
+        response = self.client.post(url, {"date": date}, format="json")
+        self.assertEqual(response.data["detail"], "Already registered.")
+        self.assertEqual(Event.objects.count(), 1)
+
+    def test_register_rejects_bad_dates(self):
+        self.client.force_authenticate(user=self.organizer)
+        url = reverse("event-series-participate", kwargs={"pk": self.series.pk})
+        off_rule = (START + timedelta(days=1)).isoformat()
+        response = self.client.post(url, {"date": off_rule}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.series.start = timezone.now() - timedelta(weeks=2)
+        self.series.save()
+        past = self.series.start.isoformat()
+        response = self.client.post(url, {"date": past}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Event.objects.exists())
@@ -0,0 +1,86 @@
+"""Tests for the batch per-user event status lookup"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events.models import Event
+
+User = get_user_model()
+
+
+class EventStatusViewTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.events = [
+            Event.objects.create(
+                name=f"Event {i}",
+                date=timezone.now() + timedelta(days=i + 1),
+                capacity=1,
+                organizer=self.user,
+                organization=self.organization,
+            )
+            for i in range(3)
+        ]
+        self.events[0].participants.add(self.user)
+        self.events[1].interested_users.add(self.user)
+        self.url = reverse("event-status")
+
+    def _ids(self, *ids):
+        return {"ids": ",".join(str(pk) for pk in ids)}
+
+    def test_status_map(self):
+        self.client.force_authenticate(user=self.user)
+        ids = [event.pk for event in self.events]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, self._ids(*ids, 999999))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Counters plus one membership query per M2M table
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(
+            response.json(),
+            {
+                str(ids[0]): {
+                    "is_participating": True,
+                    "is_interested": False,
+                    "is_full": True,
+                },
+                str(ids[1]): {
+                    "is_participating": False,
+                    "is_interested": True,
+                    "is_full": False,
+                },
+                str(ids[2]): {
+                    "is_participating": False,
+                    "is_interested": False,
+                    "is_full": False,
+                },
+            },
+        )
+
+    def test_anonymous(self):
+        response = self.client.get(self.url, self._ids(self.events[0].pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()[str(self.events[0].pk)],
+            {"is_participating": False, "is_interested": False, "is_full": True},
+        )
+
+    def test_invalid_ids(self):
+        for params in ({}, {"ids": "1,abc"}, self._ids(*range(1, 502))):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("ids", response.json())
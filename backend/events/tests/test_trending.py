@@ -0,0 +1,150 @@
+"""Tests for the time-decayed trending score of events"""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from importlib import import_module
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization
+from events import trending
+from events.models import Event
+
+User = get_user_model()
+
+# A Wednesday at noon
+NOW = datetime(2030, 6, 5, 12, 0, tzinfo=dt_timezone.utc)
+
+
+def _at(moment):
+    return mock.patch("django.utils.timezone.now", lambda: moment)
+
+
+@_at(NOW)
+class TrendingScoreTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="pass123"
+        )
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.user
+        )
+        self.events = {
+            name: Event.objects.create(
+                name=name,
+                date=NOW + timedelta(days=10),
+                organizer=self.user,
+                organization=self.organization,
+            )
+            for name in ("Quiet", "Steady", "Hot")
+        }
+        self.url = reverse("upcoming-events")
+
+    def _score(self, name):
+        event = Event.objects.get(pk=self.events[name].pk)
+        return trending.decayed(event.trending_score, NOW)
+
+    def test_contributions_decay(self):
+        # Four interests two half-lives ago are worth one now
+        with _at(NOW - 2 * trending.HALF_LIFE):
+            Event.adjust_counter([self.events["Steady"].pk], "interest_count", 4)
+        Event.adjust_counter([self.events["Hot"].pk], "participant_count", 1)
+
+        self.assertAlmostEqual(self._score("Steady"), 1.0)
+        self.assertAlmostEqual(self._score("Hot"), trending.PARTICIPANT_WEIGHT)
+        self.assertEqual(self._score("Quiet"), 0.0)
+
+    def test_withdrawing_cancels_a_contribution(self):
+        self.client.force_authenticate(user=self.user)
+        url = reverse("event-interested", args=[self.events["Hot"].pk])
+        self.client.post(url)
+        self.assertAlmostEqual(self._score("Hot"), trending.INTEREST_WEIGHT)
+        self.client.delete(url)
+        self.assertEqual(Event.objects.get(pk=self.events["Hot"].pk).trending_score, 0)
+
+    def test_withdrawing_takes_back_what_was_added(self):
+        other = User.objects.create_user(username="other", password="pass123")
+        url = reverse("event-interested", args=[self.events["Hot"].pk])
+        self.client.force_authenticate(user=self.user)
+        with _at(NOW - trending.HALF_LIFE):
+            self.client.post(url)
+        self.client.force_authenticate(user=other)
+        self.client.post(url)
+        self.assertAlmostEqual(self._score("Hot"), 1.5 * trending.INTEREST_WEIGHT)
+
+        # The older interest is worth half as much by now, and so is what
+        # withdrawing it takes away
+        self.client.force_authenticate(user=self.user)
+        self.client.delete(url)
+        self.assertAlmostEqual(self._score("Hot"), trending.INTEREST_WEIGHT)
+
+        self.events["Hot"].interested_users.clear()
+        self.assertEqual(Event.objects.get(pk=self.events["Hot"].pk).trending_score, 0)
+
+    def test_migration_backfills_scores(self):
+        migration = import_module("events.migrations.0027_backfill_trending_score")
+        Event.objects.filter(pk=self.events["Hot"].pk).update(
+            participant_count=1, interest_count=3
+        )
+        migration.backfill_trending_score(apps, None)
+        self.assertAlmostEqual(
+            self._score("Hot"),
+            trending.PARTICIPANT_WEIGHT + 3 * trending.INTEREST_WEIGHT,
+        )
+        self.assertEqual(self._score("Quiet"), 0.0)
+
+    def test_saving_keeps_the_score(self):
+        event = self.events["Hot"]
+        Event.adjust_counter([event.pk], "interest_count", 1)
+        event.name = "Renamed"
+        event.save()
+        self.assertAlmostEqual(self._score("Hot"), trending.INTEREST_WEIGHT)
+
+    def test_ordering_trending(self):
+        with _at(NOW - timedelta(days=3)):
+            Event.adjust_counter([self.events["Steady"].pk], "interest_count", 5)
+        Event.adjust_counter([self.events["Hot"].pk], "interest_count", 1)
+
+        response = self.client.get(self.url, {"ordering": "trending"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Events without any activity are not trending
+        self.assertEqual([e["name"] for e in response.json()], ["Hot", "Steady"])
+
+    def test_trending_pages(self):
+        with _at(NOW - timedelta(days=3)):
+            Event.adjust_counter([self.events["Steady"].pk], "interest_count", 5)
+        Event.adjust_counter([self.events["Hot"].pk], "interest_count", 1)
+        Event.adjust_counter([self.events["Quiet"].pk], "interest_count", 1)
+
+        # Without pagination parameters, one page as a plain array
+        response = self.client.get(self.url, {"ordering": "trending"})
+        self.assertEqual(
+            [e["name"] for e in response.json()], ["Hot", "Quiet", "Steady"]
+        )
+
+        names = []
+        response = self.client.get(self.url, {"ordering": "trending", "page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names += [e["name"] for e in response.json()["results"]]
+            if not response.json()["next"]:
+                break
+            response = self.client.get(response.json()["next"])
+        # Equal scores go by id, newest first
+        self.assertEqual(names, ["Hot", "Quiet", "Steady"])
+
+        previous = self.client.get(response.json()["previous"])
+        self.assertEqual(
+            [e["name"] for e in previous.json()["results"]], ["Hot", "Quiet"]
+        )
+
+    def test_unknown_ordering(self):
+        response = self.client.get(self.url, {"ordering": "popular"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ordering", response.data)
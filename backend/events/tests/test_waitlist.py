@@ -0,0 +1,160 @@
+"""Tests for event waitlists and automatic promotion"""
+
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Organization, Profile
+from events.models import Event, WaitlistEntry
+from notifications.models import Notification
+
+User = get_user_model()
+
+
+class WaitlistTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@example.com", password="pass123"
+        )
+        self.organizer.profile.role = Profile.Role.ORGANIZER
+        self.organizer.profile.save()
+        self.organization = Organization.objects.create(
+            name="Test Organization", owner=self.organizer
+        )
+        self.event = Event.objects.create(
+            name="Popular Trip",
+            date=timezone.now() + timedelta(days=1),
+            organizer=self.organizer,
+            organization=self.organization,
+            capacity=1,
+        )
+        self.attendee = User.objects.create_user(
+            username="attendee", email="attendee@example.com", password="pass"
+        )
+        self.first = User.objects.create_user(
+            username="first", email="first@example.com", password="pass"
+        )
+        self.second = User.objects.create_user(
+            username="second", email="second@example.com", password="pass"
+        )
+        self.event.participants.add(self.attendee)
+        self.url = reverse("event-waitlist", kwargs={"pk": self.event.pk})
+
+    def _join(self, user):
+        self.client.force_authenticate(user=user)
+        return self.client.post(self.url)
+
+    def test_join_full_event(self):
+        response = self._join(self.first)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["detail"], "Added to the waitlist.")
+        self.assertEqual(response.data["position"], 1)
+
+        response = self._join(self.second)
+        self.assertEqual(response.data["position"], 2)
+        self.assertEqual(response.data["waitlist_count"], 2)
+
+    def test_join_twice(self):
+        self._join(self.first)
+        response = self._join(self.first)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["detail"], "Already on the waitlist.")
+
+    def test_join_with_free_seat_registers(self):
+        self.event.participants.remove(self.attendee)
+        response = self._join(self.first)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["detail"], "Participation registered.")
+        self.assertTrue(self.event.participants.filter(pk=self.first.pk).exists())
+
+    def test_queued_user_registered_with_free_seat(self):
+        self._join(self.first)
+        self._join(self.second)
+        # A seat frees up without promoting anyone
+        self.event.participants.remove(self.attendee)
+
+        response = self._join(self.first)
+        self.assertEqual(response.data["detail"], "Participation registered.")
+        response = self.client.get(self.url)
+        self.assertFalse(response.data["on_waitlist"])
+
+        self.client.force_authenticate(user=self.second)
+        self.assertEqual(self.client.get(self.url).data["position"], 1)
+
+    def test_duplicate_registration_releases_the_seat(self):
+        self.event.capacity = 2
+        self.event.save()
+        # A duplicate request that slipped past the registered check
+        with mock.patch("django.db.models.query.QuerySet.exists", return_value=False):
+            response = self._join(self.attendee)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["detail"], "Already registered.")
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.participant_count, 1)
+
+    def test_leave_waitlist(self):
+        self._join(self.first)
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_position(self):
+        self._join(self.first)
+        self._join(self.second)
+        response = self.client.get(self.url)
+        self.assertTrue(response.data["on_waitlist"])
+        self.assertEqual(response.data["position"], 2)
+
+    def test_head_promoted_when_participant_leaves(self):
+        self._join(self.first)
+        self._join(self.second)
+
+        self.client.force_authenticate(user=self.attendee)
+        url = reverse("event-participate", kwargs={"pk": self.event.pk})
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["participant_count"], 1)
+        self.assertTrue(response.data["is_full"])
+
+        self.assertTrue(self.event.participants.filter(pk=self.first.pk).exists())
+        self.assertEqual(
+            list(WaitlistEntry.objects.values_list("user", flat=True)),
+            [self.second.pk],
+        )
+        notification = Notification.objects.get(user=self.first)
+        self.assertIn("Popular Trip", notification.title)
+
+    def test_capacity_raise_promotes(self):
+        self._join(self.first)
+        self._join(self.second)
+
+        self.client.force_authenticate(user=self.organizer)
+        url = reverse("event-detail", kwargs={"pk": self.event.pk})
+        response = self.client.patch(
+            url, json.dumps({"capacity": 3}), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["participant_count"], 3)
+        self.assertFalse(WaitlistEntry.objects.exists())
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_direct_registration_leaves_waitlist(self):
+        self._join(self.first)
+        self.event.capacity = 2
+        self.event.save()
+
+        self.client.force_authenticate(user=self.first)
+        url = reverse("event-participate", kwargs={"pk": self.event.pk})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(WaitlistEntry.objects.exists())
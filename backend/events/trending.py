@@ -0,0 +1,104 @@
+"""
+Time-decayed trending score of events.
+
+A participation is worth PARTICIPANT_WEIGHT and an interest INTEREST_WEIGHT,
+and each halves in value every HALF_LIFE. Decaying scores as time passes
+would mean rewriting every event on a schedule. Instead, a contribution made
+at time t is stored scaled up by exp((t - EPOCH) / TAU). Every score would
+decay by the same factor, so the stored values rank events exactly as the
+decayed scores do, at any moment, and a change only writes its own event.
+
+Event.trending_score holds the natural log of that sum, which stays in float
+range (it grows by ln 2 per HALF_LIFE). 0 means no activity. bump() adds or
+removes a contribution with a log-add-exp expression, so the counter UPDATEs
+in Event.adjust_counter() and Event.claim_seat() keep it current in the same
+statement. A removal takes back exactly what was added: memberships keep
+their created_at, which is when their contribution was made.
+"""
+
+import math
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.functions import Abs, Exp, Greatest, Ln
+from django.utils import timezone
+
+# Changing either invalidates the stored scores
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+HALF_LIFE = timedelta(days=1)
+TAU = HALF_LIFE.total_seconds() / math.log(2)
+
+PARTICIPANT_WEIGHT = 2.0
+INTEREST_WEIGHT = 1.0
+
+WEIGHTS = {
+    "participant_count": PARTICIPANT_WEIGHT,
+    "interest_count": INTEREST_WEIGHT,
+}
+
+
+def _elapsed(now):
+    return (now - EPOCH).total_seconds() / TAU
+
+
+def contribution(weight, now=None):
+    """The stored (log) value of a contribution of ``weight`` made ``now``."""
+    return math.log(weight) + _elapsed(now or timezone.now())
+
+
+def contributions(weight, moments):
+    """The stored (log) value of contributions of ``weight`` made at ``moments``."""
+    return score([(weight, moment) for moment in moments])
+
+
+def score(made):
+    """
+    The stored trending_score of contributions given as (weight, moment)
+    pairs, e.g. rebuilt from the memberships of an event.
+    """
+    if not made:
+        return 0.0
+    exponents = [math.log(weight) + _elapsed(moment) for weight, moment in made]
+    top = max(exponents)
+    return top + math.log(sum(math.exp(exponent - top) for exponent in exponents))
+
+
+def decayed(score, now=None):
+    """The score a stored trending_score is worth ``now``."""
+    if score <= 0:
+        return 0.0
+    return math.exp(score - _elapsed(now or timezone.now()))
+
+
+def bump(field, delta, now=None, made_at=()):
+    """
+    Expression for Event.trending_score once the counter ``field`` has moved
+    by ``delta``, for use in the same UPDATE. A removal takes back the
+    contributions made at ``made_at``, one moment per unit; any it has no
+    moment for, such as a seat released right after it was claimed, count
+    as made ``now``.
+    """
+    now = now or timezone.now()
+    moments = list(made_at)[: abs(delta)]
+    moments += [now] * (abs(delta) - len(moments))
+    value = contributions(WEIGHTS[field], moments)
+    score = F("trending_score")
+    added = Value(value, output_field=FloatField())
+    one = Value(1.0, output_field=FloatField())
+    if delta > 0:
+        # log(e^score + e^added), without overflowing exp()
+        return Greatest(score, added) + Ln(one + Exp(-Abs(score - added)))
+    # log(e^score - e^added), down to 0 once nothing is left. The margin
+    # keeps the argument of Ln() clear of 0.
+    return Case(
+        When(
+            trending_score__gt=value + 1e-9,
+            then=Greatest(
+                score + Ln(one - Exp(added - score)),
+                Value(0.0, output_field=FloatField()),
+            ),
+        ),
+        default=Value(0.0, output_field=FloatField()),
+        output_field=FloatField(),
+    )
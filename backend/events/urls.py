@@ -2,20 +2,32 @@ from django.urls import path
 
 from .views import (
     AllEventsListView,
+    BulkCreateEventView,
     CancelEventView,
     CreateEventView,
+    EventCalendarView,
+    EventChangesView,
     EventInterestedUsersView,
+    EventListCacheStatsView,
     EventParticipantsView,
     EventRetrieveUpdateDestroyView,
+    EventSeriesListCreateView,
+    EventStatusView,
+    EventUserStateView,
     InterestEventView,
     MyOrganizedEventsView,
     ParticipateEventView,
     PastEventsListView,
+    PublicPastEventsListView,
+    PublicUpcomingEventsListView,
+    SeriesParticipateView,
     UncancelEventView,
+    UpcomingEventFacetsView,
     UpcomingEventsListView,
     UserInterestedEventsView,
     UserOrganizedEventsView,
     UserRegisteredEventsView,
+    WaitlistEventView,
 )
 
 urlpatterns = [
@@ -26,8 +38,39 @@ urlpatterns = [
         name="event-detail",
     ),
     path("events/upcoming/", UpcomingEventsListView.as_view(), name="upcoming-events"),
+    path(
+        "events/upcoming/facets/",
+        UpcomingEventFacetsView.as_view(),
+        name="upcoming-event-facets",
+    ),
     path("events/past/", PastEventsListView.as_view(), name="past-events"),
+    path(
+        "events/upcoming/public/",
+        PublicUpcomingEventsListView.as_view(),
+        name="public-upcoming-events",
+    ),
+    path(
+        "events/past/public/",
+        PublicPastEventsListView.as_view(),
+        name="public-past-events",
+    ),
+    path("events/changes/", EventChangesView.as_view(), name="event-changes"),
+    path("events/status/", EventStatusView.as_view(), name="event-status"),
+    path("events/me/state/", EventUserStateView.as_view(), name="event-user-state"),
+    path(
+        "events/cache-stats/",
+        EventListCacheStatsView.as_view(),
+        name="event-list-cache-stats",
+    ),
     path("events/create/", CreateEventView.as_view(), name="create_event"),
+    path("events/bulk/", BulkCreateEventView.as_view(), name="event-bulk-create"),
+    path("events/calendar/", EventCalendarView.as_view(), name="event-calendar"),
+    path("events/series/", EventSeriesListCreateView.as_view(), name="event-series"),
+    path(
+        "events/series/<int:pk>/participate/",
+        SeriesParticipateView.as_view(),
+        name="event-series-participate",
+    ),
     path("events/<int:pk>/cancel/", CancelEventView.as_view(), name="event-cancel"),
     path(
         "events/<int:pk>/uncancel/", UncancelEventView.as_view(), name="event-uncancel"
@@ -57,6 +100,11 @@ urlpatterns = [
         InterestEventView.as_view(),
         name="event-interested",
     ),
+    path(
+        "events/<int:pk>/waitlist/",
+        WaitlistEventView.as_view(),
+        name="event-waitlist",
+    ),
     path(
         "events/my-organized/",
         MyOrganizedEventsView.as_view(),
@@ -1,25 +1,96 @@
+import csv
+import io
 from datetime import timedelta
 
-from django.db.models import Q
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, IntegerField, Q, Value, When
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import generics, status
-from rest_framework.exceptions import NotFound, PermissionDenied
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.permissions import (
+    SAFE_METHODS,
+    AllowAny,
+    IsAdminUser,
+    IsAuthenticated,
+    IsAuthenticatedOrReadOnly,
+)
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Event
-from .serializers import EventSerializer, UserSerializer
+from . import outbox
+from .archive import ArchiveListMixin, reaches_archive
+from .cache import (
+    AnonymousListCacheMixin,
+    PublicListMixin,
+    cached_facets,
+    event_fragments,
+    event_list_etag,
+    get_stats,
+    invalidate_event_lists,
+    invalidate_organization_list,
+    search_results,
+)
+from .fastpath import ValuesListMixin
+from .filters import (
+    DATE_FILTERS,
+    EventFilterMixin,
+    EventFilters,
+    date_filter_range,
+    parse_event_filters,
+    parse_moment,
+)
+from .models import (
+    ArchivedEvent,
+    Event,
+    EventCard,
+    EventSeries,
+    EventTombstone,
+    Interest,
+    Participation,
+    WaitlistEntry,
+)
+from .pagination import (
+    EventKeysetPagination,
+    ReverseEventKeysetPagination,
+    TrendingKeysetPagination,
+    decode_sync_token,
+    encode_sync_token,
+)
+from .queries import with_archive_annotations, with_list_annotations
+from .search import get_search_backend
+from .serializers import (
+    EventBulkRowSerializer,
+    EventListSerializer,
+    EventOccurrenceSerializer,
+    EventSerializer,
+    EventSeriesSerializer,
+    PublicEventListSerializer,
+    UserSerializer,
+    event_fields,
+)
 
 
 class EventListCreateView(generics.ListCreateAPIView):
     serializer_class = EventSerializer
 
+    def get_serializer_class(self):
+        if self.request.method == "GET":
+            return EventListSerializer
+        return EventSerializer
+
     def get_queryset(self):
         """Only return events that have an organization"""
-        return Event.objects.filter(organization__isnull=False).select_related(
-            "organization", "organizer"
+        return with_list_annotations(
+            Event.objects.filter(organization__isnull=False),
+            self.request.user,
+            fields=event_fields(self.request, self.get_serializer_class()),
         )
 
     def create(self, request, *args, **kwargs):
@@ -68,11 +139,71 @@ class EventListCreateView(generics.ListCreateAPIView):
         )
 
 
-class AllEventsListView(generics.ListAPIView):
-    serializer_class = EventSerializer
+@method_decorator(condition(etag_func=event_list_etag), name="list")
+class AllEventsListView(AnonymousListCacheMixin, generics.ListAPIView):
+    """
+    Every event, or exactly the events of ``?ids=1,2,3`` in that order.
+    POST ``{"ids": [...]}`` fetches the same for id lists too long for a URL.
+    """
+
+    serializer_class = EventListSerializer
+    pagination_class = EventKeysetPagination
+    permission_classes = [AllowAny]
+    max_ids = 500
 
     def get_queryset(self):
-        return Event.objects.all()
+        return with_list_annotations(
+            Event.objects.all(),
+            self.request.user,
+            fields=event_fields(self.request, EventListSerializer),
+        )
+
+    def list(self, request, *args, **kwargs):
+        if "ids" in request.query_params:
+            ids = _parse_ids(request.query_params["ids"], self.max_ids)
+            return Response(self._get_many(request, ids))
+        return super().list(request, *args, **kwargs)
+
+    def post(self, request):
+        ids = request.data.get("ids")
+        if not isinstance(ids, list):
+            raise ValidationError({"ids": ["Expected a list of ids."]})
+        ids = _parse_ids(",".join(str(pk) for pk in ids), self.max_ids)
+        return Response(self._get_many(request, ids))
+
+    def _get_many(self, request, ids):
+        """
+        The events of ``ids`` that exist, in the order asked for. Their public
+        fields come from the per-event fragment cache, and only the misses
+        are read, in one query; the user's flags are merged in afterwards.
+        """
+
+        def build(missing):
+            events = with_list_annotations(
+                Event.objects.filter(pk__in=missing),
+                fields=set(PublicEventListSerializer.Meta.fields),
+            )
+            data = PublicEventListSerializer(events, many=True).data
+            return {item["id"]: item for item in data}
+
+        fragments = event_fragments(ids, build)
+        participating = _member_of(Event.participants.through, request.user, ids)
+        interested = _member_of(Event.interested_users.through, request.user, ids)
+
+        # The POST form is a read too, with its ids in the body
+        selected = event_fields(request, EventListSerializer, any_method=True)
+        fields = [name for name in EventListSerializer.Meta.fields if name in selected]
+        results = []
+        for pk in ids:
+            if pk not in fragments:
+                continue
+            item = {
+                **fragments[pk],
+                "is_participating": pk in participating,
+                "is_interested": pk in interested,
+            }
+            results.append({name: item[name] for name in fields})
+        return results
 
 
 class EventRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
@@ -81,8 +212,26 @@ class EventRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """Only return events that have an organization"""
-        return Event.objects.filter(organization__isnull=False).select_related(
-            "organization", "organizer"
+        return with_list_annotations(
+            Event.objects.filter(organization__isnull=False),
+            self.request.user,
+            fields=event_fields(self.request),
+        )
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            # Archived events can still be read, but not changed
+            if self.request.method not in SAFE_METHODS or not reaches_archive(None):
+                raise
+        return get_object_or_404(
+            with_archive_annotations(
+                ArchivedEvent.objects.all(),
+                self.request.user,
+                fields=event_fields(self.request),
+            ),
+            pk=self.kwargs["pk"],
         )
 
     def update(self, request, *args, **kwargs):
@@ -117,7 +266,11 @@ class EventRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
+        with transaction.atomic():
+            self.perform_update(serializer)
+            if "capacity" in serializer.validated_data:
+                # A raised (or removed) capacity frees seats for the waitlist
+                instance.promote_waitlist()
 
         return Response(serializer.data)
 
@@ -148,87 +301,234 @@ class EventRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class UpcomingEventsListView(generics.ListAPIView):
-    serializer_class = EventSerializer
+@method_decorator(condition(etag_func=event_list_etag), name="list")
+class UpcomingEventsListView(
+    AnonymousListCacheMixin, EventFilterMixin, ValuesListMixin, generics.ListAPIView
+):
+    serializer_class = EventListSerializer
+    pagination_class = EventKeysetPagination
+
+    def _filter(self, queryset):
+        queryset = queryset.filter(organization__isnull=False, status="Active")
+        return self.event_filters.apply(queryset, timezone.now(), upcoming=True)
 
     def get_queryset(self):
-        now = timezone.now()
-        date_filter = self.request.query_params.get("date_filter", None)
+        queryset = with_list_annotations(
+            self._filter(Event.objects.all()),
+            self.request.user,
+            fields=event_fields(self.request, self.get_serializer_class()),
+        ).order_by("date", "id")
 
-        # Base filters
-        base_filters = {
-            "organization__isnull": False,
-            "status": "Active",
-        }
+        search = self.request.query_params.get("search", None)
+        if search:
+            queryset = self._search(queryset, search)
 
-        # Handle date filtering
-        if date_filter == "today":
-            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-            # For today, we want events that are today AND in the future
-            base_filters["date__gte"] = now
-            base_filters["date__lte"] = end_of_day
-        elif date_filter == "tomorrow":
-            tomorrow_start = (now + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            tomorrow_end = tomorrow_start.replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
-            base_filters["date__gte"] = tomorrow_start
-            base_filters["date__lte"] = tomorrow_end
-        elif date_filter == "this_week":
-            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            days_until_sunday = (6 - now.weekday()) % 7
-            end_of_week = (now + timedelta(days=days_until_sunday)).replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
-            base_filters["date__gte"] = start_of_day
-            base_filters["date__lte"] = end_of_week
-        else:
-            # Default: only future events
-            base_filters["date__gte"] = now
+        if self._trending():
+            # The most active events first. Events without any activity are
+            # left out, which also lets this walk events_status_trending_id_idx.
+            queryset = queryset.filter(trending_score__gt=0).order_by(
+                "-trending_score", "-id"
+            )
+            paginator = self.paginator
+            params = self.request.query_params
+            if (
+                paginator.cursor_query_param not in params
+                and paginator.page_size_query_param not in params
+            ):
+                # Unpaginated requests get the first page as a plain array
+                queryset = queryset[: paginator.get_page_size(self.request)]
 
-        queryset = (
-            Event.objects.filter(**base_filters)
-            .select_related("organization", "organizer")
-            .order_by("date")
+        return queryset
+
+    def _trending(self):
+        ordering = self.request.query_params.get("ordering", "date")
+        if ordering not in ("date", "trending"):
+            raise ValidationError({"ordering": ["Expected one of: date, trending."]})
+        return ordering == "trending"
+
+    def _search(self, queryset, search):
+        """
+        Narrow ``queryset`` to the matches of ``search``, reading the match
+        ids from the search result cache.
+        """
+        backend = get_search_backend()
+        filters = (
+            type(backend).__name__,
+            backend.normalize(search),
+            self.event_filters,
         )
 
-        categories = self.request.query_params.getlist("category", [])
-        if categories:
-            queryset = queryset.filter(category__in=categories)
+        def compute(limit):
+            matches = backend.search(self._filter(Event.objects.all()), search)
+            return matches.values_list("pk", flat=True)[:limit]
+
+        ids = search_results.get(filters, compute)
+        if ids is None:
+            # Too many matches to keep; let the database do the whole job
+            return backend.search(queryset, search)
+        if not ids:
+            return queryset.none()
+        queryset = queryset.filter(pk__in=ids)
+        if backend.ranked:
+            rank = Case(
+                *[When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)],
+                output_field=IntegerField(),
+            )
+            queryset = queryset.order_by(rank)
+        return queryset
+
+    def get_card_queryset(self):
+        # The search backends match against events_event rows, and the cards
+        # carry no trending score
+        if self.request.query_params.get("search") or self._trending():
+            return None
+        return self._filter(EventCard.objects.all()).order_by("date", "event_id")
+
+    @property
+    def paginator(self):
+        # Trending events are walked by a (trending_score, id) cursor instead,
+        # and relevance-ranked search results cannot be walked at all
+        if self._trending():
+            if not hasattr(self, "_trending_paginator"):
+                self._trending_paginator = TrendingKeysetPagination()
+            return self._trending_paginator
+        if self.request.query_params.get("search") and get_search_backend().ranked:
+            return None
+        return super().paginator
+
+
+class UpcomingEventFacetsView(APIView):
+    """
+    Counts for the filters of the upcoming events page, per category and per
+    date filter. Each facet is counted under every other current filter, so
+    category counts ignore the selected categories and date filter counts
+    ignore the selected date filter. One GROUP BY query, cached briefly.
+    """
 
-        date_from = self.request.query_params.get("date_from", None)
-        date_to = self.request.query_params.get("date_to", None)
-        if date_from:
-            queryset = queryset.filter(date__gte=date_from)
-        if date_to:
-            queryset = queryset.filter(date__lte=f"{date_to} 23:59:59")
+    permission_classes = [AllowAny]
 
-        search = self.request.query_params.get("search", None)
+    def get(self, request):
+        return Response(cached_facets(request, lambda: self._count(request)))
+
+    def _count(self, request):
+        params = request.query_params
+        filters = parse_event_filters(params)
+        now = timezone.now()
+        ranges = {
+            name or "all": date_filter_range(name, now)
+            for name in (None, *DATE_FILTERS)
+        }
+        # Only date_from and date_to apply to every bucket
+        events = EventFilters(start=filters.start, end=filters.end).apply(
+            Event.objects.filter(organization__isnull=False, status="Active"), now
+        )
+        events = events.filter(date__gte=min(start for start, _ in ranges.values()))
+        search = params.get("search", None)
         if search:
-            queryset = queryset.filter(
-                Q(name__icontains=search)
-                | Q(description__icontains=search)
-                | Q(category__icontains=search)
-            )
+            matches = get_search_backend().search(events, search)
+            events = Event.objects.filter(pk__in=matches.values("pk"))
+
+        buckets = {}
+        for name, (start, end) in ranges.items():
+            in_range = Q(date__gte=start)
+            if end is not None:
+                in_range &= Q(date__lt=end)
+            buckets[name] = Count("pk", filter=in_range)
+        rows = events.order_by().values("category").annotate(**buckets)
+
+        selected = filters.date_filter or "all"
+        chosen = set(filters.categories)
+        categories = {value: 0 for value, _ in Event.CATEGORY_CHOICES}
+        date_filters = dict.fromkeys(buckets, 0)
+        for row in rows:
+            categories[row["category"]] = row[selected]
+            if not chosen or row["category"] in chosen:
+                for name in date_filters:
+                    date_filters[name] += row[name]
+        return {"categories": categories, "date_filters": date_filters}
+
+
+@method_decorator(condition(etag_func=event_list_etag), name="list")
+class PastEventsListView(
+    AnonymousListCacheMixin,
+    EventFilterMixin,
+    ArchiveListMixin,
+    ValuesListMixin,
+    generics.ListAPIView,
+):
+    serializer_class = EventListSerializer
+    pagination_class = ReverseEventKeysetPagination
+
+    def _filter(self, queryset):
+        now = timezone.now()
+        queryset = queryset.filter(date__lt=now, status="Active")
+        return self.event_filters.apply(queryset, now)
 
-        return queryset
+    def get_queryset(self):
+        return with_list_annotations(
+            self._filter(Event.objects.filter(organization__isnull=False)),
+            self.request.user,
+            fields=event_fields(self.request, self.get_serializer_class()),
+        ).order_by("-date", "-id")
 
+    def get_card_queryset(self):
+        return self._filter(EventCard.objects.all()).order_by("-date", "-event_id")
 
-class PastEventsListView(generics.ListAPIView):
-    serializer_class = EventSerializer
+    def get_archive_queryset(self):
+        start, _ = self.event_filters.date_range(timezone.now())
+        if not reaches_archive(start):
+            return None
+        return with_archive_annotations(
+            self._filter(ArchivedEvent.objects.all()),
+            self.request.user,
+            fields=event_fields(self.request, self.get_serializer_class()),
+        ).order_by("-date", "-id")
 
-    def get_queryset(self):
-        now = timezone.now()
-        return (
-            Event.objects.filter(
-                date__lt=now, status="Active", organization__isnull=False
+
+class PublicUpcomingEventsListView(PublicListMixin, UpcomingEventsListView):
+    """Upcoming events without per-user flags, cacheable by shared caches"""
+
+    serializer_class = PublicEventListSerializer
+
+
+class PublicPastEventsListView(PublicListMixin, PastEventsListView):
+    """Past events without per-user flags, cacheable by shared caches"""
+
+    serializer_class = PublicEventListSerializer
+
+
+class EventUserStateView(APIView):
+    """
+    Ids of the events the current user participates in and is interested
+    in, for clients to merge into the public lists.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        state = {
+            key: list(
+                through.objects.filter(user_id=request.user.pk)
+                .order_by("event_id")
+                .values_list("event_id", flat=True)
             )
-            .select_related("organization", "organizer")
-            .order_by("-date")
-        )
+            for key, through in (
+                ("participating", Event.participants.through),
+                ("interested", Event.interested_users.through),
+            )
+        }
+        response = Response(state)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class EventListCacheStatsView(APIView):
+    """Hit/miss counters of the anonymous event list cache (staff only)"""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_stats())
 
 
 class CreateEventView(generics.CreateAPIView):
@@ -281,29 +581,204 @@ class CreateEventView(generics.CreateAPIView):
         )
 
 
-class UserRegisteredEventsView(generics.ListAPIView):
-    serializer_class = EventSerializer
+class BulkCreateEventView(APIView):
+    """
+    Create a batch of events from a JSON array or a CSV upload.
+
+    JSON bodies are either an array of events or
+    ``{"organization": <id>, "events": [...]}``. CSV uploads go in the
+    ``file`` field with a header row of field names, plus an optional
+    ``organization`` form field. Rows without an organization use the
+    batch-level one. Every row is validated before anything is written: a
+    single invalid row rejects the batch, and errors are reported per row.
+    """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [JSONParser, MultiPartParser]
+    max_rows = 500
+
+    def post(self, request):
+        from accounts.models import Organization
+
+        rows, default_organization = self._read_rows(request)
+        if not rows:
+            raise ValidationError({"detail": "No events to create."})
+        if len(rows) > self.max_rows:
+            raise ValidationError(
+                {"detail": f"At most {self.max_rows} events can be created at once."}
+            )
+
+        errors = {}
+        valid = {}
+        for index, row in enumerate(rows):
+            serializer = EventBulkRowSerializer(data=row)
+            if serializer.is_valid():
+                valid[index] = serializer.validated_data
+            else:
+                errors[index] = serializer.errors
+
+        # Permissions are checked once per organization, not once per row
+        organization_ids = {
+            data.get("organization", default_organization) for data in valid.values()
+        } - {None}
+        existing = set(
+            Organization.objects.filter(pk__in=organization_ids).values_list(
+                "pk", flat=True
+            )
+        )
+        allowed = set(
+            Organization.objects.filter(pk__in=existing)
+            .filter(Q(owner=request.user) | Q(collaborators=request.user))
+            .values_list("pk", flat=True)
+        )
+
+        events = []
+        for index, data in valid.items():
+            organization_id = data.pop("organization", default_organization)
+            if organization_id is None:
+                message = "This field is required."
+            elif organization_id not in existing:
+                message = "Organization not found."
+            elif organization_id not in allowed:
+                message = (
+                    "You can only create events for organizations "
+                    "you own or collaborate with."
+                )
+            else:
+                # Passing the organizer keeps get_default_organizer from
+                # running once per row
+                events.append(
+                    Event(
+                        organizer=request.user,
+                        organization_id=organization_id,
+                        **data,
+                    )
+                )
+                continue
+            errors[index] = {"organization": [message]}
+
+        if errors:
+            return Response(
+                {
+                    "errors": [
+                        {"row": index + 1, "errors": errors[index]}
+                        for index in sorted(errors)
+                    ]
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        with transaction.atomic():
+            events = Event.objects.bulk_create(events)
+            # bulk_create sends no signals; do what their receivers would
+            event_ids = [event.pk for event in events]
+            outbox.record_many(
+                outbox.EVENT_SAVED,
+                [{"id": pk, "created": True} for pk in event_ids],
+            )
+            EventCard.refresh(event_ids)
+            invalidate_event_lists({event.organization_id for event in events})
+            invalidate_organization_list()
+
+        return Response(
+            {"created": len(event_ids), "ids": event_ids},
+            status=status.HTTP_201_CREATED,
+        )
+
+    def _read_rows(self, request):
+        """Return the rows of the upload and its batch-level organization."""
+        data = request.data
+        if isinstance(data, list):
+            return data, None
+
+        default_organization = data.get("organization") or None
+        if default_organization is not None:
+            try:
+                default_organization = int(default_organization)
+            except (TypeError, ValueError):
+                raise ValidationError({"organization": ["Organization not found."]})
+
+        upload = request.FILES.get("file")
+        if upload is None:
+            rows = data.get("events")
+            if not isinstance(rows, list):
+                raise ValidationError(
+                    {"events": ["Expected a list of events or a CSV file."]}
+                )
+            return rows, default_organization
+
+        try:
+            text = upload.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise ValidationError({"file": ["The CSV file must be UTF-8 encoded."]})
+        rows = [
+            # Blank cells mean "not given", so optional columns can stay empty
+            {key.strip(): value.strip() for key, value in row.items() if key and value}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+        return rows, default_organization
+
+
+def _archived_member_events(request, relation):
+    """
+    The archived events ``request.user`` is a member of through ``relation``,
+    for ArchiveListMixin, or None while nothing is archived.
+    """
+    if not reaches_archive(None):
+        return None
+    return with_archive_annotations(
+        ArchivedEvent.objects.filter(
+            memberships__user=request.user, memberships__relation=relation
+        ),
+        request.user,
+        fields=event_fields(request, EventListSerializer),
+    ).order_by("date", "id")
+
+
+class UserRegisteredEventsView(ArchiveListMixin, generics.ListAPIView):
+    serializer_class = EventListSerializer
+    pagination_class = EventKeysetPagination
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return self.request.user.participating_events.all()
+        return with_list_annotations(
+            self.request.user.participating_events.all(),
+            self.request.user,
+            fields=event_fields(self.request, EventListSerializer),
+        )
 
+    def get_archive_queryset(self):
+        return _archived_member_events(self.request, "participants")
 
-class UserInterestedEventsView(generics.ListAPIView):
-    serializer_class = EventSerializer
+
+class UserInterestedEventsView(ArchiveListMixin, generics.ListAPIView):
+    serializer_class = EventListSerializer
+    pagination_class = EventKeysetPagination
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return self.request.user.interested_events.all()
+        return with_list_annotations(
+            self.request.user.interested_events.all(),
+            self.request.user,
+            fields=event_fields(self.request, EventListSerializer),
+        )
+
+    def get_archive_queryset(self):
+        return _archived_member_events(self.request, "interested_users")
 
 
 class UserOrganizedEventsView(generics.ListAPIView):
-    serializer_class = EventSerializer
+    serializer_class = EventListSerializer
+    pagination_class = EventKeysetPagination
     permission_classes = [IsAuthenticated]
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Event.objects.filter(organizer=self.request.user)
+        return with_list_annotations(
+            Event.objects.filter(organizer=self.request.user),
+            self.request.user,
+            fields=event_fields(self.request, EventListSerializer),
+        )
 
 
 class CancelEventView(APIView):
@@ -332,8 +807,10 @@ class CancelEventView(APIView):
         else:
             raise PermissionDenied("You do not have permission to cancel this event.")
 
-        event.status = "Canceled"
-        event.save()
+        # The outbox entry commits with the change it records
+        with transaction.atomic():
+            event.status = "Canceled"
+            event.save()
 
         serializer = EventSerializer(event)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -368,8 +845,9 @@ class UncancelEventView(APIView):
         if event.status != "Canceled":
             return Response({"error": "Event is not canceled."}, status=400)
 
-        event.status = "Active"
-        event.save()
+        with transaction.atomic():
+            event.status = "Active"
+            event.save()
 
         serializer = EventSerializer(event)
         return Response(serializer.data, status=200)
@@ -381,51 +859,71 @@ class ParticipateEventView(APIView):
     def post(self, request, pk):
         event = get_object_or_404(Event, pk=pk)
         user = request.user
+        Participant = Event.participants.through
 
-        if event.participants.filter(pk=user.pk).exists():
-            is_full = (
-                event.capacity is not None
-                and event.capacity > 0
-                and event.participants.count() >= event.capacity
-            )
+        if Participant.objects.filter(event_id=event.pk, user_id=user.pk).exists():
             return Response(
                 {
                     "detail": "Already registered.",
-                    "participant_count": event.participants.count(),
+                    "participant_count": event.participant_count,
                     "is_participating": True,
-                    "is_full": is_full,
+                    "is_full": event.is_full,
                 },
                 status=status.HTTP_200_OK,
             )
 
-        # Check if event is full (only if capacity is set and > 0)
-        if (
-            event.capacity is not None
-            and event.capacity > 0
-            and event.participants.count() >= event.capacity
-        ):
+        # Claim a seat and insert the registration as one atomic step. The
+        # conditional UPDATE takes the row lock (the write lock on SQLite)
+        # before anything is inserted, so concurrent requests cannot oversell.
+        with transaction.atomic():
+            created = False
+            if Event.claim_seat(event.pk):
+                _, created = Participant.objects.get_or_create(
+                    event_id=event.pk, user_id=user.pk
+                )
+                if not created:
+                    # Lost a race against our own duplicate request
+                    Event.adjust_counter([event.pk], "participant_count", -1)
+                else:
+                    WaitlistEntry.objects.filter(
+                        event_id=event.pk, user_id=user.pk
+                    ).delete()
+                    outbox.record_members(
+                        outbox.MEMBERS_ADDED, "participants", [[event.pk, user.pk]]
+                    )
+
+        event.refresh_from_db(fields=["participant_count"])
+
+        if not created:
+            registered = Participant.objects.filter(
+                event_id=event.pk, user_id=user.pk
+            ).exists()
+            if registered:
+                return Response(
+                    {
+                        "detail": "Already registered.",
+                        "participant_count": event.participant_count,
+                        "is_participating": True,
+                        "is_full": event.is_full,
+                    },
+                    status=status.HTTP_200_OK,
+                )
             return Response(
                 {
                     "detail": "Event is full.",
-                    "participant_count": event.participants.count(),
+                    "participant_count": event.participant_count,
                     "is_participating": False,
                     "is_full": True,
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        event.participants.add(user)
-        is_full = (
-            event.capacity is not None
-            and event.capacity > 0
-            and event.participants.count() >= event.capacity
-        )
         return Response(
             {
                 "detail": "Participation registered.",
-                "participant_count": event.participants.count(),
+                "participant_count": event.participant_count,
                 "is_participating": True,
-                "is_full": is_full,
+                "is_full": event.is_full,
             },
             status=status.HTTP_201_CREATED,
         )
@@ -433,33 +931,34 @@ class ParticipateEventView(APIView):
     def delete(self, request, pk):
         event = get_object_or_404(Event, pk=pk)
         user = request.user
-        if not event.participants.filter(pk=user.pk).exists():
-            is_full = (
-                event.capacity is not None
-                and event.capacity > 0
-                and event.participants.count() >= event.capacity
-            )
+
+        with transaction.atomic():
+            removed = Participation.remove(event.pk, user.pk)
+            if removed:
+                outbox.record_members(
+                    outbox.MEMBERS_REMOVED, "participants", [[event.pk, user.pk]]
+                )
+                # Hand the freed seat to the head of the waitlist
+                event.promote_waitlist()
+
+        if not removed:
             return Response(
                 {
                     "detail": "You are not registered for this event.",
-                    "participant_count": event.participants.count(),
+                    "participant_count": event.participant_count,
                     "is_participating": False,
-                    "is_full": is_full,
+                    "is_full": event.is_full,
                 },
                 status=status.HTTP_404_NOT_FOUND,
             )
-        event.participants.remove(user)
-        is_full = (
-            event.capacity is not None
-            and event.capacity > 0
-            and event.participants.count() >= event.capacity
-        )
+
+        event.refresh_from_db(fields=["participant_count"])
         return Response(
             {
                 "detail": "Participation removed.",
-                "participant_count": event.participants.count(),
+                "participant_count": event.participant_count,
                 "is_participating": False,
-                "is_full": is_full,
+                "is_full": event.is_full,
             },
             status=status.HTTP_200_OK,
         )
@@ -473,21 +972,33 @@ class InterestEventView(APIView):
         event = get_object_or_404(Event, pk=pk)
         user = request.user
 
-        if event.interested_users.filter(pk=user.pk).exists():
+        # get_or_create() rather than a check and an insert, so that two
+        # concurrent requests cannot both count the same interest
+        with transaction.atomic():
+            _, created = Interest.objects.get_or_create(
+                event_id=event.pk, user_id=user.pk
+            )
+            if created:
+                Event.adjust_counter([event.pk], "interest_count", 1)
+                outbox.record_members(
+                    outbox.MEMBERS_ADDED, "interested_users", [[event.pk, user.pk]]
+                )
+        event.refresh_from_db(fields=["interest_count"])
+
+        if not created:
             return Response(
                 {
                     "detail": "Already marked as interested.",
-                    "interest_count": event.interested_users.count(),
+                    "interest_count": event.interest_count,
                     "is_interested": True,
                 },
                 status=status.HTTP_200_OK,
             )
 
-        event.interested_users.add(user)
         return Response(
             {
                 "detail": "Marked as interested.",
-                "interest_count": event.interested_users.count(),
+                "interest_count": event.interest_count,
                 "is_interested": True,
             },
             status=status.HTTP_201_CREATED,
@@ -498,28 +1009,127 @@ class InterestEventView(APIView):
         event = get_object_or_404(Event, pk=pk)
         user = request.user
 
-        if not event.interested_users.filter(pk=user.pk).exists():
+        with transaction.atomic():
+            removed = Interest.remove(event.pk, user.pk)
+            if removed:
+                outbox.record_members(
+                    outbox.MEMBERS_REMOVED, "interested_users", [[event.pk, user.pk]]
+                )
+
+        if not removed:
             return Response(
                 {
                     "detail": "You are not interested in this event.",
-                    "interest_count": event.interested_users.count(),
+                    "interest_count": event.interest_count,
                     "is_interested": False,
                 },
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        event.interested_users.remove(user)
+        event.refresh_from_db(fields=["interest_count"])
         return Response(
             {
                 "detail": "Interest removed.",
-                "interest_count": event.interested_users.count(),
+                "interest_count": event.interest_count,
                 "is_interested": False,
             },
             status=status.HTTP_200_OK,
         )
 
 
-class MyOrganizedEventsView(generics.ListAPIView):
+class WaitlistEventView(APIView):
+    """
+    Join, inspect or leave the waitlist of a full event. Queued users are
+    registered automatically, and notified, as soon as a seat frees up.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def _state(self, event, entry):
+        return {
+            "on_waitlist": entry is not None,
+            "position": entry.position if entry else None,
+            "waitlist_count": event.waitlist_entries.count(),
+        }
+
+    def get(self, request, pk):
+        event = get_object_or_404(Event, pk=pk)
+        entry = WaitlistEntry.objects.filter(event=event, user=request.user).first()
+        return Response(self._state(event, entry), status=status.HTTP_200_OK)
+
+    def post(self, request, pk):
+        """Join the waitlist, or register directly if a seat is free"""
+        event = get_object_or_404(Event, pk=pk)
+        user = request.user
+        Participant = Event.participants.through
+
+        if Participant.objects.filter(event_id=event.pk, user_id=user.pk).exists():
+            return Response(
+                {"detail": "Already registered.", "is_participating": True},
+                status=status.HTTP_200_OK,
+            )
+
+        with transaction.atomic():
+            if Event.claim_seat(event.pk):
+                _, joined = Participant.objects.get_or_create(
+                    event_id=event.pk, user_id=user.pk
+                )
+                if joined:
+                    # Registered, so no longer queued
+                    WaitlistEntry.objects.filter(
+                        event_id=event.pk, user_id=user.pk
+                    ).delete()
+                    outbox.record_members(
+                        outbox.MEMBERS_ADDED, "participants", [[event.pk, user.pk]]
+                    )
+                else:
+                    # Lost a race against our own duplicate request
+                    Event.adjust_counter([event.pk], "participant_count", -1)
+                entry, created = None, joined
+            else:
+                entry, created = WaitlistEntry.objects.get_or_create(
+                    event=event, user=user
+                )
+
+        if entry is None and not created:
+            return Response(
+                {"detail": "Already registered.", "is_participating": True},
+                status=status.HTTP_200_OK,
+            )
+        if entry is None:
+            return Response(
+                {"detail": "Participation registered.", "is_participating": True},
+                status=status.HTTP_201_CREATED,
+            )
+        return Response(
+            {
+                "detail": (
+                    "Added to the waitlist." if created else "Already on the waitlist."
+                ),
+                "is_participating": False,
+                **self._state(event, entry),
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+    def delete(self, request, pk):
+        """Leave the waitlist"""
+        event = get_object_or_404(Event, pk=pk)
+        removed, _ = WaitlistEntry.objects.filter(
+            event=event, user=request.user
+        ).delete()
+        if not removed:
+            return Response(
+                {"detail": "You are not on the waitlist for this event."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(
+            {"detail": "Removed from the waitlist.", **self._state(event, None)},
+            status=status.HTTP_200_OK,
+        )
+
+
+class MyOrganizedEventsView(EventFilterMixin, generics.ListAPIView):
     """
     Get events organized by the current user:
     - For organization owners: All events for their organizations
@@ -527,13 +1137,11 @@ class MyOrganizedEventsView(generics.ListAPIView):
     Returns events sorted by organization name, then by date.
     """
 
-    serializer_class = EventSerializer
+    serializer_class = EventListSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         """Return events based on user role (owner vs collaborator)"""
-        from django.db.models import Q
-
         from accounts.models import Organization
 
         # Get all organizations owned by the user
@@ -559,11 +1167,13 @@ class MyOrganizedEventsView(generics.ListAPIView):
             )
 
         # Return events matching the query
-        return (
-            Event.objects.filter(query & Q(organization__isnull=False))
-            .select_related("organization", "organizer")
-            .order_by("organization__name", "date")
-        )
+        return with_list_annotations(
+            self.event_filters.apply(
+                Event.objects.filter(query & Q(organization__isnull=False))
+            ),
+            self.request.user,
+            fields=event_fields(self.request, EventListSerializer),
+        ).order_by("organization__name", "date")
 
 
 class EventParticipantsView(generics.ListAPIView):
@@ -616,3 +1226,259 @@ class EventInterestedUsersView(generics.ListAPIView):
             )
 
         return event.interested_users.all().order_by("first_name", "last_name")
+
+
+class EventSeriesListCreateView(generics.ListCreateAPIView):
+    """
+    List active recurring series, or create one for an organization the
+    user owns or collaborates with. Creating a series stores its occurrences
+    up to the horizon as Event rows (see EventSeries), so the event lists
+    show them right away.
+    """
+
+    serializer_class = EventSeriesSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def get_queryset(self):
+        return EventSeries.objects.filter(status="Active").select_related(
+            "organizer", "organization"
+        )
+
+    def perform_create(self, serializer):
+        organization = serializer.validated_data["organization"]
+        user = self.request.user
+        if (
+            organization.owner != user
+            and not organization.collaborators.filter(pk=user.pk).exists()
+        ):
+            raise PermissionDenied(
+                "You can only create events for organizations "
+                "you own or collaborate with."
+            )
+        with transaction.atomic():
+            series = serializer.save(organizer=user)
+            series.materialize_ahead()
+
+
+class EventStatusView(APIView):
+    """
+    ``is_participating``, ``is_interested`` and ``is_full`` for up to
+    ``max_ids`` events given as ``?ids=1,2,3``, keyed by event id. Unknown
+    ids are left out. This is one read of the counters plus one membership
+    query per M2M table, however many ids are asked for.
+    """
+
+    permission_classes = [AllowAny]
+    max_ids = 500
+
+    def get(self, request):
+        ids = _parse_ids(request.query_params.get("ids", ""), self.max_ids)
+        if not ids:
+            raise ValidationError({"ids": ["This query parameter is required."]})
+
+        participating = _member_of(Event.participants.through, request.user, ids)
+        interested = _member_of(Event.interested_users.through, request.user, ids)
+
+        rows = Event.objects.filter(pk__in=ids).values_list(
+            "pk", "capacity", "participant_count"
+        )
+        return Response(
+            {
+                str(pk): {
+                    "is_participating": pk in participating,
+                    "is_interested": pk in interested,
+                    "is_full": bool(capacity) and participant_count >= capacity,
+                }
+                for pk, capacity, participant_count in rows
+            }
+        )
+
+
+class EventChangesView(APIView):
+    """
+    Delta sync: the events created, updated, cancelled or deleted since
+    ``?since=<token>``, for clients that keep a local copy of the events.
+
+    Returns ``{"changed", "deleted", "next", "has_more"}``: changed events in
+    the list shape, ids of deleted events, and the token to pass next time.
+    Without ``since`` every event is returned. Pages hold at most
+    ``page_size`` changed events; keep asking while ``has_more`` is true.
+
+    The position is the ``updated_at`` a change was written with, which is
+    taken before its transaction commits. Changes younger than
+    ``EVENTS_SYNC_SETTLE_SECONDS`` (default 5) are held back to the next
+    sync, so a write whose transaction commits late is not skipped. A write
+    that takes longer than that to commit can still be missed by clients
+    that synced in between, until the event changes again; a full sync
+    (no ``since``) picks it up. Raise the setting if writes run longer. A
+    change may be sent twice; applying it again is harmless.
+    """
+
+    permission_classes = [AllowAny]
+    page_size = 500
+
+    @property
+    def settle(self):
+        return timedelta(seconds=getattr(settings, "EVENTS_SYNC_SETTLE_SECONDS", 5))
+
+    def get(self, request):
+        since = request.query_params.get("since")
+        if since:
+            try:
+                since = decode_sync_token(since)
+            except ValueError:
+                raise ValidationError({"since": ["Invalid sync token."]})
+        until = timezone.now() - self.settle
+
+        events = Event.objects.filter(updated_at__lte=until)
+        if since:
+            # The leading range keeps the predicate sargable on (updated_at, id)
+            moment, pk = since
+            events = events.filter(
+                Q(updated_at__gte=moment) & (Q(updated_at__gt=moment) | Q(pk__gt=pk))
+            )
+        events = with_list_annotations(
+            events,
+            request.user,
+            fields=event_fields(request, EventListSerializer),
+        ).order_by("updated_at", "id")
+        page = list(events[: self.page_size + 1])
+        has_more = len(page) > self.page_size
+        page = page[: self.page_size]
+
+        if has_more:
+            until = page[-1].updated_at
+            token = encode_sync_token(until, page[-1].pk)
+        else:
+            token = encode_sync_token(until, 0)
+
+        deleted = []
+        if since:
+            deleted = list(
+                EventTombstone.objects.filter(
+                    deleted_at__gt=since[0], deleted_at__lte=until
+                ).values_list("event_id", flat=True)
+            )
+
+        serializer = EventListSerializer(page, many=True, context={"request": request})
+        return Response(
+            {
+                "changed": serializer.data,
+                "deleted": deleted,
+                "next": token,
+                "has_more": has_more,
+            }
+        )
+
+
+def _member_of(through, user, ids):
+    """Which of ``ids`` the user has a row for in an Event M2M table."""
+    if not user.is_authenticated:
+        return set()
+    return set(
+        through.objects.filter(user_id=user.pk, event_id__in=ids).values_list(
+            "event_id", flat=True
+        )
+    )
+
+
+def _parse_ids(value, limit):
+    """Parse a comma-separated id list, keeping its order and dropping repeats."""
+    try:
+        ids = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ValidationError({"ids": ["Expected a comma-separated list of ids."]})
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > limit:
+        raise ValidationError({"ids": [f"At most {limit} ids can be requested."]})
+    return ids
+
+
+class EventCalendarView(APIView):
+    """
+    Active events in ``[start, end)``, with the occurrences of recurring
+    series expanded for that window only.
+
+    Occurrences that are not stored yet, those past the horizon of
+    EventSeries.materialize_ahead() that nobody has registered for, are
+    returned with ``id: null`` and their ``series``; register through the
+    series participate endpoint.
+    The window is capped, so the rows touched stay bounded however long the
+    series run.
+    """
+
+    permission_classes = [AllowAny]
+    max_window = timedelta(days=366)
+
+    def get(self, request):
+        start = self._parse(request, "start")
+        end = self._parse(request, "end")
+        if end <= start:
+            raise ValidationError({"end": ["Must be after start."]})
+        if end - start > self.max_window:
+            raise ValidationError(
+                {"end": [f"The window cannot exceed {self.max_window.days} days."]}
+            )
+
+        events = with_list_annotations(
+            Event.objects.filter(
+                status="Active",
+                organization__isnull=False,
+                date__gte=start,
+                date__lt=end,
+            ),
+            request.user,
+            fields=event_fields(request, EventListSerializer),
+        ).order_by("date", "id")
+
+        series = (
+            EventSeries.objects.filter(status="Active", start__lt=end)
+            .filter(Q(until__isnull=True) | Q(until__gte=start))
+            .select_related("organizer", "organization")
+        )
+        # Occurrences already stored as rows, whatever their status
+        materialized = set(
+            Event.objects.filter(
+                series__in=series, date__gte=start, date__lt=end
+            ).values_list("series_id", "date")
+        )
+        occurrences = [
+            item.build_occurrence(date)
+            for item in series
+            for date in item.occurrences(start, end)
+            if (item.pk, date) not in materialized
+        ]
+
+        data = EventListSerializer(events, many=True, context={"request": request}).data
+        data += EventOccurrenceSerializer(occurrences, many=True).data
+        return Response(sorted(data, key=lambda item: item["date"]))
+
+    def _parse(self, request, name):
+        value = request.query_params.get(name)
+        if not value:
+            raise ValidationError({name: ["This query parameter is required."]})
+        return parse_moment(value, name)
+
+
+class SeriesParticipateView(ParticipateEventView):
+    """
+    Register for one occurrence of a series, given its ``date``. This is
+    where an occurrence becomes a real Event row.
+    """
+
+    def post(self, request, pk):
+        series = get_object_or_404(EventSeries, pk=pk, status="Active")
+        value = request.data.get("date")
+        if not value:
+            raise ValidationError({"date": ["This field is required."]})
+        date = parse_moment(value, "date")
+        if date < timezone.now():
+            raise ValidationError({"date": ["This occurrence has already started."]})
+        try:
+            event = series.materialize(date)
+        except ValueError:
+            raise ValidationError({"date": ["Not an occurrence of this series."]})
+
+        response = super().post(request, event.pk)
+        response.data["event_id"] = event.pk
+        return response
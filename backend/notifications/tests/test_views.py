@@ -158,3 +158,24 @@ class NotificationAPITest(APITestCase):
         url = reverse("notification-unread-count")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_list_notifications_conditional_get(self):
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("notification-list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.post(reverse("notification-mark-all-read"))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(all(item["is_read"] for item in response.data))
+
+    def test_list_notifications_etag_is_per_user(self):
+        url = reverse("notification-list")
+        self.client.force_authenticate(user=self.user1)
+        etag = self.client.get(url)["ETag"]
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -1,3 +1,7 @@
+import hashlib
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -12,6 +16,17 @@ class IsOwnerNotificationMixin:
         return Notification.objects.filter(user=self.request.user)
 
 
+def notification_list_etag(request, *args, **kwargs):
+    """
+    Notifications are only created, deleted or flipped between read and
+    unread, so ids and read flags are enough to tell whether the list changed
+    without loading or serializing titles and messages.
+    """
+    rows = Notification.objects.filter(user=request.user).values_list("id", "is_read")
+    return hashlib.sha1(repr(list(rows)).encode()).hexdigest()
+
+
+@method_decorator(condition(etag_func=notification_list_etag), name="list")
 class NotificationListView(IsOwnerNotificationMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = NotificationSerializer